@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark: async tool variants over httpx vs the thread-pool executor path.
+
+Starts a mock of the Smartsheet API in a child process (so it does not compete for
+the GIL) that answers every request after a fixed latency, points both clients at it
+with SMARTSHEET_API_BASE, and runs the same batch of concurrent tool calls (get_sheet
+on distinct sheets plus searches) first through run_async() on the tool pool, then
+through run_tool_async(). The cache is cleared between runs, and both runs must
+return identical results. Response parsing and caching still hold the GIL, so larger
+sheets narrow the gap.
+
+Usage:
+    python benchmarks/async_transport.py [--calls 48] [--latency 0.3] [--rows 50]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class MockSmartsheetAPI(ThreadingHTTPServer):
+    """Serves synthetic sheets, listings and search results after a fixed delay."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, sheets: int, rows: int, columns: int, latency: float):
+        super().__init__(("127.0.0.1", 0), MockHandler)
+        self.latency = latency
+        self.requests = multiprocessing.Value("i", 0)
+        self.columns = [
+            {"id": 100 + c, "title": f"Column {c}", "type": "TEXT_NUMBER", "index": c}
+            for c in range(columns)
+        ]
+        self.sheets = {
+            5000 + s: [
+                {
+                    "id": 10_000 * (s + 1) + r,
+                    "rowNumber": r + 1,
+                    "cells": [
+                        {"columnId": 100 + c, "value": f"s{s}r{r}c{c}"} for c in range(columns)
+                    ],
+                }
+                for r in range(rows)
+            ]
+            for s in range(sheets)
+        }
+
+    def respond(self, path: str, query: dict) -> dict | None:
+        parts = path.removeprefix("/2.0/").split("/")
+        if parts == ["sheets"]:
+            return {"data": [{"id": sid, "name": f"Sheet {sid}"} for sid in self.sheets]}
+        if parts[0] == "sheets" and int(parts[1]) in self.sheets:
+            sheet_id = int(parts[1])
+            if parts[2:] == ["version"]:
+                return {"version": 1}
+            rows = self.sheets[sheet_id]
+            page_size = int(query.get("pageSize", len(rows)))
+            page = int(query.get("page", 1))
+            return {
+                "id": sheet_id,
+                "name": f"Sheet {sheet_id}",
+                "version": 1,
+                "totalRowCount": len(rows),
+                "columns": self.columns,
+                "rows": rows[(page - 1) * page_size : page * page_size],
+            }
+        if parts == ["search"]:
+            text = query.get("query", "")
+            return {
+                "totalCount": 2,
+                "results": [{"text": f"{text} {i}", "objectType": "row"} for i in range(2)],
+            }
+        return None
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server: MockSmartsheetAPI = self.server
+        with server.requests.get_lock():
+            server.requests.value += 1
+        time.sleep(server.latency)
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        body = server.respond(url.path, query)
+        status = 200 if body is not None else 404
+        if body is None:
+            body = {"errorCode": 1006, "message": "Not Found"}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(server: MockSmartsheetAPI, ready) -> None:
+    ready.send(server.server_address[1])
+    server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=48, help="concurrent get_sheet calls")
+    parser.add_argument("--searches", type=int, default=16, help="concurrent search calls")
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds per request")
+    args = parser.parse_args()
+
+    server = MockSmartsheetAPI(args.calls, args.rows, args.columns, args.latency)
+    ready, child_end = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve, args=(server, child_end), daemon=True)
+    process.start()
+    os.environ.update(
+        SMARTSHEET_API_BASE=f"http://127.0.0.1:{ready.recv()}/2.0",
+        SMARTSHEET_ACCESS_TOKEN="benchmark",
+        SMARTSHEET_CACHE_DIR=tempfile.mkdtemp(prefix="smartsheet-bench-"),
+        SMARTSHEET_RATE_LIMIT_RPM="0",
+    )
+    import smartsheet_tools as st
+
+    calls = [(st.get_sheet, {"sheet_id": str(sheet_id)}) for sheet_id in server.sheets]
+    calls += [(st.search, {"query": f"term {i}"}) for i in range(args.searches)]
+    print(
+        f"{args.calls} get_sheet + {args.searches} search calls, {args.rows} rows x "
+        f"{args.columns} columns, {args.latency * 1000:.0f} ms per request, "
+        f"{st.TOOL_WORKERS} tool workers\n"
+    )
+
+    async def run(runner) -> tuple[float, list]:
+        st.clear_cache()
+        server.requests.value = 0
+        start = time.perf_counter()
+        results = await asyncio.gather(*(runner(tool, **kwargs) for tool, kwargs in calls))
+        return time.perf_counter() - start, results
+
+    async def executor(tool, **kwargs):
+        return await st.run_async(tool.entrypoint, **kwargs)
+
+    threaded, expected = asyncio.run(run(executor))
+    print(f"executor: {threaded:.2f}s ({server.requests.value} requests)")
+    native, results = asyncio.run(run(st.run_tool_async))
+    print(f"async:    {native:.2f}s ({server.requests.value} requests)")
+
+    assert results == expected, "async results differ from the executor path"
+    assert not any(result.startswith("Error") for result in results), results
+    print(f"\nspeedup: {threaded / native:.2f}x, {len(results)} identical results")
+    process.terminate()
+
+
+if __name__ == "__main__":
+    main()
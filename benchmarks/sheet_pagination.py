@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs parallel page fetch for large sheets.
+
+Serves a synthetic sheet from an in-memory client that sleeps for a fixed latency on
+every request, then downloads it with _fetch_sheet_pages() both ways and checks that
+both produce the same normalized rows. Pages are built up front, so the timings cover
+request latency only; SDK model parsing holds the GIL and does not overlap.
+
+Usage:
+    python benchmarks/sheet_pagination.py [--rows 18000] [--latency 0.4]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from smartsheet.models import Sheet
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import smartsheet_tools as st  # noqa: E402
+
+
+class LatencySheets:
+    """Sheets API stand-in returning pages of a synthetic sheet after a fixed delay."""
+
+    def __init__(self, rows: int, columns: int, latency: float):
+        self.latency = latency
+        self.requests = 0
+        self.pages: dict[tuple, Sheet] = {}
+        self.columns = [
+            {"id": 100 + c, "title": f"Column {c}", "type": "TEXT_NUMBER", "index": c}
+            for c in range(columns)
+        ]
+        self.rows = [
+            {
+                "id": 10_000 + r,
+                "rowNumber": r + 1,
+                "cells": [{"columnId": 100 + c, "value": f"r{r}c{c}"} for c in range(columns)],
+            }
+            for r in range(rows)
+        ]
+
+    def build_page(self, sheet_id, page_size, page) -> Sheet:
+        rows = self.rows
+        if page_size:
+            rows = rows[(page - 1) * page_size : page * page_size]
+        return Sheet(
+            {
+                "id": sheet_id,
+                "name": "Benchmark",
+                "version": 1,
+                "totalRowCount": len(self.rows),
+                "columns": self.columns,
+                "rows": rows,
+            }
+        )
+
+    def get_sheet(self, sheet_id, page_size=None, page=1, **params):
+        self.requests += 1
+        time.sleep(self.latency)
+        return self.pages[sheet_id, page_size, page]
+
+
+class LatencyClient:
+    def __init__(self, rows: int, columns: int, latency: float):
+        self.Sheets = LatencySheets(rows, columns, latency)
+
+
+def run(client: LatencyClient, parallel: bool) -> tuple[float, dict]:
+    client.Sheets.requests = 0
+    start = time.perf_counter()
+    pages = st._fetch_sheet_pages(client, 1, parallel=parallel)
+    elapsed = time.perf_counter() - start
+    return elapsed, st._normalize_sheet(pages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=18_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.4, help="seconds per request")
+    args = parser.parse_args()
+
+    client = LatencyClient(args.rows, args.columns, args.latency)
+    pages = -(-args.rows // st.SHEET_PAGE_SIZE)
+    for page in range(1, pages + 1):
+        client.Sheets.pages[1, st.SHEET_PAGE_SIZE, page] = client.Sheets.build_page(
+            1, st.SHEET_PAGE_SIZE, page
+        )
+    print(
+        f"{args.rows} rows x {args.columns} columns, {pages} page(s) of {st.SHEET_PAGE_SIZE}, "
+        f"{args.latency * 1000:.0f} ms per request, {st.SHEET_PAGE_WORKERS} page workers\n"
+    )
+
+    sequential, expected = run(client, parallel=False)
+    print(f"sequential: {sequential:.2f}s ({client.Sheets.requests} requests)")
+    parallel, data = run(client, parallel=True)
+    print(f"parallel:   {parallel:.2f}s ({client.Sheets.requests} requests)")
+
+    assert data["rows"] == expected["rows"] and len(data["rows"]) == args.rows
+    print(f"\nspeedup: {sequential / parallel:.2f}x, {len(data['rows'])} rows stitched")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory and time of the SDK sheet parse vs the streaming parse.
+
+Serves one large synthetic sheet from a mock API in a child process and downloads it
+into the compact form of the shared sheet store three ways: through the SDK's Sheet
+model (_compact_sheet), streamed on the SDK client's session (_stream_sheet_page), and
+streamed on the async client (get_sheet_page). Peak Python heap use is measured with
+tracemalloc in a separate pass from the timings, and all three results must match.
+
+Usage:
+    python benchmarks/sheet_parse_memory.py [--rows 20000] [--columns 12]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SHEET_ID = 4242
+
+
+def build_sheet(rows: int, columns: int) -> bytes:
+    """Build the JSON body of a sheet shaped like a GET /sheets/{id} response."""
+    sheet = {
+        "id": SHEET_ID,
+        "name": "Benchmark",
+        "version": 1,
+        "totalRowCount": rows,
+        "accessLevel": "OWNER",
+        "columns": [
+            {"id": 100 + c, "index": c, "title": f"Column {c}", "type": "TEXT_NUMBER"}
+            for c in range(columns)
+        ],
+        "rows": [
+            {
+                "id": 10_000 + r,
+                "rowNumber": r + 1,
+                "expanded": True,
+                "createdAt": "2024-01-01T00:00:00Z",
+                "modifiedAt": "2024-01-02T00:00:00Z",
+                "cells": [
+                    {"columnId": 100 + c, "value": r * c, "displayValue": f"{r * c:,}"}
+                    for c in range(columns)
+                ],
+            }
+            for r in range(rows)
+        ],
+    }
+    return json.dumps(sheet).encode()
+
+
+class SheetHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.server.body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(rows: int, columns: int, ready) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SheetHandler)
+    server.body = build_sheet(rows, columns)
+    ready.send((server.server_address[1], len(server.body)))
+    server.serve_forever()
+
+
+def measure(fetch) -> tuple[float, float, dict]:
+    """Run fetch() untraced for its time, then traced for its peak heap use (MB)."""
+    start = time.perf_counter()
+    data = fetch()
+    elapsed = time.perf_counter() - start
+    del data
+    tracemalloc.start()
+    data = fetch()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--columns", type=int, default=12)
+    args = parser.parse_args()
+
+    ready, child_end = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=serve, args=(args.rows, args.columns, child_end), daemon=True
+    )
+    process.start()
+    port, size = ready.recv()
+    api_base = f"http://127.0.0.1:{port}/2.0"
+    os.environ.update(
+        SMARTSHEET_API_BASE=api_base,
+        SMARTSHEET_ACCESS_TOKEN="benchmark",
+        SMARTSHEET_CACHE_DIR=tempfile.mkdtemp(prefix="smartsheet-bench-"),
+        SMARTSHEET_RATE_LIMIT_RPM="0",
+    )
+    import smartsheet_tools as st
+
+    client = st.get_smartsheet_client()
+    print(f"{args.rows} rows x {args.columns} columns, {size / 1e6:.1f} MB of JSON\n")
+
+    def fetch_async() -> dict:
+        async def fetch() -> dict:
+            async_client = st.AsyncSmartsheetClient("benchmark", api_base=api_base)
+            try:
+                return await async_client.get_sheet_page(SHEET_ID)
+            finally:
+                await async_client.aclose()
+
+        return asyncio.run(fetch())
+
+    runs = {
+        "SDK model": lambda: st._compact_sheet(client.Sheets.get_sheet(SHEET_ID)),
+        "streamed": lambda: st._stream_sheet_page(client, SHEET_ID),
+        "streamed (async)": fetch_async,
+    }
+    results = {}
+    for name, fetch in runs.items():
+        elapsed, peak, results[name] = measure(fetch)
+        print(f"{name:<17} {elapsed:6.2f}s  peak {peak:7.1f} MB")
+
+    expected = results.pop("SDK model")
+    assert all(data == expected for data in results.values()), "streamed rows differ"
+    assert len(expected["rows"]) == args.rows
+    print(f"\n{len(expected['rows'])} identical rows from each path")
+    process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -56,7 +56,10 @@ except ImportError:
 
 from smartsheet_tools import (
     SMARTSHEET_TOOLS,
+    dump_cache_stats,
     get_cache_stats,
+    invalidate_cache,
+    warm_cache,
 )
 from smartsheet_tools import (
     clear_cache as clear_smartsheet_cache,
@@ -147,8 +150,8 @@ SLASH_COMMANDS = {
     "/summary": "Get summary stats for a sheet (e.g., /summary SheetName)",
     "/columns": "Show column metadata for a sheet (e.g., /columns SheetName)",
     "/search": "Search across all sheets (e.g., /search keyword)",
-    "/refresh": "Clear Smartsheet cache (force fresh data on next request)",
-    "/cache": "Show cache statistics (L1 memory, L2 disk)",
+    "/refresh": "Clear Smartsheet cache, or one sheet's entries (e.g., /refresh SheetName)",
+    "/cache": "Show cache statistics (add 'json' for a machine-readable dump)",
     "/quit": "Exit the application",
 }
 
@@ -527,13 +530,61 @@ def interactive_mode() -> None:
                 print("\n✅ Smartsheet cache cleared. Next request will fetch fresh data.")
                 continue
 
+            if user_input.lower().startswith("/refresh "):
+                sheet_name = user_input[9:].strip()
+                removed = invalidate_cache(sheet_id=sheet_name)
+                print(f"\n✅ Dropped {removed} cached entries for '{sheet_name}'.")
+                continue
+
+            if user_input.lower() == "/cache json":
+                print(dump_cache_stats())
+                continue
+
             if user_input.lower() == "/cache":
                 stats = get_cache_stats()
+                totals = stats["totals"]
+                hit_rate = totals["hit_rate"]
                 print("\n📊 Cache Statistics")
                 print("-" * 40)
                 print(f"  L1 (Memory): {stats['l1_entries']}/{stats['l1_max']} entries")
-                print(f"  L2 (Disk):   {stats['l2_entries']} entries")
-                print("\n💡 Use /refresh to clear cache and fetch fresh data.")
+                print(
+                    f"               {stats['l1_bytes'] / 1024:.0f} KB used, "
+                    f"{stats['l1_evictions_by_count'] + stats['l1_evictions_by_size']} evictions"
+                )
+                print(f"  L2 (Disk):   {stats['l2_entries']} entries ({stats['l2_backend']})")
+                print(f"  Coalesced:   {stats['inflight_coalesced']} shared misses")
+                print(
+                    f"  Hit rate:    {f'{hit_rate:.0%}' if hit_rate is not None else 'n/a'} "
+                    f"({totals['l1_hits']} L1, {totals['l2_hits']} L2, "
+                    f"{totals['revalidated']} revalidated, {totals['misses']} misses)"
+                )
+                reuse = stats["client_connection_reuse_rate"]
+                print(
+                    f"  Connections: {stats['client_connections_opened']} opened for "
+                    f"{stats['client_requests']} requests "
+                    f"({f'{reuse:.0%}' if reuse is not None else 'n/a'} reused)"
+                )
+                avg_wait = stats["rate_limit_avg_wait_ms"]
+                print(
+                    f"  Throttling:  {stats['rate_limit_queue_waits']} queued requests, "
+                    f"avg wait {avg_wait if avg_wait is not None else 0} ms, "
+                    f"{stats['rate_limit_throttled']} rate-limit (429) responses"
+                )
+                if stats["tools"]:
+                    print(
+                        f"\n  {'Tool':<24} {'Hits':>5} {'L1':>5} {'L2':>5} {'Miss':>5} "
+                        f"{'Fetch ms':>9} {'KB':>7}"
+                    )
+                    for name, tool_stats in stats["tools"].items():
+                        avg_fetch = tool_stats.get("avg_fetch_ms")
+                        print(
+                            f"  {name:<24} {tool_stats.get('hits', 0):>5} "
+                            f"{tool_stats.get('l1_hits', 0):>5} {tool_stats.get('l2_hits', 0):>5} "
+                            f"{tool_stats.get('misses', 0):>5} "
+                            f"{avg_fetch if avg_fetch is not None else '-':>9} "
+                            f"{tool_stats.get('l1_bytes', 0) / 1024:>7.1f}"
+                        )
+                print("\n💡 Use /refresh to clear cache, /cache json for a full dump.")
                 continue
 
             if user_input.lower() == "/sheets":
@@ -606,13 +657,39 @@ def interactive_mode() -> None:
             break
 
 
+def warm_up() -> None:
+    """Prefetch the allowlisted sheets into the cache and report what was loaded."""
+    if not os.getenv("ALLOWED_SHEET_IDS") and not os.getenv("ALLOWED_SHEET_NAMES"):
+        print("⚠️  --warm needs ALLOWED_SHEET_IDS or ALLOWED_SHEET_NAMES; skipping warm-up.")
+        return
+
+    print("🔥 Warming Smartsheet cache...")
+    try:
+        summary = warm_cache()
+    except Exception as e:
+        print(f"⚠️  Cache warm-up failed: {e}")
+        return
+
+    print(
+        f"✅ Warmed {summary['sheets']} sheets ({summary['rows']} rows, "
+        f"{summary['bytes'] / 1024:.0f} KB) in {summary['seconds']:.2f}s"
+    )
+    for sheet, error in summary["errors"].items():
+        print(f"   ⚠️  {sheet}: {error}")
+
+
 def main() -> None:
     """Main entry point."""
     import sys
 
-    if len(sys.argv) > 1:
+    args = sys.argv[1:]
+    if "--warm" in args:
+        args = [arg for arg in args if arg != "--warm"]
+        warm_up()
+
+    if args:
         # Run with command-line prompt
-        user_prompt = " ".join(sys.argv[1:])
+        user_prompt = " ".join(args)
         run_agent(user_prompt)
     else:
         # Run in interactive mode
@@ -4,14 +4,14 @@ Optimized Smartsheet tools for SmartSheetBot.
 
 This module provides READ-ONLY tools for interacting with Smartsheet data.
 Optimizations include:
-- Agno @tool decorator with cache_results for automatic caching
-- Multi-level caching (L1 memory + L2 disk)
-- Async tool execution support
-- Rate limiting with exponential backoff
+- Multi-level caching (L1 memory + L2 disk) via @cached_tool
+- Asyncio-native tool variants over httpx (SMARTSHEET_TOOLS_ASYNC)
+- Process-wide token-bucket rate limiting that honors Retry-After
 - Pagination optimization
+- Streaming parse of sheet responses into the compact row form
 
-CONSOLIDATED TOOLS (31 total):
-    Core (5): list_sheets, get_sheet, get_row, filter_rows, count_rows_by_column
+CONSOLIDATED TOOLS (32 total):
+    Core (6): list_sheets, get_sheet, get_row, get_rows, filter_rows, count_rows_by_column
     Fuzzy Search (2): find_sheets, find_columns - search by partial/approximate names
     Smart Query Planning (1): analyze_sheet - efficient multi-operation analysis
     Unified Resource (7): workspace, folder, sight, report, webhook, group, user
@@ -26,20 +26,57 @@ CONSOLIDATED TOOLS (31 total):
 """
 
 import asyncio
+import codecs
+import difflib
 import hashlib
+import inspect
 import json
+import logging
 import os
 import pickle
+import random
+import re
+import sqlite3
+import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
-from functools import lru_cache, wraps
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial, wraps
+from itertools import islice
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, get_type_hints
 
+import httpx
+import requests
 import smartsheet
 from agno.tools import tool
+from smartsheet.exceptions import HttpError, UnexpectedRequestError
+from smartsheet.smartsheet import AbstractUserCalcBackoff, OperationErrorResult
+
+# Advisory file locks for cross-process single-flight (POSIX only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Optional zstandard codec for L2 compression - falls back to zlib if not installed
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # MULTI-LEVEL CACHING CONFIGURATION
@@ -50,17 +87,501 @@ CACHE_TTL_L1 = int(os.getenv("SMARTSHEET_CACHE_TTL_L1", "60"))  # L1: 1 minute (
 CACHE_TTL_L2 = int(os.getenv("SMARTSHEET_CACHE_TTL_L2", "300"))  # L2: 5 minutes (disk)
 CACHE_DIR = Path(os.getenv("SMARTSHEET_CACHE_DIR", "tmp/cache"))
 MAX_L1_ENTRIES = int(os.getenv("SMARTSHEET_CACHE_MAX_L1", "100"))
+MAX_L1_BYTES = int(os.getenv("SMARTSHEET_CACHE_MAX_L1_BYTES", str(64 * 1024 * 1024)))  # 64 MB
+# How long version-tagged L2 entries are kept for revalidation after their TTL (1 day)
+CACHE_REVALIDATE_WINDOW = int(os.getenv("SMARTSHEET_CACHE_REVALIDATE_WINDOW", "86400"))
+# Stale-while-revalidate: serve expired entries immediately and refresh in the background
+CACHE_SWR_ENABLED = os.getenv("SMARTSHEET_CACHE_SWR", "false").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+)
+CACHE_SWR_MAX_STALE = int(os.getenv("SMARTSHEET_CACHE_SWR_MAX_STALE", "600"))  # 10 minutes
+# Incremental sheet sync: update cached sheets with only the rows modified since the last sync
+SHEET_REPLICA_ENABLED = os.getenv("SMARTSHEET_SHEET_REPLICA", "true").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# L2 storage: "sqlite" (single file, indexed expiry) or "pickle" (one file per entry)
+CACHE_L2_BACKEND = os.getenv("SMARTSHEET_CACHE_L2_BACKEND", "sqlite").strip().lower()
+# L2 compression: "auto" (zstd if installed, else zlib), "zstd", "zlib" or "none"
+CACHE_COMPRESSION = os.getenv("SMARTSHEET_CACHE_COMPRESSION", "auto").strip().lower()
+# L2 payloads smaller than this are stored uncompressed
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("SMARTSHEET_CACHE_COMPRESS_MIN_BYTES", "4096"))
+# How long the sheet listing behind name resolution is trusted (5 minutes)
+SHEET_INDEX_TTL = int(os.getenv("SMARTSHEET_SHEET_INDEX_TTL", "300"))
+# Max seconds to wait for another process loading the same key before fetching anyway
+CACHE_LOCK_TIMEOUT = float(os.getenv("SMARTSHEET_CACHE_LOCK_TIMEOUT", "30"))
 
 # Ensure cache directory exists
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Items sized per container by _estimate_size(); longer containers are extrapolated
+SIZE_SAMPLE = 32
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Approximate the memory footprint of a cached value in bytes.
+
+    Lists, tuples, sets and dicts are walked, but only SIZE_SAMPLE of their items are
+    sized and the rest extrapolated, so sizing a whole cached sheet costs about as
+    much as sizing a few of its rows. Other objects count their shallow size.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = [*islice(value.items(), SIZE_SAMPLE)]
+        sampled = sum(_estimate_size(k) + _estimate_size(v) for k, v in items)
+    elif isinstance(value, (list, tuple)):
+        items = value[:: max(1, len(value) // SIZE_SAMPLE)]
+        sampled = sum(_estimate_size(item) for item in items)
+    elif isinstance(value, (set, frozenset)):
+        items = [*islice(value, SIZE_SAMPLE)]
+        sampled = sum(_estimate_size(item) for item in items)
+    else:
+        return size
+    if items:
+        size += sampled * len(value) // len(items)
+    return size
+
+
+class L2Codec:
+    """
+    Serializes L2 records, compressing payloads of at least min_bytes.
+
+    Compressed payloads start with a one-byte codec tag (b"Z" zlib, b"S" zstd).
+    Uncompressed payloads are plain pickles, which always start with the pickle PROTO
+    opcode, so entries written before compression was enabled still decode.
+    """
+
+    ZLIB_TAG = b"Z"
+    ZSTD_TAG = b"S"
+
+    def __init__(self, codec: str = CACHE_COMPRESSION, min_bytes: int = CACHE_COMPRESS_MIN_BYTES):
+        if codec == "auto":
+            codec = "zstd" if ZSTD_AVAILABLE else "zlib"
+        if codec == "zstd" and not ZSTD_AVAILABLE:
+            codec = "zlib"
+        self.codec = codec
+        self.min_bytes = min_bytes
+        self._lock = threading.Lock()
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+        self._compressed_writes = 0
+        self._raw_writes = 0
+
+    def encode(self, record: dict) -> bytes:
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        encoded = payload
+        if self.codec != "none" and len(payload) >= self.min_bytes:
+            if self.codec == "zstd":
+                encoded = self.ZSTD_TAG + zstandard.ZstdCompressor(level=3).compress(payload)
+            else:
+                encoded = self.ZLIB_TAG + zlib.compress(payload, 6)
+            if len(encoded) >= len(payload):
+                encoded = payload  # Incompressible; not worth the decode cost
+        with self._lock:
+            self._raw_bytes += len(payload)
+            self._stored_bytes += len(encoded)
+            if encoded is payload:
+                self._raw_writes += 1
+            else:
+                self._compressed_writes += 1
+        return encoded
+
+    def decode(self, data: bytes) -> dict:
+        """Decode a stored payload. Raises ValueError if it cannot be decompressed."""
+        tag = data[:1]
+        if tag == self.ZSTD_TAG and not ZSTD_AVAILABLE:
+            raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+        try:
+            if tag == self.ZLIB_TAG:
+                data = zlib.decompress(data[1:])
+            elif tag == self.ZSTD_TAG:
+                data = zstandard.ZstdDecompressor().decompress(data[1:])
+        except Exception as e:  # zlib.error / zstandard.ZstdError
+            raise ValueError(f"Corrupt compressed cache entry: {e}") from e
+        return pickle.loads(data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "l2_codec": self.codec,
+                "l2_compressed_writes": self._compressed_writes,
+                "l2_raw_writes": self._raw_writes,
+                "l2_compression_ratio": (
+                    round(self._raw_bytes / self._stored_bytes, 2) if self._stored_bytes else None
+                ),
+            }
+
+
+class PickleL2Backend:
+    """
+    L2 backend storing one pickle file per key in CACHE_DIR.
+
+    Files are written to a temporary name and renamed into place, so processes sharing
+    the directory never read a partially written entry. A file's mtime is the entry's
+    timestamp, so touch() can renew it without rewriting the file.
+    """
+
+    name = "pickle"
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, codec: L2Codec | None = None):
+        self.cache_dir = cache_dir
+        self.codec = codec or L2Codec()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored record for a key, or None if missing, unreadable or expired."""
+        path = self._path(key)
+        try:
+            touched_at = path.stat().st_mtime
+            record = self.codec.decode(path.read_bytes())
+        except (pickle.PickleError, EOFError, ValueError, OSError):
+            return None
+        # Shift the stored times to the last touch(), keeping the entry's retention
+        renewed_by = touched_at - record.get("timestamp", touched_at)
+        record["timestamp"] = touched_at
+        record["expires_at"] = record.get("expires_at", 0) + renewed_by
+        if record["expires_at"] <= time.time():
+            self.delete(key)
+            return None
+        return record
+
+    def set(self, key: str, record: dict) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(self.codec.encode(record))
+            os.utime(tmp_path, (record["timestamp"], record["timestamp"]))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def touch(self, key: str, timestamp: float, expires_at: float) -> bool:
+        """
+        Restart an entry's retention from timestamp without rewriting it. The file keeps
+        the retention it was written with, so expires_at is not used. False if the entry
+        is gone.
+        """
+        try:
+            os.utime(self._path(key), (timestamp, timestamp))
+        except OSError:
+            return False
+        return True
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for cache_file in self.cache_dir.glob("*.pkl"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+
+    def invalidate_tags(self, tags: frozenset[str]) -> frozenset[str]:
+        """
+        Remove entries carrying any of the tags. Returns their keys.
+        Reads every file, so this is O(n).
+        """
+        removed = set()
+        for cache_file in self.cache_dir.glob("*.pkl"):
+            record = self.get(cache_file.stem)
+            if record is not None and tags.intersection(record.get("tags", ())):
+                self.delete(cache_file.stem)
+                removed.add(cache_file.stem)
+        return frozenset(removed)
+
+    def purge_expired(self) -> int:
+        """Remove expired entries. Reads every file, so this is O(n) for this backend."""
+        purged = 0
+        for cache_file in self.cache_dir.glob("*.pkl"):
+            if self.get(cache_file.stem) is None:
+                self.delete(cache_file.stem)
+                purged += 1
+        return purged
+
+    def stats(self) -> dict:
+        return {"entries": len(list(self.cache_dir.glob("*.pkl"))), **self.codec.stats()}
+
+
+class SQLiteL2Backend:
+    """
+    L2 backend storing all entries in a single SQLite file (WAL mode).
+
+    Entries are indexed by key and expiry so expired rows are purged in one statement,
+    and entry/byte totals are maintained by triggers so stats never scan the table.
+    Entry tags live in an indexed side table so invalidating a tag is a single DELETE.
+    """
+
+    name = "sqlite"
+    PURGE_INTERVAL = 60  # seconds between opportunistic bulk purges
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            payload BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_expires_at ON entries (expires_at);
+        CREATE TABLE IF NOT EXISTS totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            entries INTEGER NOT NULL,
+            bytes INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (1, 0, 0);
+        CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+            UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+            UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+            UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 1;
+        END;
+        CREATE TABLE IF NOT EXISTS tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (tag, key)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_tags_key ON tags (key);
+        CREATE TRIGGER IF NOT EXISTS entries_delete_tags AFTER DELETE ON entries BEGIN
+            DELETE FROM tags WHERE key = OLD.key;
+        END;
+    """
+
+    def __init__(self, db_path: Path = CACHE_DIR / "cache.sqlite3", codec: L2Codec | None = None):
+        self.db_path = db_path
+        self.codec = codec or L2Codec()
+        self._local = threading.local()
+        self._last_purge = 0.0
+        conn = self._conn()
+        conn.executescript(self._SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection (sqlite3 connections are not shared across threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored record for a key, or None if missing, unreadable or expired."""
+        row = (
+            self._conn()
+            .execute(
+                "SELECT payload, created_at, expires_at FROM entries "
+                "WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            record = self.codec.decode(row[0])
+        except (pickle.PickleError, EOFError, ValueError):
+            self.delete(key)
+            return None
+        # The row's times are authoritative: touch() updates them without the payload
+        record["timestamp"], record["expires_at"] = row[1], row[2]
+        return record
+
+    def set(self, key: str, record: dict) -> None:
+        payload = self.codec.encode(record)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO entries (key, payload, size, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET payload = excluded.payload, size = excluded.size, "
+                "created_at = excluded.created_at, expires_at = excluded.expires_at",
+                (key, payload, len(payload), record["timestamp"], record["expires_at"]),
+            )
+            conn.execute("DELETE FROM tags WHERE key = ?", (key,))
+            conn.executemany(
+                "INSERT INTO tags (tag, key) VALUES (?, ?)",
+                [(tag, key) for tag in record.get("tags", ())],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if time.time() - self._last_purge > self.PURGE_INTERVAL:
+            self.purge_expired()
+
+    def touch(self, key: str, timestamp: float, expires_at: float) -> bool:
+        """Reset an entry's timestamp and expiry without rewriting it. False if it is gone."""
+        cursor = self._conn().execute(
+            "UPDATE entries SET created_at = ?, expires_at = ? WHERE key = ? AND expires_at > ?",
+            (timestamp, expires_at, key, time.time()),
+        )
+        return cursor.rowcount == 1
+
+    def delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM entries")
+
+    def invalidate_tags(self, tags: frozenset[str]) -> frozenset[str]:
+        """Remove entries carrying any of the tags. Returns their keys."""
+        placeholders = ", ".join("?" * len(tags))
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            keys = frozenset(
+                key
+                for (key,) in conn.execute(
+                    f"SELECT DISTINCT key FROM tags WHERE tag IN ({placeholders})", tuple(tags)
+                )
+            )
+            conn.execute(
+                f"DELETE FROM entries WHERE key IN "
+                f"(SELECT key FROM tags WHERE tag IN ({placeholders}))",
+                tuple(tags),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return keys
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries in a single indexed DELETE."""
+        self._last_purge = time.time()
+        cursor = self._conn().execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        entries, total_bytes = (
+            self._conn().execute("SELECT entries, bytes FROM totals WHERE id = 1").fetchone()
+        )
+        return {"entries": entries, "bytes": total_bytes, **self.codec.stats()}
+
+
+def _create_l2_backend() -> PickleL2Backend | SQLiteL2Backend:
+    """Create the configured L2 backend, falling back to pickle files if SQLite is unusable."""
+    if CACHE_L2_BACKEND == "sqlite":
+        try:
+            return SQLiteL2Backend()
+        except sqlite3.Error:
+            pass
+    return PickleL2Backend()
+
+
+class CacheMetrics:
+    """
+    Per-tool cache counters.
+
+    Events are l1_hits, l2_hits, revalidated (served after a version check),
+    stale_hits (served stale in stale-while-revalidate mode), misses (an upstream
+    fetch was made), coalesced (waited on another caller's fetch), refreshes
+    (background reloads of entries served stale, which are not requests and so do not
+    count towards the hit rate) and evictions (L1 entries dropped to stay in budget).
+    Fetch latency of misses and refreshes is accumulated in fetch_seconds.
+    """
+
+    EVENTS = (
+        "l1_hits",
+        "l2_hits",
+        "revalidated",
+        "stale_hits",
+        "misses",
+        "coalesced",
+        "refreshes",
+        "evictions",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict[str, float]] = {}
+
+    def _counters(self, tool_name: str) -> dict[str, float]:
+        counters = self._tools.get(tool_name)
+        if counters is None:
+            counters = dict.fromkeys(self.EVENTS, 0)
+            counters["fetch_seconds"] = 0.0
+            self._tools[tool_name] = counters
+        return counters
+
+    def record(self, tool_name: str, event: str, amount: int = 1) -> None:
+        """Add amount to one of the EVENTS counters for a tool."""
+        with self._lock:
+            self._counters(tool_name)[event] += amount
+
+    def record_fetch(self, tool_name: str, seconds: float, event: str = "misses") -> None:
+        """Record an upstream fetch (a miss, or a background refresh) and how long it took."""
+        with self._lock:
+            counters = self._counters(tool_name)
+            counters[event] += 1
+            counters["fetch_seconds"] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+    def get_stats(self) -> dict:
+        """Get per-tool counters plus totals, with hit rate and average fetch latency."""
+        with self._lock:
+            tools = {name: dict(counters) for name, counters in self._tools.items()}
+
+        totals = dict.fromkeys(self.EVENTS, 0)
+        totals["fetch_seconds"] = 0.0
+        for counters in tools.values():
+            for name, value in counters.items():
+                totals[name] += value
+
+        for counters in [*tools.values(), totals]:
+            hits = (
+                counters["l1_hits"]
+                + counters["l2_hits"]
+                + counters["revalidated"]
+                + counters["stale_hits"]
+            )
+            requests = hits + counters["misses"] + counters["coalesced"]
+            fetches = counters["misses"] + counters["refreshes"]
+            counters["hits"] = hits
+            counters["hit_rate"] = round(hits / requests, 3) if requests else None
+            counters["avg_fetch_ms"] = (
+                round(counters["fetch_seconds"] * 1000 / fetches, 1) if fetches else None
+            )
+            counters["fetch_seconds"] = round(counters["fetch_seconds"], 3)
+        return {"tools": dict(sorted(tools.items())), "totals": totals}
+
+
 class MultiLevelCache:
     """
     Multi-level cache with L1 (memory) and L2 (disk) tiers.
 
-    L1: Fast in-memory cache with short TTL
+    L1: Fast in-memory LRU cache with short TTL, bounded by entry count and bytes
     L2: Disk-based cache with longer TTL for persistence
+
+    Entries may be tagged with the sheet versions they were built from. Once such an
+    entry is older than its L1 TTL it is not trusted on TTL alone: lookup() reports it
+    as needing validation, and the caller confirms the versions are still current (a cheap
+    request) before reusing it instead of refetching the whole sheet.
+
+    Entries written with stale_retention are kept in L2 past their TTL and reported as
+    "stale", so callers can serve them while refreshing in the background.
+
+    Every entry carries tags ("tool:<name>", "sheet:<id>" and any extras) so that
+    invalidate() can drop just the entries for one tool or sheet.
     """
 
     def __init__(
@@ -68,240 +589,2361 @@ class MultiLevelCache:
         l1_ttl: int = CACHE_TTL_L1,
         l2_ttl: int = CACHE_TTL_L2,
         max_l1_entries: int = MAX_L1_ENTRIES,
+        max_l1_bytes: int = MAX_L1_BYTES,
+        l2_backend: PickleL2Backend | SQLiteL2Backend | None = None,
     ):
         self.l1_ttl = l1_ttl
         self.l2_ttl = l2_ttl
         self.max_l1_entries = max_l1_entries
-        self._l1_cache: dict[str, tuple[Any, float]] = {}
+        self.max_l1_bytes = max_l1_bytes
+        # key -> (value, fresh_until, size, versions, func_name, tags); least to most recently used
+        self._l1_cache: OrderedDict[str, tuple[Any, float, int, dict, str, frozenset]] = (
+            OrderedDict()
+        )
+        self._l1_bytes = 0
+        self._evictions_by_count = 0
+        self._evictions_by_size = 0
+        self._oversize_rejections = 0
         self._lock = threading.Lock()
+        self._l2 = l2_backend or _create_l2_backend()
+        self.metrics = CacheMetrics()
 
     def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """Generate a unique cache key based on function name and arguments."""
-        # Sort kwargs for consistent hashing
-        key_data = json.dumps(
-            {
-                "func": func_name,
-                "args": [str(a) for a in args],
-                "kwargs": {k: str(v) for k, v in sorted(kwargs.items())},
-            },
-            sort_keys=True,
+        # Sort kwargs for consistent hashing; unit/record separators keep fields apart
+        key_data = "\x1e".join(
+            [
+                func_name,
+                "\x1f".join(str(a) for a in args),
+                "\x1f".join(f"{k}={v}" for k, v in sorted(kwargs.items())),
+            ]
         )
-        return hashlib.md5(key_data.encode()).hexdigest()
-
-    def _get_l2_path(self, key: str) -> Path:
-        """Get the disk cache path for a key."""
-        return CACHE_DIR / f"{key}.pkl"
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     def get(self, func_name: str, args: tuple, kwargs: dict) -> tuple[bool, Any]:
         """
         Get value from cache. Checks L1 first, then L2.
-        Returns (hit, value) tuple.
+        Returns (hit, value) tuple. Entries that need version validation are misses.
+        """
+        status, value, _, _ = self.lookup(func_name, args, kwargs)
+        return status == "fresh", value
+
+    def lookup(
+        self, func_name: str, args: tuple, kwargs: dict, use_l2: bool = True
+    ) -> tuple[str | None, Any, dict, float]:
+        """
+        Look up an entry in L1, then (unless use_l2 is False) L2.
+
+        Returns (status, value, versions, stale_for) where status is "fresh" (serve
+        as-is), "validate" (serve only if the sheet versions are still current),
+        "stale" (past its TTL but retained) or None (miss), and stale_for is how many
+        seconds the entry has been past the point where it stopped being fresh.
         """
         key = self._generate_key(func_name, args, kwargs)
 
         # Check L1 (memory)
         with self._lock:
-            if key in self._l1_cache:
-                value, timestamp = self._l1_cache[key]
-                if time.time() - timestamp < self.l1_ttl:
-                    return True, value
-                else:
-                    del self._l1_cache[key]
-
-        # Check L2 (disk)
-        l2_path = self._get_l2_path(key)
-        if l2_path.exists():
-            try:
-                with open(l2_path, "rb") as f:
-                    data = pickle.load(f)
-                if time.time() - data["timestamp"] < self.l2_ttl:
-                    # Promote to L1
-                    self._set_l1(key, data["value"])
-                    return True, data["value"]
-                else:
-                    l2_path.unlink()  # Remove expired
-            except (pickle.PickleError, KeyError, OSError):
-                pass
+            entry = self._l1_cache.get(key)
+            if entry is not None:
+                value, fresh_until, size, versions, _, _ = entry
+                if time.time() < fresh_until:
+                    self._l1_cache.move_to_end(key)
+                    self.metrics.record(func_name, "l1_hits")
+                    return "fresh", value, versions, 0.0
+                del self._l1_cache[key]
+                self._l1_bytes -= size
+        if not use_l2:
+            return None, None, {}, 0.0
+
+        # Check L2 (disk); the backend drops entries past their retention
+        try:
+            data = self._l2.get(key)
+        except (sqlite3.Error, OSError):
+            data = None
+        if data is not None:
+            age = time.time() - data["timestamp"]
+            versions = data.get("versions") or {}
+            l1_ttl = data.get("l1_ttl", self.l1_ttl)
+            l2_ttl = data.get("l2_ttl", self.l2_ttl)
+            if versions and age >= l1_ttl:
+                return "validate", data["value"], versions, age - l1_ttl
+            if age >= l2_ttl:
+                return "stale", data["value"], versions, age - l2_ttl
+            # Promote to L1; a version-tagged entry (e.g. just written by another
+            # process) is trusted only for the rest of its L1 TTL
+            self._set_l1(
+                key,
+                func_name,
+                data["value"],
+                versions,
+                ttl=l1_ttl - age if versions else l1_ttl,
+                tags=data.get("tags"),
+            )
+            self.metrics.record(func_name, "l2_hits")
+            return "fresh", data["value"], versions, 0.0
 
-        return False, None
+        return None, None, {}, 0.0
 
-    def _set_l1(self, key: str, value: Any):
-        """Set value in L1 cache with LRU eviction."""
+    def peek(self, func_name: str, args: tuple, kwargs: dict) -> Any:
+        """
+        Get an entry's value from L1 or L2 whatever its age, without promoting it or
+        counting a hit. Returns None if the entry is not held at all.
+        """
+        key = self._generate_key(func_name, args, kwargs)
         with self._lock:
-            # LRU eviction if at capacity
-            if len(self._l1_cache) >= self.max_l1_entries:
-                # Remove oldest entry
-                oldest_key = min(self._l1_cache, key=lambda k: self._l1_cache[k][1])
-                del self._l1_cache[oldest_key]
+            entry = self._l1_cache.get(key)
+            if entry is not None:
+                return entry[0]
+        try:
+            data = self._l2.get(key)
+        except (sqlite3.Error, OSError):
+            return None
+        return None if data is None else data["value"]
+
+    def _set_l1(
+        self,
+        key: str,
+        func_name: str,
+        value: Any,
+        versions: dict | None = None,
+        ttl: int | None = None,
+        tags: frozenset | None = None,
+    ):
+        """Set value in L1 cache, evicting least recently used entries to stay in budget."""
+        size = _estimate_size(value)
 
-            self._l1_cache[key] = (value, time.time())
+        with self._lock:
+            previous = self._l1_cache.pop(key, None)
+            if previous is not None:
+                self._l1_bytes -= previous[2]
+
+            # A single value larger than the whole budget would flush everything else
+            if size > self.max_l1_bytes:
+                self._oversize_rejections += 1
+                return
+
+            while self._l1_cache and len(self._l1_cache) >= self.max_l1_entries:
+                _, (_, _, evicted_size, _, evicted_func, _) = self._l1_cache.popitem(last=False)
+                self._l1_bytes -= evicted_size
+                self._evictions_by_count += 1
+                self.metrics.record(evicted_func, "evictions")
+
+            while self._l1_cache and self._l1_bytes + size > self.max_l1_bytes:
+                _, (_, _, evicted_size, _, evicted_func, _) = self._l1_cache.popitem(last=False)
+                self._l1_bytes -= evicted_size
+                self._evictions_by_size += 1
+                self.metrics.record(evicted_func, "evictions")
+
+            ttl = self.l1_ttl if ttl is None else ttl
+            self._l1_cache[key] = (
+                value,
+                time.time() + ttl,
+                size,
+                versions or {},
+                func_name,
+                frozenset(tags or ()),
+            )
+            self._l1_bytes += size
 
-    def set(self, func_name: str, args: tuple, kwargs: dict, value: Any):
-        """Set value in both L1 and L2 caches."""
+    def set(
+        self,
+        func_name: str,
+        args: tuple,
+        kwargs: dict,
+        value: Any,
+        versions: dict | None = None,
+        stale_retention: int = 0,
+        l1_ttl: int | None = None,
+        l2_ttl: int | None = None,
+        use_l2: bool = True,
+        tags: frozenset[str] | None = None,
+    ):
+        """
+        Set value in L1 and (unless use_l2 is False) L2.
+
+        Args:
+            versions: Optional {sheet_id: version} the value was built from.
+            tags: Extra invalidation tags; "tool:<func_name>" and "sheet:<id>" for
+                each versioned sheet are always added.
+            stale_retention: Seconds to keep the entry in L2 past its TTL for
+                stale-while-revalidate.
+            l1_ttl: Per-entry L1 TTL (defaults to the cache's l1_ttl).
+            l2_ttl: Per-entry L2 TTL (defaults to the cache's l2_ttl).
+            use_l2: Whether to persist the entry to L2 at all.
+        """
         key = self._generate_key(func_name, args, kwargs)
+        l1_ttl = self.l1_ttl if l1_ttl is None else l1_ttl
+        l2_ttl = self.l2_ttl if l2_ttl is None else l2_ttl
+        tags = self._entry_tags(func_name, versions, tags)
 
         # Set in L1
-        self._set_l1(key, value)
+        self._set_l1(key, func_name, value, versions, ttl=l1_ttl, tags=tags)
+
+        if not use_l2:
+            return
 
         # Set in L2 (disk)
+        now = time.time()
+        retention = self._l2_retention(l2_ttl, versions, stale_retention)
         try:
-            l2_path = self._get_l2_path(key)
-            with open(l2_path, "wb") as f:
-                pickle.dump({"value": value, "timestamp": time.time()}, f)
-        except (pickle.PickleError, OSError):
+            self._l2.set(
+                key,
+                {
+                    "value": value,
+                    "timestamp": now,
+                    "versions": versions,
+                    "l1_ttl": l1_ttl,
+                    "l2_ttl": l2_ttl,
+                    "tags": sorted(tags),
+                    "expires_at": now + retention,
+                },
+            )
+        except (pickle.PickleError, sqlite3.Error, OSError):
             pass  # Fail silently for disk cache
 
+    def renew(
+        self,
+        func_name: str,
+        args: tuple,
+        kwargs: dict,
+        value: Any,
+        versions: dict | None = None,
+        stale_retention: int = 0,
+        l1_ttl: int | None = None,
+        l2_ttl: int | None = None,
+        use_l2: bool = True,
+        tags: frozenset[str] | None = None,
+    ):
+        """
+        Restart the TTLs of an entry whose value is unchanged (e.g. its sheet versions
+        were just confirmed). Takes the same arguments as set(), but the L2 copy only has
+        its timestamps updated instead of being serialized and written again; if it is
+        gone, the entry is set() in full.
+        """
+        key = self._generate_key(func_name, args, kwargs)
+        if use_l2:
+            now = time.time()
+            retention = self._l2_retention(
+                self.l2_ttl if l2_ttl is None else l2_ttl, versions, stale_retention
+            )
+            try:
+                renewed = self._l2.touch(key, now, now + retention)
+            except (sqlite3.Error, OSError):
+                renewed = False
+            if not renewed:
+                self.set(
+                    func_name,
+                    args,
+                    kwargs,
+                    value,
+                    versions=versions,
+                    stale_retention=stale_retention,
+                    l1_ttl=l1_ttl,
+                    l2_ttl=l2_ttl,
+                    tags=tags,
+                )
+                return
+        l1_ttl = self.l1_ttl if l1_ttl is None else l1_ttl
+        tags = self._entry_tags(func_name, versions, tags)
+        self._set_l1(key, func_name, value, versions, ttl=l1_ttl, tags=tags)
+
+    @staticmethod
+    def _entry_tags(func_name: str, versions: dict | None, tags: frozenset | None) -> frozenset:
+        """Get an entry's tags: "tool:<func_name>", "sheet:<id>" per versioned sheet, extras."""
+        return frozenset(
+            {
+                f"tool:{func_name}",
+                *(f"sheet:{sheet_id}" for sheet_id in versions or ()),
+                *(tags or ()),
+            }
+        )
+
+    @staticmethod
+    def _l2_retention(l2_ttl: int, versions: dict | None, stale_retention: int) -> float:
+        """Seconds to keep an entry in L2: tagged or stale-servable entries outlive the TTL."""
+        return l2_ttl + max(CACHE_REVALIDATE_WINDOW if versions else 0, stale_retention)
+
     def clear(self):
         """Clear all caches."""
         with self._lock:
             self._l1_cache.clear()
+            self._l1_bytes = 0
 
         # Clear L2
-        for cache_file in CACHE_DIR.glob("*.pkl"):
-            try:
-                cache_file.unlink()
-            except OSError:
-                pass
+        try:
+            self._l2.clear()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def invalidate(self, tags: frozenset[str]) -> int:
+        """
+        Remove entries carrying any of the tags from L1 and L2. Returns the number of
+        distinct entries removed (an entry held in both tiers counts once).
+        """
+        with self._lock:
+            stale_keys = {key for key, entry in self._l1_cache.items() if tags & entry[5]}
+            for key in stale_keys:
+                self._l1_bytes -= self._l1_cache.pop(key)[2]
+        try:
+            removed_l2 = self._l2.invalidate_tags(tags)
+        except (sqlite3.Error, OSError):
+            removed_l2 = frozenset()
+        return len(stale_keys | removed_l2)
+
+    def purge_expired(self) -> int:
+        """Remove expired L2 entries. Returns the number of entries removed."""
+        try:
+            return self._l2.purge_expired()
+        except (sqlite3.Error, OSError):
+            return 0
 
     def get_stats(self) -> dict:
-        """Get cache statistics."""
-        l2_count = len(list(CACHE_DIR.glob("*.pkl")))
+        """Get cache statistics, including per-tool counters and L1 usage under "tools"."""
+        try:
+            l2_stats = self._l2.stats()
+        except (sqlite3.Error, OSError):
+            l2_stats = {"entries": 0}
+        metrics = self.metrics.get_stats()
         with self._lock:
-            l1_count = len(self._l1_cache)
-        return {"l1_entries": l1_count, "l2_entries": l2_count, "l1_max": self.max_l1_entries}
+            for _, _, size, _, func_name, _ in self._l1_cache.values():
+                tool_stats = metrics["tools"].setdefault(func_name, {})
+                tool_stats["l1_entries"] = tool_stats.get("l1_entries", 0) + 1
+                tool_stats["l1_bytes"] = tool_stats.get("l1_bytes", 0) + size
+            return {
+                "tools": metrics["tools"],
+                "totals": metrics["totals"],
+                "l1_entries": len(self._l1_cache),
+                "l2_entries": l2_stats["entries"],
+                "l2_bytes": l2_stats.get("bytes"),
+                "l2_backend": self._l2.name,
+                "l2_codec": l2_stats.get("l2_codec"),
+                "l2_compression_ratio": l2_stats.get("l2_compression_ratio"),
+                "l2_compressed_writes": l2_stats.get("l2_compressed_writes", 0),
+                "l2_raw_writes": l2_stats.get("l2_raw_writes", 0),
+                "l1_max": self.max_l1_entries,
+                "l1_bytes": self._l1_bytes,
+                "l1_max_bytes": self.max_l1_bytes,
+                "l1_evictions_by_count": self._evictions_by_count,
+                "l1_evictions_by_size": self._evictions_by_size,
+                "l1_oversize_rejections": self._oversize_rejections,
+            }
 
 
 # Global cache instance
 _cache = MultiLevelCache()
 
 
-def cached_tool(func):
+class SingleFlight:
     """
-    Decorator that adds multi-level caching to a tool function.
-    Works alongside Agno's @tool decorator.
+    Per-key in-flight deduplication.
+
+    Concurrent callers asking for the same key while a load is running wait for that
+    load and share its result (or exception) instead of issuing their own request.
+    Waiting is a plain blocking wait, so this works for direct calls, thread pools and
+    run_async() alike.
+
+    With a lock_dir, the leader also holds an advisory lock on lock_dir/<key>.lock
+    while loading, so other processes sharing the L2 cache wait for it and then read
+    its result from L2 (load functions re-check the cache first) instead of fetching.
     """
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Check cache
-        hit, value = _cache.get(func.__name__, args, kwargs)
-        if hit:
-            return value
+    LOCK_FILE_MAX_AGE = 3600  # seconds before an idle lock file is removed
+    LOCK_PURGE_INTERVAL = 600  # seconds between lock file cleanups
+
+    def __init__(self, lock_dir: Path | None = None, lock_timeout: float = CACHE_LOCK_TIMEOUT):
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+        self._leaders = 0
+        self._coalesced = 0
+        self.lock_dir = lock_dir if fcntl is not None else None
+        self.lock_timeout = lock_timeout
+        self._lock_waits = 0
+        self._lock_timeouts = 0
+        self._last_lock_purge = time.time()
+        if self.lock_dir is not None:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _try_lock_file(path: Path) -> int | None:
+        """
+        Open and exclusively lock a lock file without blocking. Returns the locked file
+        descriptor, or None if another holder has it. Raises OSError if it cannot be
+        opened.
+
+        purge_lock_files() may unlink the file between our open() and flock(), after
+        which a new file at the path can be locked by someone else; a lock on an
+        unlinked file is therefore dropped and the caller tries again.
+        """
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        try:
+            opened, current = os.fstat(fd), os.stat(path)
+            if (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino):
+                return fd
+        except FileNotFoundError:
+            pass
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+        return None
+
+    @contextmanager
+    def _process_lock(self, key: str):
+        """Hold the cross-process lock for a key, giving up after lock_timeout seconds."""
+        if self.lock_dir is None:
+            yield
+            return
+        path = self.lock_dir / f"{key}.lock"
+        deadline = time.monotonic() + self.lock_timeout
+        waited = False
+        try:
+            while (fd := self._try_lock_file(path)) is None:
+                waited = True
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
+        except OSError:
+            yield
+            return
+
+        try:
+            with self._lock:
+                self._lock_waits += waited
+                self._lock_timeouts += fd is None
+            if fd is not None:
+                os.utime(fd)  # Keep active lock files out of purge_lock_files()
+            yield
+        finally:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def purge_lock_files(self, max_age: float = LOCK_FILE_MAX_AGE) -> int:
+        """
+        Remove lock files untouched for max_age seconds. Returns the number removed.
+
+        Each file is locked without waiting before it is unlinked, so files in use are
+        kept (_try_lock_file() handles a file unlinked while another process opens it).
+        """
+        self._last_lock_purge = time.time()
+        if self.lock_dir is None:
+            return 0
+        removed = 0
+        cutoff = time.time() - max_age
+        for lock_file in self.lock_dir.glob("*.lock"):
+            try:
+                if lock_file.stat().st_mtime >= cutoff:
+                    continue
+                fd = os.open(lock_file, os.O_RDWR)
+            except OSError:
+                continue
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                lock_file.unlink()  # while still holding the lock
+                removed += 1
+            except OSError:
+                pass  # in use, or already removed
+            finally:
+                os.close(fd)
+        return removed
+
+    def do(self, key: str, fn) -> tuple[Any, bool]:
+        """Run fn() once per key at a time. Returns (result, shared) where shared is True
+        if the result came from another caller's in-flight load."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._claim(key)
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            return future.result(), True
+        return self._lead(key, future, fn), False
+
+    def start(self, key: str, fn, executor: ThreadPoolExecutor) -> bool:
+        """
+        Run fn() for the key on executor unless a load for it is already in flight.
+        Returns whether a load was started; callers joining it later share its result.
+        """
+        with self._lock:
+            if key in self._calls:
+                return False
+            future = self._claim(key)
+        try:
+            executor.submit(self._lead, key, future, fn)
+        except RuntimeError as e:  # executor shut down
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            return False
+        return True
+
+    def _claim(self, key: str) -> Future:
+        """Register this caller as the leader for a key. Call with _lock held."""
+        future = Future()
+        self._calls[key] = future
+        self._leaders += 1
+        return future
+
+    def _lead(self, key: str, future: Future, fn) -> Any:
+        """Run a claimed load and hand its result (or exception) to the callers sharing it."""
+        if time.time() - self._last_lock_purge > self.LOCK_PURGE_INTERVAL:
+            self.purge_lock_files()
 
-        # Execute and cache
-        result = func(*args, **kwargs)
-        _cache.set(func.__name__, args, kwargs, result)
+        try:
+            with self._process_lock(key):
+                result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
         return result
 
-    return wrapper
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "inflight": len(self._calls),
+                "inflight_leaders": self._leaders,
+                "inflight_coalesced": self._coalesced,
+                "inflight_lock_waits": self._lock_waits,
+                "inflight_lock_timeouts": self._lock_timeouts,
+            }
+
+
+# Global in-flight registry for cache misses, coordinated across processes via CACHE_DIR
+_inflight = SingleFlight(lock_dir=CACHE_DIR / "locks")
+
+
+# Sheet versions observed while a cached tool runs ({sheet_id: version})
+_seen_sheet_versions: ContextVar[dict | None] = ContextVar("_seen_sheet_versions", default=None)
+
+
+def _record_sheet_version(sheet_id: int, version: int | None) -> None:
+    """Remember the version of a fetched sheet so the cached result can be validated later."""
+    seen = _seen_sheet_versions.get()
+    if seen is not None and version is not None:
+        seen[int(sheet_id)] = int(version)
+
+
+def _versions_current(versions: dict) -> bool:
+    """Check (one lightweight request per sheet) that cached sheet versions are unchanged."""
+    try:
+        client = get_smartsheet_client()
+        for sheet_id, version in versions.items():
+            current = client.Sheets.get_sheet_version(int(sheet_id))
+            if getattr(current, "version", None) != version:
+                return False
+        return True
+    except Exception:
+        return False
+
+
+# =============================================================================
+# CACHE POLICIES - per-tool TTLs and cacheability
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching rules for one tool (or internal store such as "_sheet_data").
+
+    Attributes:
+        l1_ttl: Seconds an entry stays fresh in memory.
+        l2_ttl: Seconds an entry stays fresh on disk.
+        use_l2: Whether entries are persisted to the L2 tier at all.
+        max_entry_bytes: Results larger than this are not cached (None = no limit).
+        cacheable: Whether results are cached at all.
+        swr_max_stale: Maximum seconds past expiry a result may be served in
+            stale-while-revalidate mode (None = CACHE_SWR_MAX_STALE, 0 = never).
+            Only L2 retains expired entries, so it has no effect without use_l2.
+    """
+
+    l1_ttl: int = CACHE_TTL_L1
+    l2_ttl: int = CACHE_TTL_L2
+    use_l2: bool = True
+    max_entry_bytes: int | None = None
+    cacheable: bool = True
+    swr_max_stale: int | None = None
+
+
+# Built-in overrides; tools not listed use the CachePolicy defaults
+_DEFAULT_CACHE_POLICIES: dict[str, dict] = {
+    # Reference data that rarely changes
+    "get_server_info": {"l1_ttl": 3600, "l2_ttl": 86400},
+    "get_current_user": {"l1_ttl": 900, "l2_ttl": 3600},
+    "get_contacts": {"l1_ttl": 900, "l2_ttl": 3600},
+    "group": {"l1_ttl": 900, "l2_ttl": 3600},
+    "user": {"l1_ttl": 900, "l2_ttl": 3600},
+    # Column schemas are version-validated; a longer L1 TTL saves version checks
+    "find_columns": {"l1_ttl": 300},
+    # Volatile data: short TTLs and kept out of the shared disk tier
+    "get_events": {"l1_ttl": 15, "l2_ttl": 60, "use_l2": False},
+    "update_requests": {"l1_ttl": 30, "l2_ttl": 60, "use_l2": False},
+    "search": {"l1_ttl": 30, "l2_ttl": 120},
+    # Filter and analysis results are cheap to rebuild from the shared sheet store
+    "filter_rows": {"use_l2": False, "max_entry_bytes": 512 * 1024},
+    "analyze_sheet": {"use_l2": False, "max_entry_bytes": 512 * 1024},
+    "get_image_urls": {"use_l2": False, "swr_max_stale": 0},  # download URLs are temporary
+    # Negative cache: sheet names a recent listing did not contain
+    "_sheet_miss": {"l1_ttl": 30, "l2_ttl": 30},
+    # Sheet schemas are version-validated once past L1 and cheap to keep on disk
+    "_sheet_schema": {"l1_ttl": 300, "l2_ttl": 86400},
+}
+
+
+def _check_policy_fields(tool_name: str, overrides: dict) -> None:
+    """Raise ValueError unless overrides are known CachePolicy fields of the right types."""
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Cache policy for '{tool_name}' must be an object")
+    hints = get_type_hints(CachePolicy)
+    unknown = set(overrides) - hints.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown cache policy field(s) for '{tool_name}': {', '.join(sorted(unknown))}"
+        )
+    for name, value in overrides.items():
+        expected = hints[name]
+        # bool is an int subclass, but true is not a TTL
+        if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+            expected = getattr(expected, "__name__", expected)
+            raise ValueError(
+                f"Cache policy field '{name}' for '{tool_name}' must be {expected}, not {value!r}"
+            )
+
+
+def _load_policy_overrides() -> dict[str, dict]:
+    """
+    Load policy overrides from SMARTSHEET_CACHE_POLICIES.
+
+    The variable holds inline JSON or a path to a JSON file mapping tool names to
+    CachePolicy fields, e.g. {"get_events": {"l1_ttl": 10, "use_l2": false}}. An
+    unreadable document, or a tool's overrides with unknown fields or wrong types, is
+    logged and skipped so a bad setting never stops the module from loading.
+    """
+    raw = os.getenv("SMARTSHEET_CACHE_POLICIES", "").strip()
+    if not raw:
+        return {}
+    try:
+        if not raw.startswith("{"):
+            raw = Path(raw).read_text()
+        overrides = json.loads(raw)
+        if not isinstance(overrides, dict):
+            raise ValueError("expected an object mapping tool names to policies")
+    except (OSError, ValueError) as e:
+        logger.error("Ignoring SMARTSHEET_CACHE_POLICIES: %s", e)
+        return {}
+    valid = {}
+    for tool_name, policy in overrides.items():
+        try:
+            _check_policy_fields(tool_name, policy)
+        except ValueError as e:
+            logger.error("Ignoring SMARTSHEET_CACHE_POLICIES entry: %s", e)
+            continue
+        valid[tool_name] = policy
+    return valid
+
+
+_cache_policies: dict[str, CachePolicy] = {
+    name: CachePolicy(**overrides) for name, overrides in _DEFAULT_CACHE_POLICIES.items()
+}
+for _name, _overrides in _load_policy_overrides().items():
+    _cache_policies[_name] = replace(_cache_policies.get(_name, CachePolicy()), **_overrides)
+
+
+# Results not cached because they exceeded their tool's max_entry_bytes
+_policy_stats = {"oversize_skips": 0}
+
+# Guards the module-level stats dicts, which tool and page threads update concurrently
+_stats_lock = threading.Lock()
+
+
+def _count(stats: dict, **amounts: int) -> None:
+    """Add to counters in one of the module-level stats dicts."""
+    with _stats_lock:
+        for name, amount in amounts.items():
+            stats[name] += amount
+
+
+def _stats_snapshot(stats: dict, prefix: str = "") -> dict:
+    """Copy a module-level stats dict, prefixing its counter names."""
+    with _stats_lock:
+        return {f"{prefix}{name}": value for name, value in stats.items()}
+
+
+def get_cache_policy(tool_name: str) -> CachePolicy:
+    """Get the cache policy for a tool."""
+    return _cache_policies.get(tool_name, CachePolicy())
+
+
+def set_cache_policy(tool_name: str, **overrides) -> CachePolicy:
+    """Override cache policy fields for a tool at runtime. Returns the new policy."""
+    _check_policy_fields(tool_name, overrides)
+    policy = replace(get_cache_policy(tool_name), **overrides)
+    _cache_policies[tool_name] = policy
+    return policy
+
+
+def _policy_set(
+    func_name: str, args: tuple, kwargs: dict, value: Any, renew: bool = False, **extra
+) -> None:
+    """
+    Store a value using the TTLs and tiers from the tool's cache policy. With renew, the
+    value is already stored unchanged and only its TTLs restart (MultiLevelCache.renew()).
+    """
+    policy = get_cache_policy(func_name)
+    store = _cache.renew if renew else _cache.set
+    store(
+        func_name,
+        args,
+        kwargs,
+        value,
+        l1_ttl=policy.l1_ttl,
+        l2_ttl=policy.l2_ttl,
+        use_l2=policy.use_l2,
+        **extra,
+    )
+
+
+def _cache_get(func_name: str, args: tuple, kwargs: dict) -> tuple[bool, Any]:
+    """Look up a cache entry, revalidating version-tagged entries. Returns (hit, value)."""
+    status, value, versions, _ = _cache.lookup(func_name, args, kwargs)
+    if status == "fresh":
+        return True, value
+    if status == "validate" and _versions_current(versions):
+        _revalidated(func_name, args, kwargs, value, versions)
+        return True, value
+    return False, None
+
+
+def _revalidated(
+    func_name: str, args: tuple, kwargs: dict, value: Any, versions: dict, **extra
+) -> None:
+    """
+    Renew an entry whose sheet versions were confirmed unchanged. Pass the tags and
+    stale_retention it was stored with as extra, or the renewed entry loses them.
+    """
+    _cache.metrics.record(func_name, "revalidated")
+    _policy_set(func_name, args, kwargs, value, versions=versions, renew=True, **extra)
+    for sheet_id, version in versions.items():
+        _record_sheet_version(sheet_id, version)
+
+
+def _swr_max_stale(func_name: str) -> int:
+    """Get the maximum staleness (seconds) a tool may serve, or 0 if SWR is off for it."""
+    if not CACHE_SWR_ENABLED:
+        return 0
+    max_stale = get_cache_policy(func_name).swr_max_stale
+    return CACHE_SWR_MAX_STALE if max_stale is None else max_stale
+
+
+def _with_refresh_notice(value: Any, stale_for: float) -> Any:
+    """Mark a stale tool output as being refreshed."""
+    if not isinstance(value, str):
+        return value
+    return (
+        f"{value.rstrip()}\n\n(Cached data, due for refresh {int(stale_for)}s ago; "
+        "a refresh is running in the background.)"
+    )
+
+
+def _store_tool_result(func_name: str, kwargs: dict, result: Any, **extra) -> None:
+    """Cache a tool result under its policy, unless it is larger than max_entry_bytes."""
+    max_entry_bytes = get_cache_policy(func_name).max_entry_bytes
+    if max_entry_bytes is not None and _estimate_size(result) > max_entry_bytes:
+        _count(_policy_stats, oversize_skips=1)
+        return
+    _policy_set(func_name, (), kwargs, result, **extra)
+
+
+# Tool parameters that refer to a sheet by ID or name
+SHEET_ARG_NAMES = frozenset({"sheet_id", "sheet_id_1", "sheet_id_2"})
+
 
+def _canonical_sheet_ref(value: Any) -> int | str:
+    """
+    Map a sheet ID or name to its numeric ID, or to a normalized name if the sheet index
+    does not hold the name. Never makes a request: resolving is left to the tool.
+    """
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text)
+    alias = _sheet_index.lookup(text)
+    return alias[0] if alias is not None else text.casefold()
+
+
+def _canonical_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> dict:
+    """Bind a call to its parameters with defaults applied and sheet references resolved."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    for name in SHEET_ARG_NAMES & arguments.keys():
+        if arguments[name] is not None:
+            arguments[name] = _canonical_sheet_ref(arguments[name])
+    return arguments
+
+
+def _tool_cache_args(
+    signature: inspect.Signature, args: tuple, kwargs: dict
+) -> tuple[dict, bool, frozenset[str]]:
+    """Get a tool call's cache key arguments, whether it asked for a refresh, and its tags."""
+    key_kwargs = _canonical_arguments(signature, args, kwargs)
+    refresh = key_kwargs.pop("use_cache", True) is False
+    tags = frozenset(f"sheet:{key_kwargs[name]}" for name in SHEET_ARG_NAMES & key_kwargs.keys())
+    return key_kwargs, refresh, tags
+
+
+def cached_tool(func):
+    """
+    Decorator that adds multi-level caching to a tool function.
+    Apply it below Agno's @tool decorator; it is the only caching layer (Agno's
+    cache_results is not used, so every entry follows one policy and invalidation path).
+
+    Results built from sheets fetched via _fetch_sheet() or _get_sheet_data() are
+    tagged with the sheet versions; when such an entry ages out of L1 it is revalidated
+    against the current version instead of being refetched.
+
+    Keys are built from the call's canonical arguments: positional and keyword calls
+    are bound to the same parameters with defaults filled in, and sheet names the sheet
+    index knows are mapped to numeric IDs, so get_sheet("Job Log"), get_sheet("job log")
+    and get_sheet(sheet_id="123") share one entry.
+
+    Entries are tagged with the tool and every sheet argument so invalidate_cache() can
+    drop them selectively. A call with use_cache=False skips the lookup and replaces
+    the entry with a fresh result.
+
+    TTLs, L2 use and size limits come from the tool's CachePolicy; tools whose policy
+    is not cacheable are called directly.
+
+    Concurrent misses for the same arguments are coalesced into a single call. In
+    stale-while-revalidate mode an expired entry, or one whose sheet versions changed,
+    within the tool's maximum staleness is returned immediately (marked as refreshing)
+    while one background refresh per entry runs on _executor.
+    """
+
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        policy = get_cache_policy(func.__name__)
+        if not policy.cacheable:
+            return func(*args, **kwargs)
+
+        try:
+            key_kwargs, refresh, tags = _tool_cache_args(signature, args, kwargs)
+        except TypeError:
+            return func(*args, **kwargs)  # Let the tool raise for bad arguments
+        key = _cache._generate_key(func.__name__, (), key_kwargs)
+        max_stale = _swr_max_stale(func.__name__)
+
+        def load(check_cache: bool = True, event: str = "misses"):
+            # A previous leader may have filled the cache after our lookup
+            if check_cache:
+                hit, value = _cache.get(func.__name__, (), key_kwargs)
+                if hit:
+                    return value
+
+            # Execute and cache, collecting the sheet versions the result depends on
+            token = _seen_sheet_versions.set({})
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                seen = _seen_sheet_versions.get()
+            finally:
+                _seen_sheet_versions.reset(token)
+                _cache.metrics.record_fetch(func.__name__, time.perf_counter() - start, event)
+            _store_tool_result(
+                func.__name__,
+                key_kwargs,
+                result,
+                versions=seen,
+                stale_retention=max_stale,
+                tags=tags,
+            )
+            return result
+
+        if refresh:
+            return load(check_cache=False)
+
+        # Check cache; an entry due for validation is served once its versions check out
+        status, value, versions, stale_for = _cache.lookup(func.__name__, (), key_kwargs)
+        if status == "fresh":
+            return value
+        if status == "validate":
+            if _versions_current(versions):
+                _revalidated(
+                    func.__name__,
+                    (),
+                    key_kwargs,
+                    value,
+                    versions,
+                    stale_retention=max_stale,
+                    tags=tags,
+                )
+                return value
+            status = "stale"
+        if max_stale and status == "stale" and stale_for <= max_stale:
+            refresh_load = partial(load, check_cache=False, event="refreshes")
+            _inflight.start(key, refresh_load, _executor)
+            _cache.metrics.record(func.__name__, "stale_hits")
+            return _with_refresh_notice(value, stale_for)
+
+        result, shared = _inflight.do(key, load)
+        if shared:
+            _cache.metrics.record(func.__name__, "coalesced")
+        return result
+
+    return wrapper
+
+
+# =============================================================================
+# RATE LIMITING - one token bucket for every Smartsheet request in the process
+# =============================================================================
+
+# Smartsheet allows 300 requests per minute per token (0 disables the limiter)
+RATE_LIMIT_RPM = int(os.getenv("SMARTSHEET_RATE_LIMIT_RPM", "300"))
+# Requests that may be sent back to back before the per-minute rate applies
+RATE_LIMIT_BURST = int(os.getenv("SMARTSHEET_RATE_LIMIT_BURST", "20"))
+# Max seconds the SDK keeps retrying a throttled or failed request
+RATE_LIMIT_MAX_RETRY_TIME = int(os.getenv("SMARTSHEET_RATE_LIMIT_MAX_RETRY_TIME", "60"))
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread sending Smartsheet requests.
+
+    The bucket holds up to burst tokens and refills at rpm per minute; each request
+    takes one, waiting for it if the bucket is empty. A 429 response pauses the bucket
+    for everyone until its Retry-After has passed (or for an exponential backoff when
+    the header is missing), so parallel callers back off together instead of each
+    hitting the limit again.
+    """
+
+    def __init__(self, rpm: int = RATE_LIMIT_RPM, burst: int = RATE_LIMIT_BURST):
+        self.rate = rpm / 60.0
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._throttle_streak = 0
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "waits": 0, "wait_seconds": 0.0, "max_wait": 0.0}
+        self._throttled = 0
+
+    def _try_acquire(self, start: float) -> float:
+        """Take a token if one is available. Returns 0, or the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._paused_until - now
+            if delay <= 0 and self.rate > 0:
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+                delay = (1 - self._tokens) / self.rate
+            if delay > 0:
+                return delay
+            self._tokens -= 1
+            waited = now - start
+            self._stats["requests"] += 1
+            if waited > 0.001:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += waited
+                self._stats["max_wait"] = max(self._stats["max_wait"], waited)
+            return 0.0
+
+    def acquire(self) -> float:
+        """Wait for a request slot. Returns the seconds spent waiting."""
+        start = time.monotonic()
+        while delay := self._try_acquire(start):
+            time.sleep(delay)
+        return time.monotonic() - start
+
+    async def acquire_async(self) -> float:
+        """Wait for a request slot without blocking the event loop."""
+        start = time.monotonic()
+        while delay := self._try_acquire(start):
+            await asyncio.sleep(delay)
+        return time.monotonic() - start
+
+    def throttle(self, retry_after: float | None = None) -> float:
+        """Pause all requests after a 429. Returns the pause in seconds."""
+        with self._lock:
+            self._throttled += 1
+            self._throttle_streak += 1
+            if retry_after is None:
+                retry_after = min(2**self._throttle_streak, 60) + random.random()
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._tokens = min(self._tokens, 0.0)
+            return retry_after
+
+    def succeeded(self) -> None:
+        """Reset the exponential backoff after a request that was not throttled."""
+        with self._lock:
+            self._throttle_streak = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            throttled = self._throttled
+        requests = stats["requests"]
+        return {
+            "rate_limit_rpm": round(self.rate * 60),
+            "rate_limit_burst": self.burst,
+            "rate_limit_requests": requests,
+            "rate_limit_queue_waits": stats["waits"],
+            "rate_limit_avg_wait_ms": (
+                round(stats["wait_seconds"] * 1000 / requests, 1) if requests else None
+            ),
+            "rate_limit_max_wait_ms": round(stats["max_wait"] * 1000, 1),
+            "rate_limit_throttled": throttled,
+        }
+
+
+_rate_limiter = RateLimiter()
+
+
+def _retry_after(response) -> float | None:
+    """Get a response's Retry-After delay in seconds (delta-seconds or HTTP date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(
+            0.0, (parsedate_to_datetime(value) - datetime.now().astimezone()).total_seconds()
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_session(session) -> None:
+    """Send every request made on a requests session (including SDK retries) via the limiter."""
+    send = session.send
+
+    @wraps(send)
+    def limited_send(request, **kwargs):
+        _rate_limiter.acquire()
+        response = send(request, **kwargs)
+        if response.status_code == 429:
+            _rate_limiter.throttle(_retry_after(response))
+        else:
+            _rate_limiter.succeeded()
+        return response
+
+    session.send = limited_send
+
+
+class RateLimitBackoff(AbstractUserCalcBackoff):
+    """
+    SDK retry backoff that leaves 429s to the rate limiter.
+
+    A throttled request is retried straight away, as the limiter already holds it (and
+    every other request) until Retry-After; other retryable errors back off
+    exponentially as in the SDK default.
+    """
+
+    def __init__(self, max_retry_time: int = RATE_LIMIT_MAX_RETRY_TIME):
+        self.max_retry_time = max_retry_time
+
+    def calc_backoff(self, previous_attempts, total_elapsed_time, error_result):
+        if error_result.status_code == 429:
+            return 0 if total_elapsed_time < self.max_retry_time else -1
+        backoff = (2**previous_attempts) + random.random()
+        if total_elapsed_time + backoff > self.max_retry_time:
+            return -1
+        return backoff
+
+
+# =============================================================================
+# SMARTSHEET CLIENT & HELPERS
+# =============================================================================
+
+# Concurrent tool calls: async runs, background refreshes and workflows.py
+TOOL_WORKERS = int(os.getenv("SMARTSHEET_TOOL_WORKERS", "6"))
+# HTTP connections kept alive to the API (0 = one per thread that can call it at once)
+CLIENT_POOL_SIZE = int(os.getenv("SMARTSHEET_POOL_SIZE", "0"))
+# API endpoint, e.g. https://api.smartsheet.eu/2.0 for the EU region
+SMARTSHEET_API_BASE = os.getenv("SMARTSHEET_API_BASE", smartsheet.__api_base__)
+
+# Long-lived client singleton; replaced only when the access token changes, so its
+# pooled HTTPS connections (and their TLS sessions) are reused across tool calls
+_client_cache = {"client": None, "token": None, "created_at": 0, "rotations": 0}
+_client_lock = threading.Lock()
+
+
+def _client_pool_size() -> int:
+    """Get the connection pool size: CLIENT_POOL_SIZE, or enough for every API caller."""
+    if CLIENT_POOL_SIZE > 0:
+        return CLIENT_POOL_SIZE
+    # The calling thread, two TOOL_WORKERS pools (_executor here and in workflows.py),
+    # sheet page workers and cache warm-up workers
+    return 1 + 2 * TOOL_WORKERS + SHEET_PAGE_WORKERS + CACHE_WARM_WORKERS
+
+
+def _access_token() -> str:
+    token = os.getenv("SMARTSHEET_ACCESS_TOKEN")
+    if not token:
+        raise ValueError("SMARTSHEET_ACCESS_TOKEN environment variable is not set")
+    return token
+
+
+def get_smartsheet_client() -> smartsheet.Smartsheet:
+    """
+    Get an authenticated Smartsheet client (long-lived singleton).
+    Thread-safe; a new client is created only when SMARTSHEET_ACCESS_TOKEN changes.
+    """
+    token = _access_token()
+    with _client_lock:
+        if _client_cache["client"] and _client_cache["token"] == token:
+            return _client_cache["client"]
+
+        client = smartsheet.Smartsheet(
+            token,
+            max_connections=_client_pool_size(),
+            max_retry_time=RateLimitBackoff(),
+            api_base=SMARTSHEET_API_BASE,
+        )
+        client.errors_as_exceptions(True)
+        _rate_limit_session(client._session)
+
+        # The old client is not closed: other threads may still have requests in flight
+        if _client_cache["client"]:
+            _client_cache["rotations"] += 1
+        _client_cache["client"] = client
+        _client_cache["token"] = token
+        _client_cache["created_at"] = time.time()
+
+        return client
+
+
+def get_client_stats() -> dict:
+    """
+    Get HTTP connection statistics for the current client.
+
+    connections_opened counts new (TLS) connections and requests counts requests sent
+    on them, so connection_reuse_rate is the share of requests that reused a
+    kept-alive connection.
+    """
+    with _client_lock:
+        client = _client_cache["client"]
+        stats = {
+            "client_pool_size": _client_pool_size(),
+            "client_age": round(time.time() - _client_cache["created_at"]) if client else None,
+            "client_rotations": _client_cache["rotations"],
+        }
+    opened = sent = 0
+    session = getattr(client, "_session", None)
+    for adapter in set(getattr(session, "adapters", {}).values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            opened += pool.num_connections
+            sent += pool.num_requests
+    stats["client_connections_opened"] = opened
+    stats["client_requests"] = sent
+    stats["client_connection_reuse_rate"] = round((sent - opened) / sent, 3) if sent else None
+    return stats
+
+
+# Thread pool for async operations
+_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS)
+
+
+async def run_async(func, *args, **kwargs):
+    """Run a synchronous function asynchronously using thread pool."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_executor, lambda: func(*args, **kwargs))
+
+
+@lru_cache(maxsize=1)
+def _get_allowed_sheet_ids() -> frozenset[int]:
+    """Get set of allowed sheet IDs from environment (cached)."""
+    ids_str = os.getenv("ALLOWED_SHEET_IDS", "").strip()
+    if not ids_str:
+        return frozenset()
+    return frozenset(int(id.strip()) for id in ids_str.split(",") if id.strip().isdigit())
+
+
+@lru_cache(maxsize=1)
+def _get_allowed_sheet_names() -> frozenset[str]:
+    """Get set of allowed sheet names from environment (cached, lowercase)."""
+    names_str = os.getenv("ALLOWED_SHEET_NAMES", "").strip()
+    if not names_str:
+        return frozenset()
+    return frozenset(name.strip().lower() for name in names_str.split(",") if name.strip())
+
+
+def _is_sheet_allowed(sheet_id: int = None, sheet_name: str = None) -> bool:
+    """Check if a sheet is in the allowed list."""
+    allowed_ids = _get_allowed_sheet_ids()
+    allowed_names = _get_allowed_sheet_names()
+
+    if not allowed_ids and not allowed_names:
+        return True
+
+    if sheet_id and sheet_id in allowed_ids:
+        return True
+
+    if sheet_name and sheet_name.lower() in allowed_names:
+        return True
+
+    return False
+
+
+def _fetch_sheet(client, sheet_id: int, **params) -> Any:
+    """Fetch a sheet and record its version for cache validation."""
+    sheet = client.Sheets.get_sheet(sheet_id, **params)
+    _record_sheet_version(sheet.id, sheet.version)
+    return sheet
+
+
+class SheetIndex:
+    """
+    Name -> ID index over the sheet listing, shared by name resolution, list_sheets()
+    and find_sheets().
+
+    The listing is refreshed once it is older than ttl. A name miss also refreshes it
+    if the listing is older than min_refresh seconds, so a sheet created since the last
+    listing is found while a burst of wrong guesses costs at most one listing.
+    """
+
+    def __init__(self, ttl: int = SHEET_INDEX_TTL, min_refresh: int = 30):
+        self.ttl = ttl
+        self.min_refresh = min_refresh
+        self._lock = threading.Lock()
+        self._sheets: list = []
+        self._by_name: dict[str, tuple[int, str]] = {}
+        self._built_at = 0.0
+        self._refreshes = 0
+
+    def _age(self) -> float:
+        return time.time() - self._built_at
+
+    def _refresh(self, client) -> None:
+        """Rebuild the index from a fresh listing (concurrent refreshes share one request)."""
+        sheets, _ = _inflight.do(
+            "_sheet_index", lambda: list(client.Sheets.list_sheets(include_all=True).data)
+        )
+        self.load(sheets)
+
+    def load(self, sheets: list) -> None:
+        """Replace the index with a sheet listing."""
+        by_name: dict[str, tuple[int, str]] = {}
+        for sheet in sheets:
+            by_name.setdefault(sheet.name.casefold(), (sheet.id, sheet.name))
+        with self._lock:
+            self._sheets = sheets
+            self._by_name = by_name
+            self._built_at = time.time()
+            self._refreshes += 1
+
+    def sheets(self, client, refresh: bool = False) -> list:
+        """Get the sheet listing (SDK sheet objects), refreshing it if stale or requested."""
+        if refresh or self._age() >= self.ttl:
+            self._refresh(client)
+        return self._sheets
+
+    def lookup(self, name: str) -> tuple[int, str] | None:
+        """Look up a name in the current index without refreshing it, however old it is."""
+        return self._by_name.get(name.strip().casefold())
+
+    def is_fresh(self) -> bool:
+        """Check whether the listing is younger than ttl, so lookup() hits can be trusted."""
+        return self._age() < self.ttl
+
+    def resolve(self, client, name: str) -> tuple[int, str] | None:
+        """Resolve a sheet name to (id, name), refreshing the listing if stale or on a miss."""
+        if self._age() >= self.ttl:
+            self._refresh(client)
+        alias = self.lookup(name)
+        if alias is None and self._age() >= self.min_refresh:
+            self._refresh(client)
+            alias = self.lookup(name)
+        return alias
+
+    async def sheets_async(self, client, refresh: bool = False) -> list:
+        """Async counterpart of sheets() for an AsyncSmartsheetClient."""
+        if refresh or self._age() >= self.ttl:
+            sheets, _ = await client.single_flight("_sheet_index", client.list_sheets)
+            self.load(sheets)
+        return self._sheets
+
+    async def resolve_async(self, client, name: str) -> tuple[int, str] | None:
+        """Async counterpart of resolve() for an AsyncSmartsheetClient."""
+        await self.sheets_async(client)
+        alias = self.lookup(name)
+        if alias is None and self._age() >= self.min_refresh:
+            await self.sheets_async(client, refresh=True)
+            alias = self.lookup(name)
+        return alias
+
+    def names(self) -> dict[str, tuple[int, str]]:
+        """Get the current casefolded name -> (id, name) mapping."""
+        return self._by_name
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sheets = []
+            self._by_name = {}
+            self._built_at = 0.0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "sheet_index_entries": len(self._by_name),
+                "sheet_index_age": round(self._age()) if self._built_at else None,
+                "sheet_index_refreshes": self._refreshes,
+            }
+
+
+_sheet_index = SheetIndex()
+
+
+def _resolve_sheet_id(client, sheet_id: str) -> tuple[int, str]:
+    """Resolve sheet ID from name if needed. Returns (id, name)."""
+    if str(sheet_id).isdigit():
+        return int(sheet_id), None
+
+    # Names from an expired listing are re-resolved: the sheet may be renamed or deleted
+    name = sheet_id.strip().casefold()
+    alias = _sheet_index.lookup(name) if _sheet_index.is_fresh() else None
+    if alias is not None:
+        return alias
+
+    # A recent listing already showed the name is missing
+    missing, _ = _cache_get("_sheet_miss", (name,), {})
+    if missing:
+        return None, None
+
+    try:
+        alias = _sheet_index.resolve(client, name)
+    except Exception:
+        return None, None
+    if alias is None:
+        _policy_set("_sheet_miss", (name,), {}, _similar_sheet_names(name))
+        return None, None
+    return alias
+
+
+def _similar_sheet_names(name: str, limit: int = 3) -> list[str]:
+    """Names of known, allowed sheets that closely match a name."""
+    candidates = {
+        key: sheet_name
+        for key, (sheet_id, sheet_name) in _sheet_index.names().items()
+        if _is_sheet_allowed(sheet_id, sheet_name)
+    }
+    matches = difflib.get_close_matches(name.casefold(), candidates, n=limit, cutoff=0.5)
+    return [candidates[match] for match in matches]
+
+
+def _sheet_not_found(sheet_id: str, hint: str = "") -> str:
+    """Build a "sheet not found" error, with suggestions cached by the failed lookup."""
+    message = f"Error: Sheet '{sheet_id}' not found"
+    _, suggestions = _cache_get("_sheet_miss", (str(sheet_id).strip().casefold(),), {})
+    if suggestions:
+        message += f". Did you mean: {', '.join(suggestions)}?"
+    if hint:
+        message += f"{'' if suggestions else '.'} {hint}"
+    return message
+
+
+def _similar_columns(data: dict, column_name: str, limit: int = 3) -> str:
+    """Format close column title matches as a suggestion suffix ("" if none)."""
+    titles = {col["title"].casefold(): col["title"] for col in data["columns"]}
+    matches = difflib.get_close_matches(column_name.casefold(), titles, n=limit, cutoff=0.5)
+    if not matches:
+        return ""
+    return f". Did you mean: {', '.join(titles[match] for match in matches)}?"
+
+
+def clear_cache():
+    """Clear all cached data including multi-level cache."""
+    _cache.clear()
+    _sheet_index.clear()
+    _get_allowed_sheet_ids.cache_clear()
+    _get_allowed_sheet_names.cache_clear()
+
+
+def invalidate_cache(
+    sheet_id: str | int | None = None, tool_name: str | None = None, tag: str | None = None
+) -> int:
+    """
+    Drop cache entries for a sheet, a tool or a tag, leaving everything else warm.
+
+    Args:
+        sheet_id: Sheet ID or name; drops every entry built from or about the sheet
+        tool_name: Drops every entry for the tool (e.g. "list_sheets")
+        tag: Drops every entry with this tag
+
+    Returns:
+        Number of entries removed from L1 and L2
+    """
+    tags = set()
+    if sheet_id is not None:
+        ref = str(sheet_id).strip()
+        tags.add(f"sheet:{_canonical_sheet_ref(ref)}")
+        if not ref.isdigit():
+            # Calls made before the sheet index knew the name are keyed by the name
+            tags.add(f"sheet:{ref.casefold()}")
+            try:
+                resolved_id, _ = _resolve_sheet_id(get_smartsheet_client(), ref)
+            except Exception:
+                resolved_id = None
+            if resolved_id is not None:
+                tags.add(f"sheet:{resolved_id}")
+    if tool_name is not None:
+        tags.add(f"tool:{tool_name}")
+    if tag is not None:
+        tags.add(tag)
+    if not tags:
+        return 0
+    return _cache.invalidate(frozenset(tags))
+
+
+def get_cache_stats() -> dict:
+    """Get cache statistics for monitoring."""
+    stats = _cache.get_stats()
+    stats.update(_inflight.get_stats())
+    stats.update(_stats_snapshot(_policy_stats, "policy_"))
+    stats.update(_stats_snapshot(_projection_stats, "projection_"))
+    stats.update(_stats_snapshot(_replica_stats, "replica_"))
+    stats.update(get_client_stats())
+    stats.update(_rate_limiter.get_stats())
+    stats.update(_sheet_index.get_stats())
+    return stats
+
+
+def dump_cache_stats(path: str | Path | None = None) -> str:
+    """
+    Dump cache statistics as JSON for offline analysis (e.g. tuning TTLs).
+
+    Args:
+        path: Optional file to write the JSON to
+
+    Returns:
+        The JSON document
+    """
+    document = json.dumps(
+        {"timestamp": datetime.now().isoformat(timespec="seconds"), **get_cache_stats()},
+        indent=2,
+    )
+    if path is not None:
+        Path(path).write_text(document + "\n")
+    return document
+
+
+# =============================================================================
+# SHARED SHEET STORE - one normalized copy of each sheet for all row-level tools
+# =============================================================================
+
+SHEET_PAGE_SIZE = 5000
+# Concurrent page requests per sheet for sheets larger than one page
+SHEET_PAGE_WORKERS = int(os.getenv("SMARTSHEET_SHEET_PAGE_WORKERS", "4"))
+
+# Dedicated pool so page fetches never queue behind the tool or warm-up threads
+# that are waiting on them
+_page_executor = ThreadPoolExecutor(
+    max_workers=SHEET_PAGE_WORKERS, thread_name_prefix="smartsheet-page"
+)
+
+
+# Parse sheet responses as they arrive instead of through the SDK's Sheet model
+SHEET_STREAM_PARSE = os.getenv("SMARTSHEET_STREAM_PARSE", "true").lower() == "true"
+SHEET_STREAM_CHUNK = 64 * 1024
+
+
+def _query_params(params: dict) -> dict:
+    """Convert SDK-style keyword arguments (page_size, row_ids=[...]) to API query parameters."""
+    query = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        head, *rest = name.split("_")
+        if isinstance(value, bool):
+            value = str(value).lower()
+        elif isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        query[head + "".join(part.title() for part in rest)] = value
+    return query
+
+
+def _api_error(response, backoff, attempt: int, elapsed: float) -> tuple[float, Exception]:
+    """
+    Interpret a failed API response as the SDK does. Returns the seconds to wait before
+    retrying it (negative to give up) and the smartsheet.exceptions error to raise.
+    """
+    error = OperationErrorResult(response.text, response).native("Error")
+    wait = -1
+    if error.result.should_retry or response.status_code == 429:
+        wait = backoff.calc_backoff(attempt, elapsed, error.result)
+    exception = getattr(smartsheet.exceptions, error.result.name)
+    return wait, exception(error, f"{error.result.code}: {error.result.message or 'Unknown error'}")
+
+
+def _iso_timestamp(value: Any) -> str | None:
+    """Normalize an API timestamp (ISO 8601 string or SDK datetime) to an ISO 8601 string."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return value.isoformat() if value is not None else None
+
+
+def _compact_columns(columns: list) -> list[dict]:
+    """Reduce a sheet's columns (API dicts) to the fields the row-level tools use."""
+    return [
+        {
+            "id": col.get("id"),
+            "title": col.get("title"),
+            "type": str(col.get("type")),
+            "options": list(col["options"]) if col.get("options") else None,
+        }
+        for col in columns
+    ]
+
+
+def _compact_sheet(sheet) -> dict:
+    """
+    Convert an SDK Sheet (one page) into the compact form shared by the row-level tools.
+
+    Columns are kept as small dicts; each row is a (row_id, row_number, values) tuple
+    with values aligned to the columns list (display value, falling back to raw value).
+    """
+    columns = [
+        {
+            "id": col.id,
+            "title": col.title,
+            "type": str(col.type),
+            "options": list(col.options) if col.options else None,
+        }
+        for col in sheet.columns
+    ]
+    index = {col["id"]: i for i, col in enumerate(columns)}
+
+    rows = []
+    for row in sheet.rows:
+        values = [None] * len(columns)
+        for cell in row.cells:
+            i = index.get(cell.column_id)
+            if i is not None:
+                values[i] = cell.display_value or cell.value
+        rows.append((row.id, row.row_number, tuple(values)))
+
+    return {
+        "id": sheet.id,
+        "name": sheet.name,
+        "version": sheet.version,
+        "created_at": _iso_timestamp(sheet.created_at),
+        "modified_at": _iso_timestamp(sheet.modified_at),
+        "total_row_count": sheet.total_row_count,
+        "columns": columns,
+        "rows": rows,
+    }
+
+
+class SheetStreamParser:
+    """
+    Incremental parser for a GET /sheets/{id} response body.
+
+    Feed it the body in chunks: each row is decoded as soon as its JSON is complete and
+    turned straight into its compact tuple, so only the unparsed tail of the body is
+    held, never the whole text, its dict tree or SDK Cell objects. Other top-level
+    fields are decoded whole. close() returns the page in the form of _compact_sheet().
+    """
+
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._fields: dict = {}
+        self._columns: list[dict] | None = None
+        self._index: dict = {}
+        self._pending: list[dict] = []  # rows received before the columns
+        self._rows: list[tuple] = []
+        self._steps = self._parse()
+        next(self._steps)
+
+    def feed(self, chunk: bytes) -> None:
+        self._buf = self._buf[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        self._resume()
+
+    def close(self) -> dict:
+        self._eof = True
+        self.feed(b"")
+        if self._steps is not None:
+            raise ValueError("Truncated sheet response")
+        if self._columns is None:
+            self._set_columns([])
+        self._rows[:0] = [self._compact_row(row) for row in self._pending]
+        return {
+            "id": self._fields.get("id"),
+            "name": self._fields.get("name"),
+            "version": self._fields.get("version"),
+            "created_at": _iso_timestamp(self._fields.get("createdAt")),
+            "modified_at": _iso_timestamp(self._fields.get("modifiedAt")),
+            "total_row_count": self._fields.get("totalRowCount"),
+            "columns": self._columns,
+            "rows": self._rows,
+        }
+
+    def _resume(self) -> None:
+        if self._steps is None:
+            return  # anything after the sheet object is ignored
+        try:
+            next(self._steps)
+        except StopIteration:
+            self._steps = None
+
+    def _parse(self):
+        yield from self._expect("{")
+        while (char := (yield from self._peek())) != "}":
+            if char == ",":
+                self._pos += 1
+                continue
+            key = yield from self._value()
+            yield from self._expect(":")
+            if key == "rows":
+                yield from self._parse_rows()
+                continue
+            value = yield from self._value()
+            if key == "columns":
+                self._set_columns(value)
+            else:
+                self._fields[key] = value
+        self._pos += 1
+
+    def _parse_rows(self):
+        yield from self._expect("[")
+        while (char := (yield from self._peek())) != "]":
+            if char == ",":
+                self._pos += 1
+                continue
+            row = yield from self._value()
+            if self._columns is None:
+                self._pending.append(row)
+            else:
+                self._rows.append(self._compact_row(row))
+        self._pos += 1
+
+    def _peek(self):
+        """Skip whitespace and return the next character, waiting for input if needed."""
+        while True:
+            self._pos = self._WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                raise ValueError("Truncated sheet response")
+            yield
+
+    def _expect(self, char: str):
+        if (yield from self._peek()) != char:
+            raise ValueError(f"Malformed sheet response: expected '{char}'")
+        self._pos += 1
+
+    def _value(self):
+        """Decode the JSON value at the current position once it has fully arrived."""
+        yield from self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number ending the buffer may continue in the next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            yield
+
+    def _set_columns(self, columns: list) -> None:
+        self._columns = _compact_columns(columns)
+        self._index = {col["id"]: i for i, col in enumerate(self._columns)}
+
+    def _compact_row(self, row: dict) -> tuple:
+        values = [None] * len(self._columns)
+        for cell in row.get("cells", ()):
+            i = self._index.get(cell.get("columnId"))
+            if i is not None:
+                values[i] = cell.get("displayValue") or cell.get("value")
+        return (row.get("id"), row.get("rowNumber"), tuple(values))
+
+
+def _sdk_request_context(client) -> tuple | None:
+    """
+    Get what a raw request on the SDK client needs: (session, api_base, headers, backoff).
+    These are private SDK attributes, so this is the only place that reads them; returns
+    None if the client lacks any (e.g. a test double or a different SDK version).
+    """
+    try:
+        headers = {
+            "Accept": "application/json",
+            "Authorization": f"Bearer {client._access_token}",
+            "User-Agent": client._user_agent,
+        }
+        if client._assume_user is not None:
+            headers["Assume-User"] = client._assume_user
+        return client._session, client._api_base, headers, client._user_calc_backoff
+    except AttributeError:
+        return None
+
+
+def _stream_sheet_page(client, sheet_id: int, **params) -> dict:
+    """
+    Fetch one page of a sheet on the SDK client's session, parsing it as it streams in.
+
+    Requests go through the same rate-limited session, are retried like SDK calls, and
+    raise the SDK's exceptions. Clients whose session cannot be used are read through
+    the SDK model instead.
+    """
+    context = _sdk_request_context(client)
+    if context is None:
+        return _compact_sheet(client.Sheets.get_sheet(sheet_id, **params))
+    session, api_base, headers, backoff = context
+    url = f"{api_base}/sheets/{sheet_id}"
+    query = _query_params(params)
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        # Transport errors are wrapped as in Smartsheet._request()
+        try:
+            with session.get(url, params=query, headers=headers, stream=True) as response:
+                if response.ok:
+                    parser = SheetStreamParser()
+                    for chunk in response.iter_content(SHEET_STREAM_CHUNK):
+                        parser.feed(chunk)
+                    return parser.close()
+                attempt += 1
+                wait, error = _api_error(response, backoff, attempt, time.monotonic() - start)
+        except requests.exceptions.SSLError as e:
+            raise HttpError(e, "SSL handshake error, old CA bundle or old OpenSSL?") from e
+        except requests.exceptions.RequestException as e:
+            raise UnexpectedRequestError(e.request, e.response) from e
+        if wait < 0:
+            raise error
+        time.sleep(wait)
+
+
+def _fetch_page(client, sheet_id: int, **params) -> dict:
+    """
+    Fetch one page of a sheet in the compact form (see _compact_sheet()).
+
+    Streamed with _stream_sheet_page() when SHEET_STREAM_PARSE is on; otherwise read
+    through the SDK model.
+    """
+    if SHEET_STREAM_PARSE:
+        return _stream_sheet_page(client, sheet_id, **params)
+    return _compact_sheet(client.Sheets.get_sheet(sheet_id, **params))
+
+
+def _fetch_sheet_pages(
+    client, sheet_id: int, page_size: int = SHEET_PAGE_SIZE, parallel: bool = True, **params
+) -> list[dict]:
+    """
+    Fetch every page of a sheet. Returns the compact pages in order.
+
+    The first page reports total_row_count; the remaining pages are then requested
+    concurrently on the page pool, or one after another if parallel is False.
+    Extra params (e.g. column_ids) are passed to every page request.
+    """
+
+    def fetch(page: int) -> dict:
+        return _fetch_page(client, sheet_id, page_size=page_size, page=page, **params)
+
+    first = fetch(1)
+    page_count = -(-(first["total_row_count"] or 0) // page_size)
+    if page_count <= 1:
+        return [first]
+    pages = range(2, page_count + 1)
+    rest = _page_executor.map(fetch, pages) if parallel else map(fetch, pages)
+    return [first, *rest]
+
+
+def _normalize_sheet(pages: list[dict]) -> dict:
+    """
+    Merge the compact pages of a sheet into one entry for the shared sheet store.
+
+    Rows repeated across pages (the sheet changed between requests) are kept once, and
+    the result carries the oldest page version so the next validation refetches it.
+    """
+    rows = []
+    seen = set()
+    for row in (row for page in pages for row in page["rows"]):
+        if row[0] in seen:
+            continue
+        seen.add(row[0])
+        rows.append(row)
+    return {**pages[0], "version": min(page["version"] for page in pages), "rows": rows}
+
+
+def _store_sheet_entry(func_name: str, args: tuple, build) -> dict:
+    """Build a sheet entry with build() and store it tagged with the sheet version."""
+    start = time.perf_counter()
+    try:
+        data = build()
+    finally:
+        _cache.metrics.record_fetch(func_name, time.perf_counter() - start)
+    _policy_set(func_name, args, {}, data, versions={data["id"]: data["version"]})
+    return data
+
+
+def _get_sheet_entry(func_name: str, args: tuple, build) -> dict:
+    """
+    Get a normalized sheet entry (built by build() on a miss) from the shared store.
+
+    Entries are tagged with the sheet version, and concurrent misses for the same
+    entry share one build.
+    """
+    hit, data = _cache_get(func_name, args, {})
+    if not hit:
+
+        def load():
+            # A previous leader may have stored the entry after our lookup; the versions
+            # were just checked, so only a fresh entry counts
+            hit, data = _cache.get(func_name, args, {})
+            if hit:
+                return data
+            return _store_sheet_entry(func_name, args, build)
+
+        data, shared = _inflight.do(_cache._generate_key(func_name, args, {}), load)
+        if shared:
+            _cache.metrics.record(func_name, "coalesced")
+    _record_sheet_version(data["id"], data["version"])
+    return data
+
+
+# Margin subtracted from the sheet's modifiedAt for rows_modified_since, covering edits
+# saved while the response was being built (rows seen twice are simply merged again)
+REPLICA_SYNC_MARGIN = 60
+
+# Shared sheet store loads: full downloads, incremental syncs, rows merged by those
+# syncs, and row listings made to place inserted/moved rows and drop deleted ones
+_replica_stats = {"full_loads": 0, "delta_syncs": 0, "delta_rows": 0, "row_listings": 0}
+
+
+def _sync_marker(data: dict) -> str:
+    """
+    Get the rows_modified_since value for the next sync of a freshly fetched sheet.
+
+    Based on the sheet's modifiedAt, a server timestamp, so the local clock's skew
+    cannot hide edits; the local clock is only used if the response lacks it.
+    """
+    modified_at = data.get("modified_at")
+    since = datetime.fromisoformat(modified_at) if modified_at else datetime.now().astimezone()
+    return (since - timedelta(seconds=REPLICA_SYNC_MARGIN)).isoformat(timespec="seconds")
+
+
+def _sync_sheet(client, sheet_id: int, previous: dict) -> dict | None:
+    """
+    Bring a cached copy of a sheet up to date with the rows modified since it was synced.
+
+    Modified rows are merged in place. If rows were inserted, moved or deleted (a row
+    number changed, or the row count no longer matches), the current row IDs and numbers
+    are listed with a one-column fetch to reorder the copy and drop deleted rows.
+
+    Returns None if the sheet must be downloaded again: the columns changed, or the
+    version moved with the row count unchanged and no modified row changed (formula
+    and cross-sheet recalculations change values without touching a row's modifiedAt).
+    """
+    delta = _fetch_page(client, sheet_id, rows_modified_since=previous["synced_at"])
+    if delta["columns"] != previous["columns"]:
+        return None
+
+    rows = {row[0]: row for row in previous["rows"]}
+    # Rows just before the sync marker are fetched again, so only count actual changes;
+    # deleted rows never appear in the delta, so a changed row count is left to the listing
+    if (
+        delta["version"] != previous["version"]
+        and len(rows) == delta["total_row_count"]
+        and all(rows.get(row[0]) == row for row in delta["rows"])
+    ):
+        return None
+    moved = False
+    for row in delta["rows"]:
+        old = rows.get(row[0])
+        moved = moved or old is None or old[1] != row[1]
+        rows[row[0]] = row
+    _count(_replica_stats, delta_syncs=1, delta_rows=len(delta["rows"]))
+
+    if moved or len(rows) != delta["total_row_count"]:
+        _count(_replica_stats, row_listings=1)
+        first_column = [previous["columns"][0]["id"]] if previous["columns"] else None
+        pages = _fetch_sheet_pages(client, sheet_id, column_ids=first_column)
+        current = [(row[0], row[1]) for page in pages for row in page["rows"]]
+        if any(row_id not in rows for row_id, _ in current):
+            return None  # a row was added without showing up as modified
+        merged = [(row_id, number, rows[row_id][2]) for row_id, number in current]
+    else:
+        merged = list(rows.values())
+
+    return {**delta, "rows": merged, "synced_at": _sync_marker(delta)}
+
+
+def _get_sheet_data(client, sheet_id: int) -> dict:
+    """
+    Get the normalized data for a sheet from the shared store, fetching it on a miss.
+
+    Entries are keyed by sheet ID and tagged with the sheet version, so every tool
+    reading the same sheet shares one download until the sheet changes. When a cached
+    copy is out of date it is synced incrementally (_sync_sheet) rather than
+    downloaded again.
+    """
+    return _get_sheet_entry(
+        "_sheet_data", (sheet_id,), partial(_build_sheet_data, client, sheet_id)
+    )
+
+
+def _build_sheet_data(client, sheet_id: int) -> dict:
+    """Sync the shared store's copy of a sheet, or download the sheet if that fails."""
+    previous = _cache.peek("_sheet_data", (sheet_id,), {})
+    if SHEET_REPLICA_ENABLED and previous and previous.get("synced_at"):
+        data = _sync_sheet(client, sheet_id, previous)
+        if data is not None:
+            return data
+    data = _normalize_sheet(_fetch_sheet_pages(client, sheet_id))
+    _count(_replica_stats, full_loads=1)
+    return {**data, "synced_at": _sync_marker(data)}
+
+
+def _fresh_sheet_data(sheet_id: int) -> dict | None:
+    """
+    Get the shared store's copy of a sheet if it can be used as-is (fresh, so no version
+    check or sync is needed), recording its version. Returns None otherwise.
+    """
+    status, data, _, _ = _cache.lookup("_sheet_data", (sheet_id,), {})
+    if status != "fresh":
+        return None
+    _record_sheet_version(data["id"], data["version"])
+    return data
+
+
+def _get_sheet_schema(client, sheet_id: int, record_version: bool = True) -> dict:
+    """
+    Get a sheet's id, name, version, total_row_count and columns, without its rows.
+
+    Served from the full sheet when the shared store holds a fresh copy; otherwise
+    fetched as a one-row page and cached until the sheet version changes. Tools that
+    only need the sheet name pass record_version=False so their own results are not
+    tied to the sheet version (attachments, shares etc. change without bumping it).
+    """
+    token = None if record_version else _seen_sheet_versions.set(None)
+    try:
+        data = _fresh_sheet_data(sheet_id)
+        if data is not None:
+            return data
+
+        def build() -> dict:
+            schema = _fetch_page(client, sheet_id, page_size=1)
+            del schema["rows"]
+            return schema
+
+        return _get_sheet_entry("_sheet_schema", (sheet_id,), build)
+    finally:
+        if token is not None:
+            _seen_sheet_versions.reset(token)
+
+
+# Column-projected fetches: count, normalized size, and estimated size saved versus
+# fetching every column
+_projection_stats = {"fetches": 0, "bytes": 0, "bytes_saved": 0}
+
+
+def _get_sheet_columns(client, sheet_id: int, schema: dict, column_ids: tuple) -> dict:
+    """
+    Get the rows of a sheet restricted to column_ids, in the shared sheet store format.
+
+    Returns the full sheet instead when the shared store holds a fresh copy, so callers
+    must locate columns with _find_column() on the result rather than by position.
+    """
+    data = _fresh_sheet_data(sheet_id)
+    if data is not None:
+        return data
+
+    def build() -> dict:
+        ids = sorted(column_ids)
+        data = _normalize_sheet(_fetch_sheet_pages(client, sheet_id, column_ids=ids))
+        size = len(pickle.dumps(data["rows"], pickle.HIGHEST_PROTOCOL))
+        skipped = len(schema["columns"]) - len(ids)
+        _count(
+            _projection_stats,
+            fetches=1,
+            bytes=size,
+            bytes_saved=size * skipped // max(len(ids), 1),
+        )
+        return data
+
+    return _get_sheet_entry("_sheet_columns", (sheet_id, tuple(sorted(column_ids))), build)
+
+
+def _get_sheet_rows(client, sheet_id: int, row_ids: list[int]) -> dict:
+    """Fetch specific rows (all columns) of a sheet in the shared sheet store format."""
+    batches = [row_ids[i : i + 100] for i in range(0, len(row_ids), 100)]
+    pages = list(
+        _page_executor.map(lambda batch: _fetch_page(client, sheet_id, row_ids=batch), batches)
+    )
+    data = _normalize_sheet(pages)
+    _record_sheet_version(data["id"], data["version"])
+    return data
+
+
+def _find_column(data: dict, column_name: str) -> int | None:
+    """Get the index of a column by exact (case-insensitive) title."""
+    name_lower = column_name.lower()
+    for i, col in enumerate(data["columns"]):
+        if col["title"].lower() == name_lower:
+            return i
+    return None
+
+
+def _value_matches(cell_value: str, filter_value: str, match_type: str) -> bool:
+    """Apply a filter match type to lowercase cell and filter values."""
+    if match_type == "equals":
+        return cell_value == filter_value
+    if match_type == "starts_with":
+        return cell_value.startswith(filter_value)
+    if match_type == "ends_with":
+        return cell_value.endswith(filter_value)
+    return filter_value in cell_value  # contains
+
+
+# =============================================================================
+# ASYNC TRANSPORT - asyncio-native reads over httpx, without the thread pools
+# =============================================================================
+
+# Connections each event loop's async client keeps open to the API
+ASYNC_MAX_CONNECTIONS = int(os.getenv("SMARTSHEET_ASYNC_CONNECTIONS", "32"))
+
+
+class AsyncSmartsheetClient:
+    """
+    Read-only Smartsheet API client for asyncio, built on httpx.AsyncClient.
+
+    Covers the read endpoints the async tool variants use (sheets, sheet versions,
+    listings, reports and search) and returns the same SDK models as the blocking
+    client, so results share its formatting; get_sheet_page() streams a sheet straight
+    into the compact form instead. Every request takes a slot from the shared rate
+    limiter; errors are retried with RateLimitBackoff and raised as the SDK's
+    smartsheet.exceptions.
+
+    An httpx.AsyncClient is tied to the event loop it first runs on, so use
+    get_async_client() to get the client for the running loop.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        api_base: str = SMARTSHEET_API_BASE,
+        max_connections: int = ASYNC_MAX_CONNECTIONS,
+        **http_options,
+    ):
+        self.token = token
+        self._backoff = RateLimitBackoff()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._http = httpx.AsyncClient(
+            base_url=api_base,
+            headers={"Authorization": f"Bearer {token}"},
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            **http_options,
+        )
+
+    async def _get(self, path: str, read=None, **params) -> Any:
+        """
+        GET an API path, retrying throttled and retryable errors. Returns the JSON body,
+        or what the async read(response) returns for a successful response.
+        """
+        query = _query_params(params)
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            await _rate_limiter.acquire_async()
+            async with self._http.stream("GET", path, params=query) as response:
+                if response.status_code == 429:
+                    _rate_limiter.throttle(_retry_after(response))
+                else:
+                    _rate_limiter.succeeded()
+                if response.is_success:
+                    if read is not None:
+                        return await read(response)
+                    return json.loads(await response.aread())
+                await response.aread()
+            attempt += 1
+            wait, error = _api_error(response, self._backoff, attempt, time.monotonic() - start)
+            if wait < 0:
+                raise error
+            await asyncio.sleep(wait)
+
+    async def get_sheet(self, sheet_id: int, **params) -> smartsheet.models.Sheet:
+        """Get a sheet. Takes the keyword arguments of client.Sheets.get_sheet()."""
+        return smartsheet.models.Sheet(await self._get(f"/sheets/{sheet_id}", **params))
+
+    async def get_sheet_page(self, sheet_id: int, **params) -> dict:
+        """Get a sheet in the compact form, parsed as it streams in (see SheetStreamParser)."""
+
+        async def read(response) -> dict:
+            parser = SheetStreamParser()
+            async for chunk in response.aiter_bytes(SHEET_STREAM_CHUNK):
+                parser.feed(chunk)
+            return parser.close()
+
+        return await self._get(f"/sheets/{sheet_id}", read, **params)
+
+    async def get_sheet_version(self, sheet_id: int) -> int | None:
+        return (await self._get(f"/sheets/{sheet_id}/version")).get("version")
+
+    async def list_sheets(self) -> list:
+        data = await self._get("/sheets", include_all=True)
+        return [smartsheet.models.Sheet(sheet) for sheet in data.get("data", [])]
+
+    async def get_report(self, report_id: int, **params) -> smartsheet.models.Report:
+        """Get a report. Takes the keyword arguments of client.Reports.get_report()."""
+        return smartsheet.models.Report(await self._get(f"/reports/{report_id}", **params))
+
+    async def list_reports(self) -> list:
+        data = await self._get("/reports", include_all=True)
+        return [smartsheet.models.Report(report) for report in data.get("data", [])]
+
+    async def search(self, query: str) -> smartsheet.models.SearchResult:
+        return smartsheet.models.SearchResult(await self._get("/search", query=query))
+
+    async def search_sheet(self, sheet_id: int, query: str) -> smartsheet.models.SearchResult:
+        return smartsheet.models.SearchResult(
+            await self._get(f"/search/sheets/{sheet_id}", query=query)
+        )
 
-# =============================================================================
-# SMARTSHEET CLIENT & HELPERS
-# =============================================================================
+    async def single_flight(self, key: str, factory) -> tuple[Any, bool]:
+        """
+        Await factory() once for all concurrent callers with the same key on this loop.
+        Returns (result, shared) like _inflight.do().
+        """
+        task, shared = self._task(key, factory)
+        # A cancelled caller must not cancel the load for the others
+        return await asyncio.shield(task), shared
 
-# Client singleton with TTL
-_client_cache = {"client": None, "created_at": 0}
-_client_lock = threading.Lock()
+    def start(self, key: str, factory) -> bool:
+        """
+        Start factory() in the background unless a call with the same key is in flight
+        on this loop. Returns whether it was started, like _inflight.start().
+        """
+        return not self._task(key, factory)[1]
 
+    def _task(self, key: str, factory) -> tuple[asyncio.Future, bool]:
+        """Get the in-flight task for a key, creating it from factory() if there is none."""
+        task = self._inflight.get(key)
+        if task is not None:
+            return task, True
+        task = asyncio.ensure_future(factory())
+        self._inflight[key] = task
 
-def get_smartsheet_client() -> smartsheet.Smartsheet:
-    """
-    Get an authenticated Smartsheet client (singleton with TTL).
-    Thread-safe with automatic refresh.
-    """
-    global _client_cache
+        def done(task: asyncio.Future) -> None:
+            self._inflight.pop(key, None)
+            # Retrieve a background task's error so it is not logged as never retrieved
+            if not task.cancelled():
+                task.exception()
 
-    with _client_lock:
-        # Return cached client if still valid (refresh every 5 minutes)
-        if _client_cache["client"] and time.time() - _client_cache["created_at"] < 300:
-            return _client_cache["client"]
+        task.add_done_callback(done)
+        return task, False
 
-        token = os.getenv("SMARTSHEET_ACCESS_TOKEN")
-        if not token:
-            raise ValueError("SMARTSHEET_ACCESS_TOKEN environment variable is not set")
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
-        client = smartsheet.Smartsheet(token)
-        client.errors_as_exceptions(True)
 
-        _client_cache["client"] = client
-        _client_cache["created_at"] = time.time()
+# One async client per event loop; replaced only when the access token changes
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-        return client
 
+def get_async_client() -> AsyncSmartsheetClient:
+    """Get the AsyncSmartsheetClient for the running event loop."""
+    token = _access_token()
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    # The old client is not closed: other tasks may still have requests in flight
+    if client is None or client.token != token:
+        client = AsyncSmartsheetClient(token)
+        _async_clients[loop] = client
+    return client
 
-# Thread pool for async operations
-_executor = ThreadPoolExecutor(max_workers=4)
 
+async def _cache_lookup_async(
+    func_name: str, args: tuple, kwargs: dict
+) -> tuple[str | None, Any, dict, float]:
+    """
+    _cache.lookup() for the event loop: L1 is checked on the loop, L2 (disk reads and
+    unpickling, which take tens of ms for a large sheet) on a thread.
+    """
+    found = _cache.lookup(func_name, args, kwargs, use_l2=False)
+    if found[0] is not None:
+        return found
+    return await asyncio.to_thread(_cache.lookup, func_name, args, kwargs)
 
-async def run_async(func, *args, **kwargs):
-    """Run a synchronous function asynchronously using thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, lambda: func(*args, **kwargs))
 
+async def _cache_get_async(client, func_name: str, args: tuple, kwargs: dict) -> tuple[bool, Any]:
+    """Async counterpart of _cache_get(), checking sheet versions concurrently."""
+    status, value, versions, _ = await _cache_lookup_async(func_name, args, kwargs)
+    if status == "fresh":
+        return True, value
+    if status == "validate" and await _versions_current_async(client, versions):
+        await asyncio.to_thread(_revalidated, func_name, args, kwargs, value, versions)
+        return True, value
+    return False, None
 
-@lru_cache(maxsize=1)
-def _get_allowed_sheet_ids() -> frozenset[int]:
-    """Get set of allowed sheet IDs from environment (cached)."""
-    ids_str = os.getenv("ALLOWED_SHEET_IDS", "").strip()
-    if not ids_str:
-        return frozenset()
-    return frozenset(int(id.strip()) for id in ids_str.split(",") if id.strip().isdigit())
 
+async def _versions_current_async(client, versions: dict) -> bool:
+    """Async counterpart of _versions_current(), checking all sheets concurrently."""
+    try:
+        current = await asyncio.gather(
+            *(client.get_sheet_version(int(sheet_id)) for sheet_id in versions)
+        )
+    except Exception:
+        return False
+    return current == list(versions.values())
 
-@lru_cache(maxsize=1)
-def _get_allowed_sheet_names() -> frozenset[str]:
-    """Get set of allowed sheet names from environment (cached, lowercase)."""
-    names_str = os.getenv("ALLOWED_SHEET_NAMES", "").strip()
-    if not names_str:
-        return frozenset()
-    return frozenset(name.strip().lower() for name in names_str.split(",") if name.strip())
 
+async def _fetch_sheet_pages_async(
+    client, sheet_id: int, page_size: int = SHEET_PAGE_SIZE, **params
+) -> list:
+    """Async counterpart of _fetch_sheet_pages(); pages after the first are fetched at once."""
 
-def _is_sheet_allowed(sheet_id: int = None, sheet_name: str = None) -> bool:
-    """Check if a sheet is in the allowed list."""
-    allowed_ids = _get_allowed_sheet_ids()
-    allowed_names = _get_allowed_sheet_names()
+    def fetch(page: int):
+        return client.get_sheet_page(sheet_id, page_size=page_size, page=page, **params)
 
-    if not allowed_ids and not allowed_names:
-        return True
+    first = await fetch(1)
+    page_count = -(-(first["total_row_count"] or 0) // page_size)
+    rest = await asyncio.gather(*(fetch(page) for page in range(2, page_count + 1)))
+    return [first, *rest]
 
-    if sheet_id and sheet_id in allowed_ids:
-        return True
 
-    if sheet_name and sheet_name.lower() in allowed_names:
-        return True
+async def _get_sheet_data_async(client, sheet_id: int) -> dict:
+    """
+    Async counterpart of _get_sheet_data(), sharing its store entries.
 
-    return False
+    A copy that is out of date is synced by _build_sheet_data() on the tool pool, as a
+    delta sync is only a request or two.
+    """
+    args = (sheet_id,)
+
+    async def load() -> dict:
+        previous = await asyncio.to_thread(_cache.peek, "_sheet_data", args, {})
+        if SHEET_REPLICA_ENABLED and previous and previous.get("synced_at"):
+            build = partial(_build_sheet_data, get_smartsheet_client(), sheet_id)
+            return await run_async(_store_sheet_entry, "_sheet_data", args, build)
+        # Normalizing and storing (pickling, compressing, writing L2) run on threads
+        start = time.perf_counter()
+        try:
+            pages = await _fetch_sheet_pages_async(client, sheet_id)
+            data = await asyncio.to_thread(_normalize_sheet, pages)
+        finally:
+            _cache.metrics.record_fetch("_sheet_data", time.perf_counter() - start)
+        _count(_replica_stats, full_loads=1)
+        data = {**data, "synced_at": _sync_marker(data)}
+        versions = {data["id"]: data["version"]}
+        await asyncio.to_thread(_policy_set, "_sheet_data", args, {}, data, versions=versions)
+        return data
+
+    hit, data = await _cache_get_async(client, "_sheet_data", args, {})
+    if not hit:
+        data, shared = await client.single_flight(
+            _cache._generate_key("_sheet_data", args, {}), load
+        )
+        if shared:
+            _cache.metrics.record("_sheet_data", "coalesced")
+    _record_sheet_version(data["id"], data["version"])
+    return data
 
 
-def _resolve_sheet_id(client, sheet_id: str) -> tuple[int, str]:
-    """Resolve sheet ID from name if needed. Returns (id, name)."""
+async def _resolve_sheet_id_async(client, sheet_id: str) -> tuple[int, str]:
+    """Async counterpart of _resolve_sheet_id()."""
     if str(sheet_id).isdigit():
         return int(sheet_id), None
 
-    # Search in cached sheets list
+    # Names from an expired listing are re-resolved: the sheet may be renamed or deleted
+    name = sheet_id.strip().casefold()
+    alias = _sheet_index.lookup(name) if _sheet_index.is_fresh() else None
+    if alias is not None:
+        return alias
+
+    missing, _ = await _cache_get_async(client, "_sheet_miss", (name,), {})
+    if missing:
+        return None, None
+
     try:
-        response = client.Sheets.list_sheets(include_all=True)
-        for sheet in response.data:
-            if sheet.name.lower() == sheet_id.lower():
-                return sheet.id, sheet.name
+        alias = await _sheet_index.resolve_async(client, name)
     except Exception:
-        pass
+        return None, None
+    if alias is None:
+        similar = _similar_sheet_names(name)
+        await asyncio.to_thread(_policy_set, "_sheet_miss", (name,), {}, similar)
+        return None, None
+    return alias
 
-    return None, None
 
+# =============================================================================
+# CACHE WARMING - prefetch allowlisted sheets before the first question
+# =============================================================================
 
-def clear_cache():
-    """Clear all cached data including multi-level cache."""
-    _cache.clear()
-    _get_allowed_sheet_ids.cache_clear()
-    _get_allowed_sheet_names.cache_clear()
+# Concurrent sheet downloads while warming
+CACHE_WARM_WORKERS = int(os.getenv("SMARTSHEET_CACHE_WARM_WORKERS", "4"))
 
 
-def get_cache_stats() -> dict:
-    """Get cache statistics for monitoring."""
-    return _cache.get_stats()
+def warm_cache(max_workers: int = CACHE_WARM_WORKERS) -> dict:
+    """
+    Prefetch the sheets in ALLOWED_SHEET_IDS / ALLOWED_SHEET_NAMES into the shared sheet
+    store, so the first questions about them are answered from cache.
+
+    Sheets are downloaded in parallel on a dedicated pool of max_workers threads.
+
+    Returns:
+        Summary dict with sheets, rows, bytes, seconds and errors ({sheet: message})
+    """
+    start = time.perf_counter()
+    summary = {"sheets": 0, "rows": 0, "bytes": 0, "seconds": 0.0, "errors": {}}
+
+    client = get_smartsheet_client()
+    sheet_ids = set(_get_allowed_sheet_ids())
+    for name in _get_allowed_sheet_names():
+        sheet_id, _ = _resolve_sheet_id(client, name)
+        if sheet_id is None:
+            summary["errors"][name] = "Sheet not found"
+        else:
+            sheet_ids.add(sheet_id)
+
+    if sheet_ids:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sheet_ids))) as pool:
+            futures = {
+                pool.submit(_get_sheet_data, client, sheet_id): sheet_id for sheet_id in sheet_ids
+            }
+            for future in as_completed(futures):
+                try:
+                    data = future.result()
+                except Exception as e:
+                    summary["errors"][str(futures[future])] = str(e)
+                    continue
+                summary["sheets"] += 1
+                summary["rows"] += len(data["rows"])
+                summary["bytes"] += _estimate_size(data)
+
+    summary["seconds"] = round(time.perf_counter() - start, 2)
+    return summary
 
 
 # =============================================================================
@@ -309,7 +2951,7 @@ def get_cache_stats() -> dict:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def list_sheets(use_cache: bool = True) -> str:
     """
@@ -322,13 +2964,14 @@ def list_sheets(use_cache: bool = True) -> str:
     """
     try:
         if not use_cache:
-            clear_cache()
+            # Only sheet listings are stale; this tool's own entry is replaced by cached_tool
+            invalidate_cache(tool_name="find_sheets")
+            invalidate_cache(tool_name="_sheet_miss")
 
         client = get_smartsheet_client()
-        response = client.Sheets.list_sheets(include_all=True)
 
         sheets = []
-        for sheet in response.data:
+        for sheet in _sheet_index.sheets(client, refresh=not use_cache):
             if not _is_sheet_allowed(sheet.id, sheet.name):
                 continue
             sheets.append(
@@ -353,7 +2996,7 @@ def list_sheets(use_cache: bool = True) -> str:
         return f"Error listing sheets: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_sheet(sheet_id: str, max_rows: int = 1000) -> str:
     """
@@ -373,46 +3016,35 @@ def get_sheet(sheet_id: str, max_rows: int = 1000) -> str:
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return f"Error: Access to sheet '{sheet_name_resolved or sheet_id}' is not permitted."
 
-        # Optimized: Use page_size for better pagination
-        sheet = client.Sheets.get_sheet(resolved_id, page_size=min(max_rows, 5000))
-        columns = {col.id: col.title for col in sheet.columns}
-        column_list = [col.title for col in sheet.columns]
+        data = _get_sheet_data(client, resolved_id)
+        column_list = [col["title"] for col in data["columns"]]
+        rows_data = data["rows"][:max_rows]
 
-        rows_data = []
-        for i, row in enumerate(sheet.rows):
-            if i >= max_rows:
-                break
-            row_dict = {"row_id": row.id, "row_number": row.row_number}
-            for cell in row.cells:
-                col_name = columns.get(cell.column_id, f"Column_{cell.column_id}")
-                row_dict[col_name] = cell.display_value or cell.value
-            rows_data.append(row_dict)
-
-        text_output = f"Sheet: {sheet.name}\n"
-        text_output += f"Total Rows: {len(sheet.rows)} (showing {len(rows_data)})\n"
+        text_output = f"Sheet: {data['name']}\n"
+        text_output += f"Total Rows: {len(data['rows'])} (showing {len(rows_data)})\n"
         text_output += f"Columns: {', '.join(column_list)}\n\n"
 
         if rows_data:
             text_output += "Data:\n"
-            for row in rows_data:
+            for _, row_number, values in rows_data:
                 row_str = " | ".join(
-                    f"{k}: {v}"
-                    for k, v in row.items()
-                    if k not in ("row_id", "row_number") and v is not None
+                    f"{title}: {v}"
+                    for title, v in zip(column_list, values, strict=True)
+                    if v is not None
                 )
-                text_output += f"  Row {row['row_number']}: {row_str}\n"
+                text_output += f"  Row {row_number}: {row_str}\n"
 
         return text_output
     except Exception as e:
         return f"Error getting sheet: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_row(sheet_id: str, row_id: str) -> str:
     """
@@ -429,15 +3061,15 @@ def get_row(sheet_id: str, row_id: str) -> str:
 
     try:
         client = get_smartsheet_client()
-        sheet = client.Sheets.get_sheet(int(sheet_id))
+        schema = _get_sheet_schema(client, int(sheet_id))
 
-        if not _is_sheet_allowed(sheet.id, sheet.name):
-            return f"Error: Access to sheet '{sheet.name}' is not permitted."
+        if not _is_sheet_allowed(schema["id"], schema["name"]):
+            return f"Error: Access to sheet '{schema['name']}' is not permitted."
 
-        columns = {col.id: col.title for col in sheet.columns}
+        columns = {col["id"]: col["title"] for col in schema["columns"]}
         row = client.Sheets.get_row(int(sheet_id), int(row_id))
 
-        text_output = f"Row {row.row_number} from sheet '{sheet.name}':\n"
+        text_output = f"Row {row.row_number} from sheet '{schema['name']}':\n"
         for cell in row.cells:
             col_name = columns.get(cell.column_id, f"Column_{cell.column_id}")
             value = cell.display_value or cell.value
@@ -449,7 +3081,68 @@ def get_row(sheet_id: str, row_id: str) -> str:
         return f"Error getting row: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
+@cached_tool
+def get_rows(sheet_id: str, row_ids: str) -> str:
+    """
+    Get several rows of a Smartsheet in one call. Prefer this to repeated get_row calls.
+
+    Args:
+        sheet_id: The sheet ID (numeric) or sheet name.
+        row_ids: Comma-separated row IDs, e.g. from filter_rows or search results.
+
+    Returns the rows as one compact block, one line per row.
+    """
+    if not sheet_id or not row_ids:
+        return "Error: Both sheet_id and row_ids parameters are required"
+
+    try:
+        ids = list(dict.fromkeys(int(x) for x in str(row_ids).split(",") if x.strip()))
+    except ValueError:
+        ids = []
+    if not ids:
+        return "Error: row_ids must be a comma-separated list of numeric row IDs"
+
+    try:
+        client = get_smartsheet_client()
+        resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
+
+        if not resolved_id:
+            return _sheet_not_found(sheet_id)
+
+        if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
+            return f"Error: Access to sheet '{sheet_name_resolved or sheet_id}' is not permitted."
+
+        # Rows of a fresh sheet in the shared store cost no request; otherwise one
+        # rowIds-filtered request per 100 rows
+        data = _fresh_sheet_data(resolved_id) or _get_sheet_rows(client, resolved_id, ids)
+
+        column_list = [col["title"] for col in data["columns"]]
+        wanted = set(ids)
+        rows = {row_id: row for row_id, *row in data["rows"] if row_id in wanted}
+
+        text_output = f"Rows from '{data['name']}' ({len(rows)} of {len(ids)}):\n\n"
+        for row_id in ids:
+            if row_id not in rows:
+                continue
+            row_number, values = rows[row_id]
+            cells = " | ".join(
+                f"{title}: {value}"
+                for title, value in zip(column_list, values, strict=True)
+                if value is not None
+            )
+            text_output += f"  Row {row_number} (ID: {row_id}): {cells}\n"
+
+        missing = [str(row_id) for row_id in ids if row_id not in rows]
+        if missing:
+            text_output += f"\nNot found: {', '.join(missing)}\n"
+
+        return text_output
+    except Exception as e:
+        return f"Error getting rows: {str(e)}"
+
+
+@tool
 @cached_tool
 def filter_rows(
     sheet_id: str,
@@ -478,53 +3171,45 @@ def filter_rows(
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return f"Error: Access to sheet '{sheet_name_resolved or sheet_id}' is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id, page_size=5000)
-
-        target_column_id = None
-        columns_map = {col.id: col.title for col in sheet.columns}
-        for col in sheet.columns:
-            if col.title.lower() == column_name.lower():
-                target_column_id = col.id
-                break
-
-        if not target_column_id:
-            available_cols = ", ".join([col.title for col in sheet.columns])
-            return f"Error: Column '{column_name}' not found. Available columns: {available_cols}"
+        schema = _get_sheet_schema(client, resolved_id)
+        target_index = _find_column(schema, column_name)
+        if target_index is None:
+            available_cols = ", ".join(col["title"] for col in schema["columns"])
+            return (
+                f"Error: Column '{column_name}' not found. Available columns: {available_cols}"
+                f"{_similar_columns(schema, column_name)}"
+            )
 
-        matching_rows = []
+        # Match on the filter column alone, then fetch whole rows for the matches only
+        column_id = schema["columns"][target_index]["id"]
+        data = _get_sheet_columns(client, resolved_id, schema, (column_id,))
+        target_index = _find_column(data, column_name)
         filter_value_lower = str(filter_value).lower()
-
-        for row in sheet.rows:
-            if len(matching_rows) >= max_results:
+        matches = []
+        for row_id, _, values in data["rows"]:
+            if len(matches) >= max_results:
                 break
-            for cell in row.cells:
-                if cell.column_id == target_column_id:
-                    cell_value = str(cell.display_value or cell.value or "").lower()
-
-                    match = False
-                    if match_type == "equals":
-                        match = cell_value == filter_value_lower
-                    elif match_type == "starts_with":
-                        match = cell_value.startswith(filter_value_lower)
-                    elif match_type == "ends_with":
-                        match = cell_value.endswith(filter_value_lower)
-                    else:  # contains
-                        match = filter_value_lower in cell_value
-
-                    if match:
-                        row_data = {"row_number": row.row_number, "row_id": row.id}
-                        for c in row.cells:
-                            col_name = columns_map.get(c.column_id, f"Col_{c.column_id}")
-                            row_data[col_name] = c.display_value or c.value
-                        matching_rows.append(row_data)
-                    break
+            cell_value = str(values[target_index] or "").lower()
+            if _value_matches(cell_value, filter_value_lower, match_type):
+                matches.append(row_id)
+
+        if len(data["columns"]) < len(schema["columns"]) and matches:
+            data = _get_sheet_rows(client, resolved_id, matches)
+        column_list = [col["title"] for col in data["columns"]]
+        matched = set(matches)
+        matching_rows = []
+        for row_id, row_number, values in data["rows"]:
+            if row_id in matched:
+                row_data = {"row_number": row_number, "row_id": row_id}
+                row_data.update(zip(column_list, values, strict=True))
+                matching_rows.append(row_data)
 
-        text_output = f"Filter results for '{sheet.name}'\n"
+        text_output = f"Filter results for '{data['name']}'\n"
         text_output += f"Filter: {column_name} {match_type} '{filter_value}'\n"
         text_output += f"Found: {len(matching_rows)} matching rows\n\n"
 
@@ -542,7 +3227,7 @@ def filter_rows(
         return f"Error filtering rows: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def count_rows_by_column(sheet_id: str, column_name: str) -> str:
     """
@@ -563,37 +3248,36 @@ def count_rows_by_column(sheet_id: str, column_name: str) -> str:
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return f"Error: Access to sheet '{sheet_name_resolved or sheet_id}' is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id, page_size=5000)
-
-        target_col_id = None
-        for col in sheet.columns:
-            if col.title.lower() == column_name.lower():
-                target_col_id = col.id
-                break
+        schema = _get_sheet_schema(client, resolved_id)
+        target_index = _find_column(schema, column_name)
+        if target_index is None:
+            available = ", ".join(col["title"] for col in schema["columns"])
+            return (
+                f"Error: Column '{column_name}' not found. Available: {available}"
+                f"{_similar_columns(schema, column_name)}"
+            )
 
-        if not target_col_id:
-            available = ", ".join([col.title for col in sheet.columns])
-            return f"Error: Column '{column_name}' not found. Available: {available}"
+        column_id = schema["columns"][target_index]["id"]
+        data = _get_sheet_columns(client, resolved_id, schema, (column_id,))
+        target_index = _find_column(data, column_name)
 
         counts = {}
-        for row in sheet.rows:
-            for cell in row.cells:
-                if cell.column_id == target_col_id:
-                    value = str(cell.display_value or cell.value or "(empty)")
-                    counts[value] = counts.get(value, 0) + 1
-                    break
+        for _, _, values in data["rows"]:
+            value = str(values[target_index] or "(empty)")
+            counts[value] = counts.get(value, 0) + 1
 
-        text_output = f"Row Count by '{column_name}' in '{sheet.name}'\n"
+        total = len(data["rows"])
+        text_output = f"Row Count by '{column_name}' in '{data['name']}'\n"
         text_output += "=" * 50 + "\n\n"
-        text_output += f"Total rows: {len(sheet.rows)}\n\n"
+        text_output += f"Total rows: {total}\n\n"
 
         for value, count in sorted(counts.items(), key=lambda x: -x[1]):
-            pct = (count / len(sheet.rows)) * 100 if sheet.rows else 0
+            pct = (count / total) * 100 if total else 0
             bar = "█" * int(pct / 5)
             text_output += f"  {value}: {count} ({pct:.1f}%) {bar}\n"
 
@@ -607,7 +3291,7 @@ def count_rows_by_column(sheet_id: str, column_name: str) -> str:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def workspace(workspace_id: str = None) -> str:
     """
@@ -657,7 +3341,7 @@ def workspace(workspace_id: str = None) -> str:
         return f"Error with workspace: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def folder(folder_id: str = None) -> str:
     """
@@ -700,7 +3384,7 @@ def folder(folder_id: str = None) -> str:
         return f"Error with folder: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def sight(sight_id: str = None) -> str:
     """
@@ -740,7 +3424,7 @@ def sight(sight_id: str = None) -> str:
         return f"Error with sight: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def report(report_id: str = None, max_rows: int = 100) -> str:
     """
@@ -755,47 +3439,55 @@ def report(report_id: str = None, max_rows: int = 100) -> str:
 
         if report_id:
             r = client.Reports.get_report(int(report_id), page_size=min(max_rows, 5000))
-            columns = {col.virtual_id: col.title for col in r.columns}
-            column_list = [col.title for col in r.columns]
-
-            rows_data = []
-            for i, row in enumerate(r.rows):
-                if i >= max_rows:
-                    break
-                row_dict = {"row_number": row.row_number}
-                for cell in row.cells:
-                    col_name = columns.get(
-                        cell.virtual_column_id, f"Column_{cell.virtual_column_id}"
-                    )
-                    row_dict[col_name] = cell.display_value or cell.value
-                rows_data.append(row_dict)
-
-            text_output = f"Report: {r.name}\n"
-            text_output += f"Total Rows: {len(r.rows)} (showing {len(rows_data)})\n"
-            text_output += f"Columns: {', '.join(column_list)}\n\n"
-
-            if rows_data:
-                text_output += "Data:\n"
-                for row in rows_data:
-                    row_str = " | ".join(f"{k}: {v}" for k, v in row.items() if v is not None)
-                    text_output += f"  Row {row['row_number']}: {row_str}\n"
-
-            return text_output
+            return _format_report(r, max_rows)
         else:
             response = client.Reports.list_reports(include_all=True)
-            if not response.data:
-                return "No reports available."
-
-            text_output = f"Found {len(response.data)} reports:\n\n"
-            for r in response.data:
-                text_output += f"- {r.name} (ID: {r.id})\n"
-
-            return text_output
+            return _format_report_list(response.data)
     except Exception as e:
         return f"Error with report: {str(e)}"
 
 
-@tool(cache_results=True)
+def _format_report(r, max_rows: int) -> str:
+    """Format an SDK Report for report()."""
+    columns = {col.virtual_id: col.title for col in r.columns}
+    column_list = [col.title for col in r.columns]
+
+    rows_data = []
+    for i, row in enumerate(r.rows):
+        if i >= max_rows:
+            break
+        row_dict = {"row_number": row.row_number}
+        for cell in row.cells:
+            col_name = columns.get(cell.virtual_column_id, f"Column_{cell.virtual_column_id}")
+            row_dict[col_name] = cell.display_value or cell.value
+        rows_data.append(row_dict)
+
+    text_output = f"Report: {r.name}\n"
+    text_output += f"Total Rows: {len(r.rows)} (showing {len(rows_data)})\n"
+    text_output += f"Columns: {', '.join(column_list)}\n\n"
+
+    if rows_data:
+        text_output += "Data:\n"
+        for row in rows_data:
+            row_str = " | ".join(f"{k}: {v}" for k, v in row.items() if v is not None)
+            text_output += f"  Row {row['row_number']}: {row_str}\n"
+
+    return text_output
+
+
+def _format_report_list(reports: list) -> str:
+    """Format a report listing for report()."""
+    if not reports:
+        return "No reports available."
+
+    text_output = f"Found {len(reports)} reports:\n\n"
+    for r in reports:
+        text_output += f"- {r.name} (ID: {r.id})\n"
+
+    return text_output
+
+
+@tool
 @cached_tool
 def webhook(webhook_id: str = None) -> str:
     """
@@ -830,7 +3522,7 @@ def webhook(webhook_id: str = None) -> str:
         return f"Error with webhook: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def group(group_id: str = None) -> str:
     """
@@ -868,7 +3560,7 @@ def group(group_id: str = None) -> str:
         return f"Error with group: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def user(user_id: str = None, max_results: int = 50) -> str:
     """
@@ -921,7 +3613,7 @@ def user(user_id: str = None, max_results: int = 50) -> str:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def attachment(sheet_id: str, row_id: str = None, attachment_id: str = None) -> str:
     """
@@ -940,13 +3632,11 @@ def attachment(sheet_id: str, row_id: str = None, attachment_id: str = None) ->
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id)
-
         if attachment_id:
             att = client.Attachments.get_attachment(resolved_id, int(attachment_id))
             text_output = f"Attachment: {getattr(att, 'name', 'N/A')}\n"
@@ -967,7 +3657,8 @@ def attachment(sheet_id: str, row_id: str = None, attachment_id: str = None) ->
             return text_output
         else:
             attachments = client.Attachments.list_all_attachments(resolved_id, include_all=True)
-            text_output = f"Attachments for '{sheet.name}':\n"
+            sheet = _get_sheet_schema(client, resolved_id, record_version=False)
+            text_output = f"Attachments for '{sheet['name']}':\n"
             if attachments.data:
                 for att in attachments.data:
                     text_output += f"- {att.name} (ID: {att.id})\n"
@@ -978,7 +3669,7 @@ def attachment(sheet_id: str, row_id: str = None, attachment_id: str = None) ->
         return f"Error with attachment: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def discussion(sheet_id: str, row_id: str = None) -> str:
     """
@@ -996,13 +3687,11 @@ def discussion(sheet_id: str, row_id: str = None) -> str:
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id)
-
         if row_id:
             discussions = client.Discussions.get_row_discussions(
                 resolved_id, int(row_id), include_all=True
@@ -1010,7 +3699,8 @@ def discussion(sheet_id: str, row_id: str = None) -> str:
             text_output = f"Discussions for Row {row_id}:\n"
         else:
             discussions = client.Discussions.get_all_discussions(resolved_id, include_all=True)
-            text_output = f"Discussions for '{sheet.name}':\n"
+            sheet = _get_sheet_schema(client, resolved_id, record_version=False)
+            text_output = f"Discussions for '{sheet['name']}':\n"
 
         if discussions.data:
             for disc in discussions.data:
@@ -1034,7 +3724,7 @@ def discussion(sheet_id: str, row_id: str = None) -> str:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def search(query: str, sheet_id: str = None, max_results: int = 20) -> str:
     """
@@ -1054,27 +3744,30 @@ def search(query: str, sheet_id: str = None, max_results: int = 20) -> str:
         if sheet_id:
             resolved_id, _ = _resolve_sheet_id(client, sheet_id)
             if not resolved_id:
-                return f"Error: Sheet '{sheet_id}' not found"
-
+                return _sheet_not_found(sheet_id)
             results = client.Search.search_sheet(resolved_id, query)
-            text_output = f"Search results for '{query}' in sheet:\n"
         else:
             results = client.Search.search(query)
-            text_output = f"Search results for '{query}':\n"
 
-        if not results.results:
-            return f"No results found for '{query}'."
+        return _format_search_results(query, results, max_results, in_sheet=bool(sheet_id))
+    except Exception as e:
+        return f"Error searching: {str(e)}"
 
-        text_output += f"Found {results.total_count} result(s):\n\n"
 
-        for i, result in enumerate(results.results[:max_results], 1):
-            text = getattr(result, "text", "N/A")
-            obj_type = getattr(result, "object_type", "Unknown")
-            text_output += f"{i}. {obj_type}: {text}\n"
+def _format_search_results(query: str, results, max_results: int, in_sheet: bool) -> str:
+    """Format an SDK SearchResult for search()."""
+    if not results.results:
+        return f"No results found for '{query}'."
 
-        return text_output
-    except Exception as e:
-        return f"Error searching: {str(e)}"
+    text_output = f"Search results for '{query}'{' in sheet' if in_sheet else ''}:\n"
+    text_output += f"Found {results.total_count} result(s):\n\n"
+
+    for i, result in enumerate(results.results[:max_results], 1):
+        text = getattr(result, "text", "N/A")
+        obj_type = getattr(result, "object_type", "Unknown")
+        text_output += f"{i}. {obj_type}: {text}\n"
+
+    return text_output
 
 
 # =============================================================================
@@ -1082,7 +3775,7 @@ def search(query: str, sheet_id: str = None, max_results: int = 20) -> str:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def navigation(view: Literal["home", "favorites", "templates"] = "home") -> str:
     """
@@ -1145,7 +3838,7 @@ def navigation(view: Literal["home", "favorites", "templates"] = "home") -> str:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def sheet_metadata(
     sheet_id: str, info: Literal["automation", "shares", "publish", "proofs", "references"]
@@ -1165,16 +3858,16 @@ def sheet_metadata(
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id)
+        sheet_name = _get_sheet_schema(client, resolved_id, record_version=False)["name"]
 
         if info == "automation":
             rules = client.Sheets.list_automation_rules(resolved_id, include_all=True)
-            text_output = f"Automation Rules for '{sheet.name}':\n"
+            text_output = f"Automation Rules for '{sheet_name}':\n"
             if rules.data:
                 for rule in rules.data:
                     text_output += f"- {getattr(rule, 'name', 'Unnamed')} (Enabled: {getattr(rule, 'enabled', 'Unknown')})\n"
@@ -1184,7 +3877,7 @@ def sheet_metadata(
 
         elif info == "shares":
             shares = client.Sheets.list_shares(resolved_id, include_all=True)
-            text_output = f"Sharing for '{sheet.name}':\n"
+            text_output = f"Sharing for '{sheet_name}':\n"
             if shares.data:
                 for share in shares.data:
                     email = getattr(share, "email", "N/A")
@@ -1196,19 +3889,19 @@ def sheet_metadata(
 
         elif info == "publish":
             status = client.Sheets.get_publish_status(resolved_id)
-            text_output = f"Publish Status for '{sheet.name}':\n"
+            text_output = f"Publish Status for '{sheet_name}':\n"
             text_output += f"Read-Only Full: {getattr(status, 'read_only_full_enabled', False)}\n"
             text_output += f"Read-Only Lite: {getattr(status, 'read_only_lite_enabled', False)}\n"
             return text_output
 
         elif info == "proofs":
-            text_output = f"Proofs for '{sheet.name}':\n"
+            text_output = f"Proofs for '{sheet_name}':\n"
             text_output += "(Proofs API not directly supported - check attachments)\n"
             return text_output
 
         elif info == "references":
             refs = client.Sheets.list_cross_sheet_references(resolved_id)
-            text_output = f"Cross-Sheet References for '{sheet.name}':\n"
+            text_output = f"Cross-Sheet References for '{sheet_name}':\n"
             if refs.data:
                 for ref in refs.data:
                     text_output += f"- {getattr(ref, 'name', 'Unnamed')} (ID: {ref.id})\n"
@@ -1228,7 +3921,7 @@ def sheet_metadata(
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def sheet_info(
     sheet_id: str,
@@ -1251,39 +3944,14 @@ def sheet_info(
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id)
-
-        if info == "columns":
-            text_output = f"Columns for '{sheet.name}':\n{'=' * 50}\n\n"
-            for col in sheet.columns:
-                text_output += f"- {col.title} (ID: {col.id}, Type: {col.type})\n"
-                if hasattr(col, "options") and col.options:
-                    text_output += f"    Options: {', '.join(col.options)}\n"
-            return text_output
-
-        elif info == "stats":
-            text_output = f"Statistics for '{sheet.name}':\n{'=' * 50}\n\n"
-            text_output += f"Total Rows: {len(sheet.rows)}\n"
-            text_output += f"Total Columns: {len(sheet.columns)}\n"
-
-            # Column type breakdown
-            type_counts = {}
-            for col in sheet.columns:
-                col_type = col.type
-                type_counts[col_type] = type_counts.get(col_type, 0) + 1
-
-            text_output += "\nColumn Types:\n"
-            for col_type, count in sorted(type_counts.items()):
-                text_output += f"  - {col_type}: {count}\n"
-
-            return text_output
-
-        elif info == "summary_fields":
+        if info == "summary_fields":
+            # Summary fields are not part of the shared sheet store
+            sheet = _fetch_sheet(client, resolved_id)
             text_output = f"Summary Fields for '{sheet.name}':\n{'=' * 50}\n\n"
 
             if hasattr(sheet, "summary") and sheet.summary and hasattr(sheet.summary, "fields"):
@@ -1296,32 +3964,58 @@ def sheet_info(
 
             return text_output
 
-        elif info == "by_column":
+        if info == "by_column":
             if not columns:
                 return "Error: columns parameter is required for info='by_column'"
 
-            column_names = [c.strip() for c in columns.split(",")]
-            col_id_map = {}
-            for col in sheet.columns:
-                if col.title.lower() in [c.lower() for c in column_names]:
-                    col_id_map[col.id] = col.title
+            schema = _get_sheet_schema(client, resolved_id)
+            column_names = [c.strip().lower() for c in columns.split(",")]
+            column_ids = tuple(
+                col["id"] for col in schema["columns"] if col["title"].lower() in column_names
+            )
 
-            if not col_id_map:
-                return f"Error: None of the specified columns found. Available: {', '.join([c.title for c in sheet.columns])}"
+            if not column_ids:
+                return f"Error: None of the specified columns found. Available: {', '.join([c['title'] for c in schema['columns']])}"
 
-            text_output = (
-                f"Data from '{sheet.name}' - Columns: {', '.join(col_id_map.values())}\n\n"
-            )
+            data = _get_sheet_columns(client, resolved_id, schema, column_ids)
+            selected = [
+                (i, col["title"])
+                for i, col in enumerate(data["columns"])
+                if col["id"] in column_ids
+            ]
+            text_output = f"Data from '{data['name']}' - Columns: {', '.join(title for _, title in selected)}\n\n"
+
+            for _, row_number, values in data["rows"][:50]:  # Limit to 50 rows
+                row_data = [f"{title}: {values[i]}" for i, title in selected]
+                text_output += f"Row {row_number}: {' | '.join(row_data)}\n"
+
+            return text_output
+
+        # Column listings and stats need no rows
+        data = _get_sheet_schema(client, resolved_id)
+
+        if info == "columns":
+            text_output = f"Columns for '{data['name']}':\n{'=' * 50}\n\n"
+            for col in data["columns"]:
+                text_output += f"- {col['title']} (ID: {col['id']}, Type: {col['type']})\n"
+                if col["options"]:
+                    text_output += f"    Options: {', '.join(col['options'])}\n"
+            return text_output
+
+        elif info == "stats":
+            text_output = f"Statistics for '{data['name']}':\n{'=' * 50}\n\n"
+            text_output += f"Total Rows: {data['total_row_count'] or 0}\n"
+            text_output += f"Total Columns: {len(data['columns'])}\n"
+
+            # Column type breakdown
+            type_counts = {}
+            for col in data["columns"]:
+                col_type = col["type"]
+                type_counts[col_type] = type_counts.get(col_type, 0) + 1
 
-            for row in sheet.rows[:50]:  # Limit to 50 rows
-                row_data = []
-                for cell in row.cells:
-                    if cell.column_id in col_id_map:
-                        col_name = col_id_map[cell.column_id]
-                        value = cell.display_value or cell.value
-                        row_data.append(f"{col_name}: {value}")
-                if row_data:
-                    text_output += f"Row {row.row_number}: {' | '.join(row_data)}\n"
+            text_output += "\nColumn Types:\n"
+            for col_type, count in sorted(type_counts.items()):
+                text_output += f"  - {col_type}: {count}\n"
 
             return text_output
 
@@ -1337,7 +4031,7 @@ def sheet_info(
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def update_requests(sheet_id: str, sent: bool = False) -> str:
     """
@@ -1355,7 +4049,7 @@ def update_requests(sheet_id: str, sent: bool = False) -> str:
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
@@ -1383,7 +4077,7 @@ def update_requests(sheet_id: str, sent: bool = False) -> str:
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def compare_sheets(sheet_id_1: str, sheet_id_2: str, key_column: str) -> str:
     """
@@ -1404,64 +4098,42 @@ def compare_sheets(sheet_id_1: str, sheet_id_2: str, key_column: str) -> str:
         resolved_id_2, _ = _resolve_sheet_id(client, sheet_id_2)
 
         if not resolved_id_1:
-            return f"Error: Sheet '{sheet_id_1}' not found"
+            return _sheet_not_found(sheet_id_1)
         if not resolved_id_2:
-            return f"Error: Sheet '{sheet_id_2}' not found"
+            return _sheet_not_found(sheet_id_2)
 
-        sheet1 = client.Sheets.get_sheet(resolved_id_1)
-        sheet2 = client.Sheets.get_sheet(resolved_id_2)
+        sheet1 = _get_sheet_data(client, resolved_id_1)
+        sheet2 = _get_sheet_data(client, resolved_id_2)
 
         # Find key column in both sheets
-        key_col_1 = None
-        key_col_2 = None
-
-        for col in sheet1.columns:
-            if col.title.lower() == key_column.lower():
-                key_col_1 = col.id
-                break
+        key_col_1 = _find_column(sheet1, key_column)
+        key_col_2 = _find_column(sheet2, key_column)
 
-        for col in sheet2.columns:
-            if col.title.lower() == key_column.lower():
-                key_col_2 = col.id
-                break
-
-        if not key_col_1 or not key_col_2:
+        if key_col_1 is None or key_col_2 is None:
             return f"Error: Key column '{key_column}' not found in both sheets"
 
         # Build key sets
-        keys_1 = set()
-        keys_2 = set()
-
-        for row in sheet1.rows:
-            for cell in row.cells:
-                if cell.column_id == key_col_1:
-                    keys_1.add(str(cell.display_value or cell.value or ""))
-                    break
-
-        for row in sheet2.rows:
-            for cell in row.cells:
-                if cell.column_id == key_col_2:
-                    keys_2.add(str(cell.display_value or cell.value or ""))
-                    break
+        keys_1 = {str(values[key_col_1] or "") for _, _, values in sheet1["rows"]}
+        keys_2 = {str(values[key_col_2] or "") for _, _, values in sheet2["rows"]}
 
         only_in_1 = keys_1 - keys_2
         only_in_2 = keys_2 - keys_1
         in_both = keys_1 & keys_2
 
         text_output = f"Comparison Results\n{'=' * 50}\n\n"
-        text_output += f"Sheet 1: {sheet1.name} ({len(keys_1)} unique keys)\n"
-        text_output += f"Sheet 2: {sheet2.name} ({len(keys_2)} unique keys)\n\n"
+        text_output += f"Sheet 1: {sheet1['name']} ({len(keys_1)} unique keys)\n"
+        text_output += f"Sheet 2: {sheet2['name']} ({len(keys_2)} unique keys)\n\n"
         text_output += f"In both: {len(in_both)}\n"
         text_output += f"Only in Sheet 1: {len(only_in_1)}\n"
         text_output += f"Only in Sheet 2: {len(only_in_2)}\n"
 
         if only_in_1:
-            text_output += f"\n**Only in {sheet1.name}:**\n"
+            text_output += f"\n**Only in {sheet1['name']}:**\n"
             for key in list(only_in_1)[:10]:
                 text_output += f"  - {key}\n"
 
         if only_in_2:
-            text_output += f"\n**Only in {sheet2.name}:**\n"
+            text_output += f"\n**Only in {sheet2['name']}:**\n"
             for key in list(only_in_2)[:10]:
                 text_output += f"  - {key}\n"
 
@@ -1470,7 +4142,7 @@ def compare_sheets(sheet_id_1: str, sheet_id_2: str, key_column: str) -> str:
         return f"Error comparing sheets: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_cell_history(sheet_id: str, row_id: str, column_id: str) -> str:
     """
@@ -1486,13 +4158,13 @@ def get_cell_history(sheet_id: str, row_id: str, column_id: str) -> str:
 
     try:
         client = get_smartsheet_client()
-        sheet = client.Sheets.get_sheet(int(sheet_id))
 
         # Resolve column name to ID if needed
         if not str(column_id).isdigit():
-            for col in sheet.columns:
-                if col.title.lower() == column_id.lower():
-                    column_id = col.id
+            schema = _get_sheet_schema(client, int(sheet_id))
+            for col in schema["columns"]:
+                if col["title"].lower() == column_id.lower():
+                    column_id = col["id"]
                     break
 
         history = client.Cells.get_cell_history(
@@ -1516,7 +4188,7 @@ def get_cell_history(sheet_id: str, row_id: str, column_id: str) -> str:
         return f"Error getting cell history: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_sheet_version(sheet_id: str) -> str:
     """
@@ -1533,21 +4205,21 @@ def get_sheet_version(sheet_id: str) -> str:
         resolved_id, _ = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return f"Error: Sheet '{sheet_id}' not found"
+            return _sheet_not_found(sheet_id)
 
-        sheet = client.Sheets.get_sheet(resolved_id)
+        schema = _get_sheet_schema(client, resolved_id)
 
-        text_output = f"Sheet Version Info: {sheet.name}\n{'=' * 50}\n\n"
-        text_output += f"Version: {getattr(sheet, 'version', 'N/A')}\n"
-        text_output += f"Created At: {getattr(sheet, 'created_at', 'N/A')}\n"
-        text_output += f"Modified At: {getattr(sheet, 'modified_at', 'N/A')}\n"
+        text_output = f"Sheet Version Info: {schema['name']}\n{'=' * 50}\n\n"
+        text_output += f"Version: {schema['version']}\n"
+        text_output += f"Created At: {schema.get('created_at') or 'N/A'}\n"
+        text_output += f"Modified At: {schema.get('modified_at') or 'N/A'}\n"
 
         return text_output
     except Exception as e:
         return f"Error getting sheet version: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_events(days_back: int = 7, max_count: int = 50) -> str:
     """
@@ -1582,7 +4254,7 @@ def get_events(days_back: int = 7, max_count: int = 50) -> str:
         return f"Error getting events: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_current_user() -> str:
     """Get current authenticated user profile."""
@@ -1600,7 +4272,7 @@ def get_current_user() -> str:
         return f"Error getting current user: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_contacts() -> str:
     """List personal contacts."""
@@ -1623,7 +4295,7 @@ def get_contacts() -> str:
         return f"Error getting contacts: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_server_info() -> str:
     """Get Smartsheet server info and constants."""
@@ -1644,7 +4316,7 @@ def get_server_info() -> str:
         return f"Error getting server info: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def list_org_sheets(max_results: int = 100) -> str:
     """
@@ -1673,7 +4345,7 @@ def list_org_sheets(max_results: int = 100) -> str:
         return f"Error listing org sheets: {str(e)}"
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def get_image_urls(sheet_id: str, row_id: str, column_id_or_name: str) -> str:
     """
@@ -1689,14 +4361,14 @@ def get_image_urls(sheet_id: str, row_id: str, column_id_or_name: str) -> str:
 
     try:
         client = get_smartsheet_client()
-        sheet = client.Sheets.get_sheet(int(sheet_id))
 
         # Resolve column name to ID if needed
         column_id = column_id_or_name
         if not str(column_id_or_name).isdigit():
-            for col in sheet.columns:
-                if col.title.lower() == column_id_or_name.lower():
-                    column_id = col.id
+            schema = _get_sheet_schema(client, int(sheet_id), record_version=False)
+            for col in schema["columns"]:
+                if col["title"].lower() == column_id_or_name.lower():
+                    column_id = col["id"]
                     break
 
         # Get row to find image
@@ -1753,7 +4425,7 @@ def _tokenize(text: str) -> set:
     return {t for t in tokens if len(t) >= 2}
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def find_sheets(query: str, max_results: int = 5, include_ids: bool = True) -> str:
     """
@@ -1782,9 +4454,9 @@ def find_sheets(query: str, max_results: int = 5, include_ids: bool = True) -> s
 
     try:
         client = get_smartsheet_client()
-        response = client.Sheets.list_sheets(include_all=True)
+        all_sheets = _sheet_index.sheets(client)
 
-        if not response.data:
+        if not all_sheets:
             return "No sheets available."
 
         query_lower = query.lower().strip()
@@ -1792,7 +4464,7 @@ def find_sheets(query: str, max_results: int = 5, include_ids: bool = True) -> s
 
         # Score each sheet
         matches = []
-        for sheet in response.data:
+        for sheet in all_sheets:
             # Skip sheets not in allowed list (if configured)
             if not _is_sheet_allowed(sheet.id, sheet.name):
                 continue
@@ -1893,7 +4565,7 @@ def find_sheets(query: str, max_results: int = 5, include_ids: bool = True) -> s
 # =============================================================================
 
 
-@tool(cache_results=True)
+@tool
 @cached_tool
 def find_columns(sheet_id: str, query: str, max_results: int = 5) -> str:
     """
@@ -1927,25 +4599,23 @@ def find_columns(sheet_id: str, query: str, max_results: int = 5) -> str:
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return (
-                f"Error: Sheet '{sheet_id}' not found. Use find_sheets() to search for the sheet."
-            )
+            return _sheet_not_found(sheet_id, "Use find_sheets() to search for the sheet.")
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
 
-        sheet = client.Sheets.get_sheet(resolved_id)
+        data = _get_sheet_data(client, resolved_id)
 
-        if not sheet.columns:
-            return f"Sheet '{sheet.name}' has no columns."
+        if not data["columns"]:
+            return f"Sheet '{data['name']}' has no columns."
 
         query_lower = query.lower().strip()
         query_tokens = _tokenize(query)
 
         # Score each column
         matches = []
-        for col in sheet.columns:
-            col_name = col.title
+        for col in data["columns"]:
+            col_name = col["title"]
             col_name_lower = col_name.lower()
             col_tokens = _tokenize(col_name)
 
@@ -1999,11 +4669,11 @@ def find_columns(sheet_id: str, query: str, max_results: int = 5) -> str:
                 matches.append(
                     {
                         "name": col_name,
-                        "id": col.id,
-                        "type": col.type,
+                        "id": col["id"],
+                        "type": col["type"],
                         "score": overall_score,
                         "match_type": match_type,
-                        "options": getattr(col, "options", None),
+                        "options": col["options"],
                     }
                 )
 
@@ -2012,13 +4682,13 @@ def find_columns(sheet_id: str, query: str, max_results: int = 5) -> str:
         matches = matches[:max_results]
 
         if not matches:
-            all_columns = ", ".join([c.title for c in sheet.columns])
-            text_output = f"No columns found matching '{query}' in '{sheet.name}'.\n\n"
+            all_columns = ", ".join([c["title"] for c in data["columns"]])
+            text_output = f"No columns found matching '{query}' in '{data['name']}'.\n\n"
             text_output += f"Available columns: {all_columns}\n"
             return text_output
 
         # Format output
-        text_output = f"Found {len(matches)} column(s) matching '{query}' in '{sheet.name}':\n\n"
+        text_output = f"Found {len(matches)} column(s) matching '{query}' in '{data['name']}':\n\n"
 
         for i, match in enumerate(matches, 1):
             confidence = (
@@ -2046,34 +4716,9 @@ def find_columns(sheet_id: str, query: str, max_results: int = 5) -> str:
 # SMART QUERY PLANNING (1) - Efficient multi-operation analysis on a single sheet
 # =============================================================================
 
-# In-memory sheet data cache for smart query planning
-_sheet_data_cache: dict[int, tuple[Any, float]] = {}
-_sheet_data_cache_ttl = 120  # 2 minutes for loaded sheet data
-
-
-def _get_cached_sheet_data(client, sheet_id: int) -> Any:
-    """Get sheet data from cache or fetch it."""
-    global _sheet_data_cache
-
-    now = time.time()
-    if sheet_id in _sheet_data_cache:
-        data, timestamp = _sheet_data_cache[sheet_id]
-        if now - timestamp < _sheet_data_cache_ttl:
-            return data
-
-    # Fetch fresh data
-    sheet = client.Sheets.get_sheet(sheet_id, page_size=5000)
-    _sheet_data_cache[sheet_id] = (sheet, now)
-
-    # Clean old entries
-    for sid in list(_sheet_data_cache.keys()):
-        if now - _sheet_data_cache[sid][1] > _sheet_data_cache_ttl:
-            del _sheet_data_cache[sid]
-
-    return sheet
-
 
-@tool(cache_results=True)
+@tool
+@cached_tool
 def analyze_sheet(
     sheet_id: str,
     operations: str = "summary",
@@ -2085,8 +4730,8 @@ def analyze_sheet(
 ) -> str:
     """
     Perform multiple analysis operations on a sheet in a single efficient call.
-    This tool fetches the sheet data ONCE and performs all requested operations locally,
-    avoiding multiple API calls.
+    This tool reads the sheet data ONCE (from the shared sheet store) and performs all
+    requested operations locally, avoiding multiple API calls.
 
     Use this instead of calling get_sheet + filter_rows + count_rows_by_column separately.
 
@@ -2121,24 +4766,23 @@ def analyze_sheet(
         resolved_id, sheet_name_resolved = _resolve_sheet_id(client, sheet_id)
 
         if not resolved_id:
-            return (
-                f"Error: Sheet '{sheet_id}' not found. Use find_sheets() to search for the sheet."
-            )
+            return _sheet_not_found(sheet_id, "Use find_sheets() to search for the sheet.")
 
         if not _is_sheet_allowed(resolved_id, sheet_name_resolved):
             return "Error: Access to sheet is not permitted."
 
-        # Fetch sheet data (cached for 2 minutes)
-        sheet = _get_cached_sheet_data(client, resolved_id)
+        # Fetch sheet data (shared with the other row-level tools)
+        data = _get_sheet_data(client, resolved_id)
+        columns = data["columns"]
+        rows = data["rows"]
 
         # Parse requested operations
         ops = [op.strip().lower() for op in operations.split(",")]
         if "all" in ops:
             ops = ["summary", "columns", "stats"]
 
-        # Build column mappings
-        columns = {col.id: col for col in sheet.columns}
-        col_by_name = {col.title.lower(): col for col in sheet.columns}
+        # Build column mappings (title -> index)
+        col_by_name = {col["title"].lower(): i for i, col in enumerate(columns)}
 
         # Resolve fuzzy column names if provided
         def resolve_column(name):
@@ -2149,25 +4793,25 @@ def analyze_sheet(
             if name_lower in col_by_name:
                 return col_by_name[name_lower]
             # Partial match
-            for col_name, col in col_by_name.items():
+            for col_name, i in col_by_name.items():
                 if name_lower in col_name or col_name in name_lower:
-                    return col
+                    return i
             return None
 
         # Build output
-        text_output = f"📊 Analysis: {sheet.name}\n"
+        text_output = f"📊 Analysis: {data['name']}\n"
         text_output += "=" * 60 + "\n\n"
 
         # ── SUMMARY ──
         if "summary" in ops:
             text_output += "## Summary\n"
-            text_output += f"- Total Rows: {len(sheet.rows)}\n"
-            text_output += f"- Total Columns: {len(sheet.columns)}\n"
+            text_output += f"- Total Rows: {len(rows)}\n"
+            text_output += f"- Total Columns: {len(columns)}\n"
 
             # Column type breakdown
             type_counts = {}
-            for col in sheet.columns:
-                type_counts[col.type] = type_counts.get(col.type, 0) + 1
+            for col in columns:
+                type_counts[col["type"]] = type_counts.get(col["type"], 0) + 1
             text_output += (
                 f"- Column Types: {', '.join(f'{t}({c})' for t, c in type_counts.items())}\n"
             )
@@ -2176,12 +4820,12 @@ def analyze_sheet(
         # ── COLUMNS ──
         if "columns" in ops:
             text_output += "## Columns\n"
-            for i, col in enumerate(sheet.columns, 1):
-                text_output += f"{i}. {col.title} ({col.type})"
-                if hasattr(col, "options") and col.options:
-                    text_output += f" - Options: {', '.join(col.options[:3])}"
-                    if len(col.options) > 3:
-                        text_output += f" +{len(col.options) - 3} more"
+            for i, col in enumerate(columns, 1):
+                text_output += f"{i}. {col['title']} ({col['type']})"
+                if col["options"]:
+                    text_output += f" - Options: {', '.join(col['options'][:3])}"
+                    if len(col["options"]) > 3:
+                        text_output += f" +{len(col['options']) - 3} more"
                 text_output += "\n"
             text_output += "\n"
 
@@ -2190,17 +4834,16 @@ def analyze_sheet(
             text_output += "## Column Statistics\n"
 
             # Calculate fill rates
-            col_fill_rates = {col.id: 0 for col in sheet.columns}
-            for row in sheet.rows:
-                for cell in row.cells:
-                    if cell.value is not None and str(cell.value).strip():
-                        col_fill_rates[cell.column_id] = col_fill_rates.get(cell.column_id, 0) + 1
-
-            for col in sheet.columns:
-                fill_count = col_fill_rates.get(col.id, 0)
-                fill_pct = (fill_count / len(sheet.rows) * 100) if sheet.rows else 0
+            col_fill_counts = [0] * len(columns)
+            for _, _, values in rows:
+                for i, value in enumerate(values):
+                    if value is not None and str(value).strip():
+                        col_fill_counts[i] += 1
+
+            for col, fill_count in zip(columns, col_fill_counts, strict=True):
+                fill_pct = (fill_count / len(rows) * 100) if rows else 0
                 bar = "█" * int(fill_pct / 10)
-                text_output += f"- {col.title}: {fill_pct:.0f}% filled {bar}\n"
+                text_output += f"- {col['title']}: {fill_pct:.0f}% filled {bar}\n"
             text_output += "\n"
 
         # ── FILTER ──
@@ -2208,38 +4851,25 @@ def analyze_sheet(
             if not filter_column or not filter_value:
                 text_output += "## Filter\n⚠️ Skipped: filter_column and filter_value required\n\n"
             else:
-                filter_col = resolve_column(filter_column)
-                if not filter_col:
+                filter_index = resolve_column(filter_column)
+                if filter_index is None:
                     text_output += f"## Filter\n⚠️ Column '{filter_column}' not found. "
-                    text_output += f"Available: {', '.join([c.title for c in sheet.columns])}\n\n"
+                    text_output += f"Available: {', '.join([c['title'] for c in columns])}\n\n"
                 else:
-                    text_output += f"## Filter: {filter_col.title} {filter_type} '{filter_value}'\n"
+                    filter_title = columns[filter_index]["title"]
+                    text_output += f"## Filter: {filter_title} {filter_type} '{filter_value}'\n"
 
                     filter_value_lower = str(filter_value).lower()
                     matching_rows = []
 
-                    for row in sheet.rows:
-                        for cell in row.cells:
-                            if cell.column_id == filter_col.id:
-                                cell_value = str(cell.display_value or cell.value or "").lower()
-
-                                match = False
-                                if filter_type == "equals":
-                                    match = cell_value == filter_value_lower
-                                elif filter_type == "starts_with":
-                                    match = cell_value.startswith(filter_value_lower)
-                                elif filter_type == "ends_with":
-                                    match = cell_value.endswith(filter_value_lower)
-                                else:  # contains
-                                    match = filter_value_lower in cell_value
-
-                                if match:
-                                    row_data = {"row_num": row.row_number}
-                                    for c in row.cells:
-                                        col_name = columns[c.column_id].title
-                                        row_data[col_name] = c.display_value or c.value
-                                    matching_rows.append(row_data)
-                                break
+                    for _, row_number, values in rows:
+                        cell_value = str(values[filter_index] or "").lower()
+                        if _value_matches(cell_value, filter_value_lower, filter_type):
+                            row_data = {"row_num": row_number}
+                            row_data.update(
+                                (col["title"], v) for col, v in zip(columns, values, strict=True)
+                            )
+                            matching_rows.append(row_data)
 
                     text_output += f"Found {len(matching_rows)} matching rows\n"
 
@@ -2259,22 +4889,19 @@ def analyze_sheet(
             if not group_by:
                 text_output += "## Count by Column\n⚠️ Skipped: group_by parameter required\n\n"
             else:
-                group_col = resolve_column(group_by)
-                if not group_col:
+                group_index = resolve_column(group_by)
+                if group_index is None:
                     text_output += f"## Count\n⚠️ Column '{group_by}' not found. "
-                    text_output += f"Available: {', '.join([c.title for c in sheet.columns])}\n\n"
+                    text_output += f"Available: {', '.join([c['title'] for c in columns])}\n\n"
                 else:
-                    text_output += f"## Count by: {group_col.title}\n"
+                    text_output += f"## Count by: {columns[group_index]['title']}\n"
 
                     counts = {}
-                    for row in sheet.rows:
-                        for cell in row.cells:
-                            if cell.column_id == group_col.id:
-                                value = str(cell.display_value or cell.value or "(empty)")
-                                counts[value] = counts.get(value, 0) + 1
-                                break
-
-                    total = len(sheet.rows)
+                    for _, _, values in rows:
+                        value = str(values[group_index] or "(empty)")
+                        counts[value] = counts.get(value, 0) + 1
+
+                    total = len(rows)
                     for value, count in sorted(counts.items(), key=lambda x: -x[1]):
                         pct = (count / total * 100) if total else 0
                         bar = "█" * int(pct / 5)
@@ -2285,14 +4912,13 @@ def analyze_sheet(
         if "sample" in ops:
             text_output += "## Sample Data (First 5 Rows)\n"
 
-            for row in sheet.rows[:5]:
-                row_data = []
-                for cell in row.cells:
-                    col_name = columns[cell.column_id].title
-                    value = cell.display_value or cell.value
-                    if value is not None:
-                        row_data.append(f"{col_name}: {value}")
-                text_output += f"Row {row.row_number}: {' | '.join(row_data[:4])}\n"
+            for _, row_number, values in rows[:5]:
+                row_data = [
+                    f"{col['title']}: {value}"
+                    for col, value in zip(columns, values, strict=True)
+                    if value is not None
+                ]
+                text_output += f"Row {row_number}: {' | '.join(row_data[:4])}\n"
             text_output += "\n"
 
         return text_output
@@ -2301,15 +4927,177 @@ def analyze_sheet(
         return f"Error analyzing sheet: {str(e)}"
 
 
+# =============================================================================
+# ASYNC TOOL VARIANTS - tool calls whose API reads run on the event loop
+# =============================================================================
+
+
+async def _prefetch_sheet_data(client, kwargs: dict) -> None:
+    """Load the sheets a call refers to into the shared store."""
+    sheet_ids = []
+    for name in sorted(SHEET_ARG_NAMES & kwargs.keys()):
+        if kwargs[name] is None:
+            continue
+        sheet_id, sheet_name = await _resolve_sheet_id_async(client, kwargs[name])
+        if not sheet_id or not _is_sheet_allowed(sheet_id, sheet_name):
+            return  # the tool reports it
+        sheet_ids.append(sheet_id)
+    await asyncio.gather(*(_get_sheet_data_async(client, sheet_id) for sheet_id in sheet_ids))
+
+
+async def _prefetch_sheet_index(client, kwargs: dict) -> None:
+    """Refresh the sheet index if it is stale."""
+    if kwargs.get("use_cache") is False:
+        return  # the tool refreshes the listing itself
+    await _sheet_index.sheets_async(client)
+
+
+async def _search_async(client, query: str, sheet_id: str = None, max_results: int = 20) -> str:
+    """Async counterpart of search()."""
+    if not query:
+        return "Error: query parameter is required"
+
+    try:
+        if sheet_id:
+            resolved_id, _ = await _resolve_sheet_id_async(client, sheet_id)
+            if not resolved_id:
+                return _sheet_not_found(sheet_id)
+            results = await client.search_sheet(resolved_id, query)
+        else:
+            results = await client.search(query)
+
+        return _format_search_results(query, results, max_results, in_sheet=bool(sheet_id))
+    except Exception as e:
+        return f"Error searching: {str(e)}"
+
+
+async def _report_async(client, report_id: str = None, max_rows: int = 100) -> str:
+    """Async counterpart of report()."""
+    try:
+        if report_id:
+            r = await client.get_report(int(report_id), page_size=min(max_rows, 5000))
+            return _format_report(r, max_rows)
+        return _format_report_list(await client.list_reports())
+    except Exception as e:
+        return f"Error with report: {str(e)}"
+
+
+# Tools whose only API reads are the shared sheet store or the sheet index: those are
+# loaded on the event loop, then the tool itself runs against the warm store
+_ASYNC_PREFETCH = {
+    "get_sheet": _prefetch_sheet_data,
+    "find_columns": _prefetch_sheet_data,
+    "compare_sheets": _prefetch_sheet_data,
+    "analyze_sheet": _prefetch_sheet_data,
+    "list_sheets": _prefetch_sheet_index,
+    "find_sheets": _prefetch_sheet_index,
+}
+
+# Tools reimplemented over AsyncSmartsheetClient
+_ASYNC_NATIVE = {
+    "search": _search_async,
+    "report": _report_async,
+}
+
+
+async def _run_native_async(func, native, client, kwargs: dict) -> Any:
+    """
+    Run a native async variant with the same caching as @cached_tool: size limits,
+    version validation, stale-while-revalidate and coalesced misses, with background
+    refreshes and coalescing on the loop's client instead of _executor. L2 reads and
+    stores run on threads so they do not block the loop.
+    """
+    name = func.__name__
+    if not get_cache_policy(name).cacheable:
+        return await native(client, **kwargs)
+
+    # Resolve sheet names first so the key uses the sheet ID, as the tool's own call would
+    for arg in SHEET_ARG_NAMES & kwargs.keys():
+        if kwargs[arg] is not None:
+            await _resolve_sheet_id_async(client, kwargs[arg])
+    key_kwargs, refresh, tags = _tool_cache_args(inspect.signature(func), (), kwargs)
+    key = _cache._generate_key(name, (), key_kwargs)
+    max_stale = _swr_max_stale(name)
+
+    async def load(event: str = "misses") -> Any:
+        start = time.perf_counter()
+        try:
+            result = await native(client, **kwargs)
+        finally:
+            _cache.metrics.record_fetch(name, time.perf_counter() - start, event)
+        await asyncio.to_thread(
+            _store_tool_result, name, key_kwargs, result, stale_retention=max_stale, tags=tags
+        )
+        return result
+
+    if refresh:
+        return await load()
+
+    status, value, versions, stale_for = await _cache_lookup_async(name, (), key_kwargs)
+    if status == "fresh":
+        return value
+    if status == "validate":
+        if await _versions_current_async(client, versions):
+            await asyncio.to_thread(
+                _revalidated,
+                name,
+                (),
+                key_kwargs,
+                value,
+                versions,
+                stale_retention=max_stale,
+                tags=tags,
+            )
+            return value
+        status = "stale"
+    if max_stale and status == "stale" and stale_for <= max_stale:
+        client.start(key, partial(load, event="refreshes"))
+        _cache.metrics.record(name, "stale_hits")
+        return _with_refresh_notice(value, stale_for)
+
+    result, shared = await client.single_flight(key, load)
+    if shared:
+        _cache.metrics.record(name, "coalesced")
+    return result
+
+
+async def run_tool_async(tool, **kwargs) -> Any:
+    """
+    Run a tool (Agno Function or plain function) from an event loop.
+
+    Tools in _ASYNC_NATIVE make their API requests on the loop's AsyncSmartsheetClient,
+    so any number of calls can be in flight without threads. For tools in
+    _ASYNC_PREFETCH the sheets or listing they read are loaded on the loop first, and
+    the tool then runs on _executor against the warm store, so its cache checks and
+    formatting do not block the loop. Other tools run on _executor via run_async().
+    Results and cache entries match the blocking tools.
+    """
+    func = getattr(tool, "entrypoint", tool)
+    native = _ASYNC_NATIVE.get(func.__name__)
+    prefetch = _ASYNC_PREFETCH.get(func.__name__)
+    if native is None and prefetch is None:
+        return await run_async(func, **kwargs)
+
+    try:
+        client = get_async_client()
+        if native is not None:
+            return await _run_native_async(func, native, client, kwargs)
+        await prefetch(client, kwargs)
+    except Exception:
+        pass  # e.g. no token or bad arguments: the tool reports them as usual
+    return await run_async(func, **kwargs)
+
+
 # =============================================================================
 # EXPORT TOOLS LIST
 # =============================================================================
 
 SMARTSHEET_TOOLS = [
-    # Core tools (5)
+    # Core tools (6)
     list_sheets,
     get_sheet,
     get_row,
+    get_rows,
     filter_rows,
     count_rows_by_column,
     # Fuzzy search tools (2) - for finding sheets/columns by partial names
@@ -2350,8 +5138,8 @@ SMARTSHEET_TOOLS = [
     get_image_urls,
 ]
 
-# Async versions for all tools
-SMARTSHEET_TOOLS_ASYNC = {tool.name: lambda t=tool: run_async(t) for tool in SMARTSHEET_TOOLS}
+# Async versions for all tools, e.g. await SMARTSHEET_TOOLS_ASYNC["get_sheet"](sheet_id="123")
+SMARTSHEET_TOOLS_ASYNC = {tool.name: partial(run_tool_async, tool) for tool in SMARTSHEET_TOOLS}
 
 
 if __name__ == "__main__":
@@ -2359,8 +5147,7 @@ if __name__ == "__main__":
     print("=" * 60)
     print(f"\nTotal tools: {len(SMARTSHEET_TOOLS)}")
     print("\nOptimizations:")
-    print("  ✓ Agno @tool decorator with cache_results")
     print("  ✓ Multi-level caching (L1 memory + L2 disk)")
-    print("  ✓ Async tool execution support")
+    print("  ✓ Asyncio-native tool variants (httpx)")
     print("  ✓ Pagination optimization")
     print(f"\nCache stats: {get_cache_stats()}")
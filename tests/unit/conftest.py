@@ -0,0 +1,124 @@
+"""
+Fixtures for the offline unit tests: no API keys, no network, and a throwaway cache.
+"""
+
+import os
+import tempfile
+import threading
+import types
+
+import pytest
+from smartsheet.models import Sheet
+
+# smartsheet_tools reads its settings at import time: import it with test settings only,
+# then restore the environment for any other tests in the session
+_environ = dict(os.environ)
+for _name in list(os.environ):
+    if _name.startswith(("SMARTSHEET_", "ALLOWED_SHEET_")):
+        del os.environ[_name]
+os.environ.update(
+    SMARTSHEET_CACHE_DIR=tempfile.mkdtemp(prefix="smartsheet-tests-"),
+    SMARTSHEET_RATE_LIMIT_RPM="0",
+)
+import smartsheet_tools as st  # noqa: I001
+
+os.environ.clear()
+os.environ.update(_environ)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_environment():
+    """Unit tests need no API keys (overrides the check in tests/conftest.py)."""
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Run every test against empty caches and the default cache policies."""
+    policies = dict(st._cache_policies)
+    st.clear_cache()
+    yield
+    st._cache_policies.clear()
+    st._cache_policies.update(policies)
+    st.clear_cache()
+
+
+def _make_sheet(sheet_id: int, rows: int = 5, version: int = 1, name: str = "Job Log") -> dict:
+    """Build a sheet shaped like a GET /sheets/{id} response (three text columns)."""
+    return {
+        "id": sheet_id,
+        "name": name,
+        "version": version,
+        "totalRowCount": rows,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "modifiedAt": "2024-01-02T00:00:00Z",
+        "columns": [
+            {"id": 100 + c, "index": c, "title": f"Column {c}", "type": "TEXT_NUMBER"}
+            for c in range(3)
+        ],
+        "rows": [
+            {
+                "id": 1000 + r,
+                "rowNumber": r + 1,
+                "modifiedAt": "2024-01-01T00:00:00Z",
+                "cells": [{"columnId": 100 + c, "value": f"r{r}c{c}"} for c in range(3)],
+            }
+            for r in range(rows)
+        ],
+    }
+
+
+@pytest.fixture
+def make_sheet():
+    """Factory for sheet dicts shaped like a GET /sheets/{id} response."""
+    return _make_sheet
+
+
+class FakeSheets:
+    """The parts of the SDK's Sheets API the shared sheet store uses, over sheet dicts."""
+
+    def __init__(self, sheets: dict):
+        self.sheets = sheets
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _log(self, *call):
+        with self._lock:
+            self.calls.append(call)
+
+    def get_sheet(self, sheet_id, page_size=None, page=None, **params):
+        self._log("get_sheet", int(sheet_id), params)
+        sheet = dict(self.sheets[int(sheet_id)])
+        rows = sheet["rows"]
+        if params.get("rows_modified_since"):
+            rows = [row for row in rows if row["modifiedAt"] >= params["rows_modified_since"]]
+        if params.get("column_ids"):
+            ids = set(params["column_ids"])
+            sheet["columns"] = [col for col in sheet["columns"] if col["id"] in ids]
+            rows = [
+                {**row, "cells": [cell for cell in row["cells"] if cell["columnId"] in ids]}
+                for row in rows
+            ]
+        if page_size:
+            page = page or 1
+            rows = rows[(page - 1) * page_size : page * page_size]
+        return Sheet({**sheet, "rows": rows})
+
+    def get_sheet_version(self, sheet_id):
+        self._log("get_sheet_version", int(sheet_id))
+        return types.SimpleNamespace(version=self.sheets[int(sheet_id)]["version"])
+
+    def list_sheets(self, include_all=True, **params):
+        self._log("list_sheets")
+        return types.SimpleNamespace(
+            data=[
+                Sheet({"id": sheet["id"], "name": sheet["name"]}) for sheet in self.sheets.values()
+            ]
+        )
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """An SDK client double serving the sheets in fake_client.Sheets.sheets."""
+    client = types.SimpleNamespace(Sheets=FakeSheets({}))
+    monkeypatch.setattr(st, "get_smartsheet_client", lambda: client)
+    return client
@@ -0,0 +1,81 @@
+"""Tests for canonical tool cache keys."""
+
+import inspect
+
+import pytest
+from smartsheet.models import Sheet
+
+import smartsheet_tools as st
+
+calls = []
+
+
+@st.cached_tool
+def key_probe(sheet_id: str, limit: int = 10, use_cache: bool = True) -> str:
+    calls.append((sheet_id, limit))
+    return f"{sheet_id}:{limit}"
+
+
+@pytest.fixture(autouse=True)
+def known_sheets():
+    calls.clear()
+    st._sheet_index.load([Sheet({"id": 42, "name": "Job Log"})])
+
+
+def cache_args(*args, **kwargs):
+    return st._tool_cache_args(inspect.signature(key_probe.__wrapped__), args, kwargs)
+
+
+def test_sheet_refs_resolve_through_the_index_only(fake_client):
+    assert st._canonical_sheet_ref("42") == 42
+    assert st._canonical_sheet_ref(" job LOG ") == 42
+    assert st._canonical_sheet_ref("Unknown Sheet") == "unknown sheet"
+    assert fake_client.Sheets.calls == []
+
+
+def test_positional_keyword_and_default_arguments_match():
+    expected = cache_args(sheet_id="42", limit=10)
+    assert cache_args("42") == expected
+    assert cache_args("Job Log", 10) == expected
+    assert cache_args(sheet_id="job log") == expected
+
+
+def test_use_cache_is_not_part_of_the_key():
+    key_kwargs, refresh, tags = cache_args("42", use_cache=False)
+    assert key_kwargs == {"sheet_id": 42, "limit": 10}
+    assert refresh
+    assert tags == {"sheet:42"}
+
+
+def test_names_and_ids_share_one_entry():
+    assert key_probe("Job Log") == "Job Log:10"
+    assert key_probe(sheet_id="job log") == "Job Log:10"
+    assert key_probe("42", limit=10) == "Job Log:10"
+    assert calls == [("Job Log", 10)]
+
+
+def test_different_arguments_get_different_entries():
+    key_probe("42")
+    key_probe("42", limit=5)
+    key_probe("43")
+    assert len(calls) == 3
+
+
+def test_use_cache_false_replaces_the_entry():
+    key_probe("42")
+    key_probe("42", use_cache=False)
+    key_probe("42")
+    assert len(calls) == 2
+
+
+def test_keys_are_fixed_length_digests():
+    key = st._cache._generate_key("key_probe", (), {"sheet_id": 42, "limit": 10})
+    assert len(key) == 32
+    assert key == st._cache._generate_key("key_probe", (), {"limit": 10, "sheet_id": 42})
+
+
+def test_invalidating_a_sheet_by_name_drops_entries_keyed_by_id():
+    key_probe("42")
+    assert st.invalidate_cache(sheet_id="Job Log") == 1
+    key_probe("42")
+    assert len(calls) == 2
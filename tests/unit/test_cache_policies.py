@@ -0,0 +1,108 @@
+"""Tests for per-tool cache policies and their SMARTSHEET_CACHE_POLICIES overrides."""
+
+import json
+import logging
+
+import pytest
+
+import smartsheet_tools as st
+
+calls = []
+
+
+@st.cached_tool
+def policy_probe(size: int = 10) -> str:
+    calls.append(size)
+    return "x" * size
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_inline_json_overrides(monkeypatch):
+    monkeypatch.setenv(
+        "SMARTSHEET_CACHE_POLICIES",
+        '{"get_events": {"l1_ttl": 10, "use_l2": false}, "search": {"max_entry_bytes": null}}',
+    )
+    assert st._load_policy_overrides() == {
+        "get_events": {"l1_ttl": 10, "use_l2": False},
+        "search": {"max_entry_bytes": None},
+    }
+
+
+def test_overrides_from_a_file(monkeypatch, tmp_path):
+    path = tmp_path / "policies.json"
+    path.write_text(json.dumps({"get_contacts": {"l2_ttl": 7200}}))
+    monkeypatch.setenv("SMARTSHEET_CACHE_POLICIES", str(path))
+    assert st._load_policy_overrides() == {"get_contacts": {"l2_ttl": 7200}}
+
+
+@pytest.mark.parametrize("raw", ["{not json", "[1, 2]", "/no/such/policies.json"])
+def test_unreadable_documents_are_logged_and_ignored(monkeypatch, caplog, raw):
+    monkeypatch.setenv("SMARTSHEET_CACHE_POLICIES", raw)
+    with caplog.at_level(logging.ERROR, logger=st.__name__):
+        assert st._load_policy_overrides() == {}
+    assert "SMARTSHEET_CACHE_POLICIES" in caplog.text
+
+
+def test_invalid_entries_are_skipped(monkeypatch, caplog):
+    monkeypatch.setenv(
+        "SMARTSHEET_CACHE_POLICIES",
+        json.dumps(
+            {
+                "good": {"l1_ttl": 5},
+                "unknown_field": {"l1_tll": 5},
+                "bool_ttl": {"l1_ttl": True},
+                "string_ttl": {"l2_ttl": "60"},
+                "not_an_object": 5,
+            }
+        ),
+    )
+    with caplog.at_level(logging.ERROR, logger=st.__name__):
+        assert st._load_policy_overrides() == {"good": {"l1_ttl": 5}}
+    assert len(caplog.records) == 4
+
+
+def test_set_cache_policy_validates_fields():
+    with pytest.raises(ValueError, match="Unknown cache policy field"):
+        st.set_cache_policy("search", ttl=5)
+    with pytest.raises(ValueError, match="must be int"):
+        st.set_cache_policy("search", l1_ttl=False)
+    assert st.set_cache_policy("search", l1_ttl=5).l1_ttl == 5
+    assert st.get_cache_policy("search").l2_ttl == 120  # other fields are kept
+
+
+def test_unlisted_tools_get_the_defaults():
+    assert st.get_cache_policy("no_such_tool") == st.CachePolicy()
+
+
+def test_results_over_max_entry_bytes_are_not_cached():
+    st.set_cache_policy("policy_probe", max_entry_bytes=1000)
+    policy_probe(size=10)
+    policy_probe(size=10)
+    policy_probe(size=100_000)
+    policy_probe(size=100_000)
+    assert calls == [10, 100_000, 100_000]
+
+
+def test_use_l2_false_keeps_results_in_memory_only():
+    st.set_cache_policy("policy_probe", use_l2=False)
+    policy_probe()
+    st._cache._l1_cache.clear()
+    policy_probe()
+    assert calls == [10, 10]
+
+
+def test_uncacheable_tools_always_run():
+    st.set_cache_policy("policy_probe", cacheable=False)
+    policy_probe()
+    policy_probe()
+    assert calls == [10, 10]
+
+
+def test_staleness_is_only_configured_where_l2_can_serve_it():
+    for name, overrides in st._DEFAULT_CACHE_POLICIES.items():
+        if overrides.get("use_l2") is False:
+            assert not overrides.get("swr_max_stale"), name
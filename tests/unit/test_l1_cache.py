@@ -0,0 +1,59 @@
+"""Tests for the L1 tier of MultiLevelCache: an LRU bounded by entries and bytes."""
+
+import pytest
+
+import smartsheet_tools as st
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return st.MultiLevelCache(
+        max_l1_entries=3,
+        max_l1_bytes=20_000,
+        l2_backend=st.SQLiteL2Backend(db_path=tmp_path / "cache.sqlite3"),
+    )
+
+
+def put(cache, name: str, size: int = 10) -> None:
+    cache.set(name, (), {}, "x" * size, use_l2=False)
+
+
+def test_least_recently_used_entry_is_evicted_first(cache):
+    for name in ("a", "b", "c"):
+        put(cache, name)
+    assert cache.get("a", (), {}) == (True, "x" * 10)  # a is now most recent
+    put(cache, "d")
+    assert cache.get("b", (), {}) == (False, None)
+    assert all(cache.get(name, (), {})[0] for name in ("a", "c", "d"))
+    assert cache.get_stats()["l1_evictions_by_count"] == 1
+
+
+def test_byte_budget_evicts_until_the_entry_fits(cache):
+    put(cache, "a", 8_000)
+    put(cache, "b", 8_000)
+    put(cache, "c", 8_000)
+    stats = cache.get_stats()
+    assert stats["l1_entries"] == 2
+    assert stats["l1_evictions_by_size"] == 1
+    assert stats["l1_bytes"] <= cache.max_l1_bytes
+    assert not cache.get("a", (), {})[0]
+
+
+def test_values_larger_than_the_budget_are_not_held(cache):
+    put(cache, "a")
+    put(cache, "huge", 50_000)
+    assert cache.get_stats()["l1_oversize_rejections"] == 1
+    assert cache.get("a", (), {})[0]
+    assert not cache.get("huge", (), {})[0]
+
+
+def test_replacing_an_entry_keeps_the_byte_count(cache):
+    put(cache, "a", 1_000)
+    put(cache, "a", 1_000)
+    assert cache.get_stats()["l1_bytes"] == st._estimate_size("x" * 1_000)
+
+
+def test_size_estimate_grows_with_nested_content():
+    small = {"rows": [(1, 1, ("a",) * 3)] * 10}
+    large = {"rows": [(1, 1, ("a" * 100,) * 3)] * 1_000}
+    assert st._estimate_size(large) > 50 * st._estimate_size(small)
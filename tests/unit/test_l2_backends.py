@@ -0,0 +1,111 @@
+"""Tests for the L2 cache backends."""
+
+import time
+
+import pytest
+
+import smartsheet_tools as st
+
+
+def record(value, ttl: float = 60, tags=()) -> dict:
+    now = time.time()
+    return {"value": value, "timestamp": now, "expires_at": now + ttl, "tags": sorted(tags)}
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    return st.SQLiteL2Backend(db_path=tmp_path / "cache.sqlite3")
+
+
+@pytest.fixture(params=["sqlite", "pickle"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        return st.SQLiteL2Backend(db_path=tmp_path / "cache.sqlite3")
+    return st.PickleL2Backend(cache_dir=tmp_path)
+
+
+def test_round_trip(backend):
+    backend.set("k", record({"rows": [1, 2, 3]}))
+    assert backend.get("k")["value"] == {"rows": [1, 2, 3]}
+    assert backend.get("missing") is None
+
+
+def test_large_values_are_compressed(backend):
+    value = "x" * 100_000
+    backend.set("k", record(value))
+    assert backend.get("k")["value"] == value
+    assert backend.codec.stats()["l2_compressed_writes"] == 1
+
+
+def test_expired_entries_are_not_returned(backend):
+    backend.set("k", record("old", ttl=-1))
+    assert backend.get("k") is None
+
+
+def test_invalidate_tags_returns_removed_keys(backend):
+    backend.set("a", record(1, tags=["sheet:1", "tool:get_sheet"]))
+    backend.set("b", record(2, tags=["sheet:2", "tool:get_sheet"]))
+    backend.set("c", record(3, tags=["tool:list_sheets"]))
+    assert backend.invalidate_tags(frozenset({"sheet:1", "tool:list_sheets"})) == {"a", "c"}
+    assert backend.get("a") is None and backend.get("c") is None
+    assert backend.get("b")["value"] == 2
+
+
+def test_touch_renews_without_rewriting(backend):
+    backend.set("k", record("value", ttl=1))
+    writes = backend.codec.stats()
+    later = time.time() + 30
+    assert backend.touch("k", later, later + 60)
+    assert backend.codec.stats() == writes
+    renewed = backend.get("k")
+    assert renewed["value"] == "value"
+    assert renewed["timestamp"] == pytest.approx(later)
+    assert not backend.touch("missing", later, later + 60)
+
+
+def test_sqlite_totals_track_inserts_updates_and_deletes(sqlite_backend):
+    sqlite_backend.set("a", record("x" * 10))
+    sqlite_backend.set("b", record("y" * 10))
+    sqlite_backend.set("a", record("z" * 500))  # an update, not a second entry
+    stats = sqlite_backend.stats()
+    assert stats["entries"] == 2
+    sizes = sqlite_backend._conn().execute("SELECT SUM(size) FROM entries").fetchone()[0]
+    assert stats["bytes"] == sizes
+    sqlite_backend.delete("a")
+    assert sqlite_backend.stats()["entries"] == 1
+
+
+def test_sqlite_purge_expired(sqlite_backend):
+    sqlite_backend._last_purge = time.time()  # no opportunistic purge on set()
+    sqlite_backend.set("old1", record(1, ttl=-1))
+    sqlite_backend.set("old2", record(2, ttl=-1))
+    sqlite_backend.set("new", record(3))
+    assert sqlite_backend.purge_expired() == 2
+    assert sqlite_backend.stats()["entries"] == 1
+
+
+def test_sqlite_set_purges_expired_entries_periodically(sqlite_backend):
+    sqlite_backend.set("old", record(1, ttl=-1))
+    sqlite_backend._last_purge = 0.0
+    sqlite_backend.set("new", record(2))
+    assert sqlite_backend.stats()["entries"] == 1
+
+
+def test_sqlite_deleting_an_entry_drops_its_tags(sqlite_backend):
+    sqlite_backend.set("a", record(1, tags=["sheet:1"]))
+    sqlite_backend.delete("a")
+    assert sqlite_backend._conn().execute("SELECT COUNT(*) FROM tags").fetchone()[0] == 0
+
+
+def test_sqlite_corrupt_payload_is_a_miss(sqlite_backend):
+    sqlite_backend.set("k", record("value"))
+    sqlite_backend._conn().execute("UPDATE entries SET payload = ? WHERE key = 'k'", (b"\x01junk",))
+    assert sqlite_backend.get("k") is None
+    assert sqlite_backend.stats()["entries"] == 0
+
+
+def test_sqlite_entries_are_shared_between_instances(tmp_path):
+    writer = st.SQLiteL2Backend(db_path=tmp_path / "cache.sqlite3")
+    reader = st.SQLiteL2Backend(db_path=tmp_path / "cache.sqlite3")
+    writer.set("k", record("shared"))
+    assert reader.get("k")["value"] == "shared"
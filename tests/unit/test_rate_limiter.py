@@ -0,0 +1,91 @@
+"""Tests for the shared token-bucket rate limiter and its Retry-After handling."""
+
+import time
+import types
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+import smartsheet_tools as st
+
+
+def response(status: int = 200, retry_after: str | None = None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return types.SimpleNamespace(status_code=status, headers=headers)
+
+
+def pause(limiter: st.RateLimiter) -> float:
+    """Seconds until the limiter hands out the next request slot."""
+    return limiter._try_acquire(time.monotonic())
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("7", 7.0), ("1.5", 1.5), ("-3", 0.0), (None, None), ("", None), ("soon", None)],
+)
+def test_retry_after_seconds(header, expected):
+    assert st._retry_after(response(429, header)) == expected
+
+
+def test_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert st._retry_after(response(429, format_datetime(when, usegmt=True))) == pytest.approx(
+        30, abs=2
+    )
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert st._retry_after(response(429, format_datetime(past, usegmt=True))) == 0.0
+
+
+def test_throttle_pauses_every_caller_for_retry_after():
+    limiter = st.RateLimiter(rpm=600, burst=5)
+    assert limiter.throttle(2.0) == 2.0
+    assert pause(limiter) == pytest.approx(2.0, abs=0.1)
+    # A shorter Retry-After from a concurrent 429 does not shorten the pause
+    limiter.throttle(0.5)
+    assert pause(limiter) == pytest.approx(2.0, abs=0.1)
+    assert limiter.get_stats()["rate_limit_throttled"] == 2
+
+
+def test_missing_retry_after_backs_off_exponentially():
+    limiter = st.RateLimiter(rpm=600, burst=5)
+    assert 2 <= limiter.throttle() < 3
+    assert 4 <= limiter.throttle() < 5
+    limiter.succeeded()
+    assert 2 <= limiter.throttle() < 3
+
+
+def test_bucket_allows_a_burst_then_refills_at_the_rate():
+    limiter = st.RateLimiter(rpm=60, burst=2)
+    assert pause(limiter) == 0
+    assert pause(limiter) == 0
+    assert pause(limiter) == pytest.approx(1.0, abs=0.05)
+
+
+def test_zero_rpm_disables_the_bucket():
+    limiter = st.RateLimiter(rpm=0, burst=1)
+    assert all(pause(limiter) == 0 for _ in range(100))
+    assert limiter.get_stats()["rate_limit_requests"] == 100
+
+
+def test_limited_session_throttles_on_429(monkeypatch):
+    limiter = st.RateLimiter(rpm=0, burst=1)
+    monkeypatch.setattr(st, "_rate_limiter", limiter)
+    replies = iter([response(429, "0.2"), response(200)])
+    session = types.SimpleNamespace(send=lambda request, **kwargs: next(replies))
+    st._rate_limit_session(session)
+
+    assert session.send("request").status_code == 429
+    start = time.monotonic()
+    assert session.send("request").status_code == 200
+    assert time.monotonic() - start >= 0.15  # held until Retry-After passed
+    assert limiter._throttle_streak == 0
+    assert limiter.get_stats()["rate_limit_throttled"] == 1
+
+
+def test_sdk_backoff_leaves_429s_to_the_limiter():
+    backoff = st.RateLimitBackoff(max_retry_time=10)
+    throttled = types.SimpleNamespace(status_code=429)
+    assert backoff.calc_backoff(1, 0, throttled) == 0
+    assert backoff.calc_backoff(1, 11, throttled) == -1
+    assert 2 <= backoff.calc_backoff(1, 0, types.SimpleNamespace(status_code=503)) < 3
@@ -0,0 +1,42 @@
+"""Tests for the negative cache of unknown sheet names (_sheet_miss)."""
+
+import smartsheet_tools as st
+
+
+def listings(client) -> int:
+    return [call[0] for call in client.Sheets.calls].count("list_sheets")
+
+
+def test_known_names_resolve_from_one_listing(fake_client, make_sheet):
+    fake_client.Sheets.sheets[1] = make_sheet(1, name="Job Log")
+    assert st._resolve_sheet_id(fake_client, "Job Log") == (1, "Job Log")
+    assert st._resolve_sheet_id(fake_client, "JOB LOG") == (1, "Job Log")
+    assert listings(fake_client) == 1
+
+
+def test_unknown_names_are_remembered(fake_client, make_sheet):
+    fake_client.Sheets.sheets[1] = make_sheet(1, name="Job Log")
+    assert st._resolve_sheet_id(fake_client, "Job Logs") == (None, None)
+    assert st._resolve_sheet_id(fake_client, "job logs") == (None, None)
+    assert st._resolve_sheet_id(fake_client, " JOB LOGS ") == (None, None)
+    assert listings(fake_client) == 1
+    assert st._cache.peek("_sheet_miss", ("job logs",), {}) == ["Job Log"]
+
+
+def test_not_found_errors_suggest_close_names(fake_client, make_sheet):
+    fake_client.Sheets.sheets[1] = make_sheet(1, name="Job Log")
+    fake_client.Sheets.sheets[2] = make_sheet(2, name="Budget")
+    st._resolve_sheet_id(fake_client, "Job Logs")
+    message = st._sheet_not_found("Job Logs")
+    assert message.startswith("Error: Sheet 'Job Logs' not found")
+    assert "Job Log" in message
+    assert "Budget" not in message
+
+
+def test_a_stale_listing_is_refreshed_for_an_unknown_name(fake_client, make_sheet):
+    fake_client.Sheets.sheets[1] = make_sheet(1, name="Job Log")
+    st._resolve_sheet_id(fake_client, "Job Log")
+    fake_client.Sheets.sheets[2] = make_sheet(2, name="New Sheet")
+    st._sheet_index._built_at -= st._sheet_index.min_refresh  # listing is 30 s old
+    assert st._resolve_sheet_id(fake_client, "New Sheet") == (2, "New Sheet")
+    assert listings(fake_client) == 2
@@ -0,0 +1,114 @@
+"""Tests for incremental sync of the shared sheet store (_sync_sheet)."""
+
+import pytest
+from smartsheet.models import Sheet
+
+import smartsheet_tools as st
+
+EDITED_AT = "2024-01-03T00:00:00Z"
+
+
+@pytest.fixture
+def sheet(fake_client, make_sheet):
+    """A six-row sheet loaded into the shared store, validated on every read."""
+    st.set_cache_policy("_sheet_data", l1_ttl=0)
+    fake_client.Sheets.sheets[1] = make_sheet(1, rows=6)
+    st._get_sheet_data(fake_client, 1)
+    fake_client.Sheets.calls.clear()
+    return fake_client.Sheets.sheets[1]
+
+
+def change(sheet: dict, rows: list[dict], touched: bool = True) -> None:
+    """Replace a sheet's rows as the API would after an edit."""
+    for number, row in enumerate(rows, 1):
+        row["rowNumber"] = number
+    sheet.update(rows=rows, totalRowCount=len(rows), version=sheet["version"] + 1)
+    if touched:
+        sheet["modifiedAt"] = EDITED_AT
+
+
+def edited(row: dict, value: str) -> dict:
+    return {**row, "modifiedAt": EDITED_AT, "cells": [{"columnId": 100, "value": value}]}
+
+
+def sync(client) -> tuple[dict, dict]:
+    """Read the sheet through the store; returns it and the replica counters it moved."""
+    before = st._stats_snapshot(st._replica_stats)
+    data = st._get_sheet_data(client, 1)
+    after = st._stats_snapshot(st._replica_stats)
+    expected = st._compact_sheet(Sheet(client.Sheets.sheets[1]))["rows"]
+    assert data["rows"] == expected
+    return data, {name: after[name] - before[name] for name in after}
+
+
+def test_modified_rows_are_merged_from_the_delta(fake_client, sheet):
+    rows = list(sheet["rows"])
+    rows[2] = edited(rows[2], "changed")
+    change(sheet, rows)
+    data, moved = sync(fake_client)
+    assert data["rows"][2][2][0] == "changed"
+    assert moved == {"full_loads": 0, "delta_syncs": 1, "delta_rows": 1, "row_listings": 0}
+    assert [call[2] for call in fake_client.Sheets.calls if call[0] == "get_sheet"] == [
+        {"rows_modified_since": "2024-01-01T23:59:00+00:00"}
+    ]
+
+
+def test_inserted_rows_are_placed_by_a_row_listing(fake_client, sheet):
+    rows = list(sheet["rows"])
+    rows.insert(1, edited({"id": 2000}, "new"))
+    change(sheet, rows)
+    data, moved = sync(fake_client)
+    assert [row[0] for row in data["rows"][:3]] == [1000, 2000, 1001]
+    assert moved["full_loads"] == 0
+    assert moved["row_listings"] == 1
+
+
+def test_moved_rows_are_reordered(fake_client, sheet):
+    rows = list(sheet["rows"])
+    rows[0], rows[4] = edited(rows[4], "moved up"), edited(rows[0], "moved down")
+    change(sheet, rows)
+    data, moved = sync(fake_client)
+    assert [row[0] for row in data["rows"]] == [1004, 1001, 1002, 1003, 1000, 1005]
+    assert moved["full_loads"] == 0
+
+
+def test_deleted_rows_are_dropped_without_a_full_reload(fake_client, sheet):
+    rows = list(sheet["rows"])
+    del rows[3]
+    change(sheet, rows)
+    data, moved = sync(fake_client)
+    assert 1003 not in {row[0] for row in data["rows"]}
+    assert moved == {"full_loads": 0, "delta_syncs": 1, "delta_rows": 0, "row_listings": 1}
+    listing = [call[2] for call in fake_client.Sheets.calls if call[0] == "get_sheet"][1]
+    assert listing["column_ids"] == [100]
+
+
+def test_recalculated_values_force_a_full_reload(fake_client, sheet):
+    rows = list(sheet["rows"])
+    rows[1] = {**rows[1], "cells": [{"columnId": 100, "value": "formula result"}]}
+    change(sheet, rows, touched=False)
+    data, moved = sync(fake_client)
+    assert data["rows"][1][2][0] == "formula result"
+    assert moved["full_loads"] == 1
+
+
+def test_column_changes_force_a_full_reload(fake_client, sheet):
+    sheet["columns"] = [
+        *sheet["columns"],
+        {"id": 103, "index": 3, "title": "New", "type": "TEXT_NUMBER"},
+    ]
+    change(sheet, [edited(row, row["cells"][0]["value"]) for row in sheet["rows"]])
+    data, moved = sync(fake_client)
+    assert [col["title"] for col in data["columns"]][-1] == "New"
+    assert moved["full_loads"] == 1
+
+
+def test_an_unchanged_version_needs_no_sync(fake_client, sheet):
+    _, moved = sync(fake_client)
+    assert not any(moved.values())
+    assert fake_client.Sheets.calls == [("get_sheet_version", 1)]
+
+
+def test_the_sync_marker_follows_the_server_clock(fake_client, sheet):
+    data = st._get_sheet_data(fake_client, 1)
+    assert data["synced_at"] == "2024-01-01T23:59:00+00:00"
@@ -0,0 +1,132 @@
+"""Tests for SingleFlight, the coalescing of concurrent cache misses."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import smartsheet_tools as st
+
+
+@pytest.fixture
+def flight(tmp_path):
+    return st.SingleFlight(lock_dir=tmp_path / "locks", lock_timeout=5)
+
+
+def test_concurrent_callers_share_one_call(flight):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(flight.do, "key", load)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "key", load) for _ in range(4)]
+        time.sleep(0.1)  # let the followers join the in-flight call
+        release.set()
+        results = [leader.result(), *(f.result() for f in followers)]
+
+    assert len(calls) == 1
+    assert results == [("result", False)] + [("result", True)] * 4
+    stats = flight.get_stats()
+    assert stats["inflight"] == 0
+    assert stats["inflight_leaders"] == 1
+    assert stats["inflight_coalesced"] == 4
+
+
+def test_errors_reach_every_waiting_caller(flight):
+    started = threading.Event()
+    release = threading.Event()
+
+    def load():
+        started.set()
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(flight.do, "key", load)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "key", load) for _ in range(2)]
+        time.sleep(0.1)
+        release.set()
+        for future in (leader, *followers):
+            with pytest.raises(ValueError, match="upstream failed"):
+                future.result()
+
+    # A failed load is not remembered: the next call runs again
+    assert flight.do("key", lambda: "retry") == ("retry", False)
+
+
+def test_different_keys_do_not_wait_for_each_other(flight):
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "slow"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow_call = pool.submit(flight.do, "a", slow)
+        assert flight.do("b", lambda: "fast") == ("fast", False)
+        release.set()
+        assert slow_call.result() == ("slow", False)
+
+
+def test_start_runs_one_background_load_per_key(flight):
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return "refreshed"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert flight.start("key", load, pool)
+        assert not flight.start("key", load, pool)
+        release.set()
+    assert calls == [1]
+
+
+def test_start_on_a_shut_down_executor_releases_the_key(flight):
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.shutdown()
+    assert not flight.start("key", lambda: None, pool)
+    assert flight.get_stats()["inflight"] == 0
+    assert flight.do("key", lambda: "ok") == ("ok", False)
+
+
+def test_purge_lock_files_keeps_recent_files(flight):
+    flight.do("old", lambda: None)
+    flight.do("new", lambda: None)
+    old = flight.lock_dir / "old.lock"
+    stale = time.time() - 2 * flight.LOCK_FILE_MAX_AGE
+    os.utime(old, (stale, stale))
+    assert flight.purge_lock_files() == 1
+    assert not old.exists()
+    assert (flight.lock_dir / "new.lock").exists()
+
+
+def test_sheet_store_misses_share_one_download(fake_client, make_sheet):
+    fake_client.Sheets.sheets[1] = make_sheet(1)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: st._get_sheet_data(fake_client, 1), range(4)))
+    assert all(data == results[0] for data in results)
+    assert [call[0] for call in fake_client.Sheets.calls].count("get_sheet") == 1
+
+
+def test_sheet_store_refetch_checks_the_version_once(fake_client, make_sheet):
+    st.set_cache_policy("_sheet_data", l1_ttl=0)
+    fake_client.Sheets.sheets[1] = make_sheet(1)
+    st._get_sheet_data(fake_client, 1)
+    fake_client.Sheets.sheets[1] = make_sheet(1, version=2)
+    fake_client.Sheets.calls.clear()
+    st._get_sheet_data(fake_client, 1)
+    assert [call[0] for call in fake_client.Sheets.calls].count("get_sheet_version") == 1
@@ -0,0 +1,101 @@
+"""Tests for the streaming sheet parser and the streamed sheet fetch."""
+
+import json
+import random
+import types
+
+import pytest
+import requests
+from smartsheet.exceptions import UnexpectedRequestError
+from smartsheet.models import Sheet
+
+import smartsheet_tools as st
+
+
+@pytest.fixture
+def sheet(make_sheet):
+    sheet = make_sheet(7, rows=40)
+    sheet["rows"][3]["cells"][1] = {"columnId": 101, "value": 12.5, "displayValue": "12.50"}
+    sheet["rows"][4]["cells"][2] = {"columnId": 102, "value": "Zürich — 東京 ✓"}
+    sheet["rows"][5]["cells"] = [{"columnId": 999, "value": "unknown column"}]
+    sheet["rows"][6]["cells"][0] = {"columnId": 100, "value": 1234567890123}
+    sheet["name"] = 'Job "Log" {1} ]'
+    sheet["userSettings"] = {"criticalPathEnabled": False, "displaySummaryTasks": True}
+    return sheet
+
+
+def parse(body: bytes, sizes) -> dict:
+    parser = st.SheetStreamParser()
+    pos = 0
+    for size in sizes:
+        parser.feed(body[pos : pos + size])
+        pos += size
+    parser.feed(body[pos:])
+    return parser.close()
+
+
+def test_matches_the_sdk_parse(sheet):
+    body = json.dumps(sheet).encode()
+    assert parse(body, []) == st._compact_sheet(Sheet(sheet))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_any_chunk_boundaries_give_the_same_result(sheet, seed):
+    body = json.dumps(sheet, ensure_ascii=False).encode()
+    rng = random.Random(seed)
+    sizes = [rng.randint(1, 200) for _ in range(len(body) // 50)]
+    assert parse(body, sizes) == st._compact_sheet(Sheet(sheet))
+
+
+def test_one_byte_chunks(sheet):
+    body = json.dumps(sheet, ensure_ascii=False, indent=2).encode()
+    assert parse(body, [1] * len(body)) == st._compact_sheet(Sheet(sheet))
+
+
+def test_rows_before_columns(sheet):
+    reordered = {"rows": sheet["rows"], **{k: v for k, v in sheet.items() if k != "rows"}}
+    body = json.dumps(reordered).encode()
+    assert parse(body, [64] * 100) == st._compact_sheet(Sheet(sheet))
+
+
+def test_sheet_without_rows_or_columns():
+    data = parse(b'{"id": 1, "name": "Empty", "version": 3, "totalRowCount": 0}', [5, 5])
+    assert (data["columns"], data["rows"], data["version"]) == ([], [], 3)
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"id": 1, "rows": [{"id": 2', b'{"id": 1', b'["not", "a", "sheet"]', b'{"id" 1}']
+)
+def test_truncated_or_malformed_bodies_raise(body):
+    parser = st.SheetStreamParser()
+    with pytest.raises(ValueError):
+        parser.feed(body)
+        parser.close()
+
+
+class FailingSession:
+    def get(self, url, **kwargs):
+        raise requests.exceptions.ConnectionError("connection refused")
+
+
+def sdk_client(session) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        _session=session,
+        _api_base="https://api.example.test/2.0",
+        _access_token="token",
+        _user_agent="tests",
+        _assume_user=None,
+        _user_calc_backoff=st.RateLimitBackoff(),
+    )
+
+
+def test_transport_errors_are_raised_as_sdk_errors():
+    with pytest.raises(UnexpectedRequestError) as raised:
+        st._stream_sheet_page(sdk_client(FailingSession()), 7)
+    assert isinstance(raised.value.__cause__, requests.exceptions.ConnectionError)
+
+
+def test_clients_without_an_sdk_session_use_the_sdk_model(fake_client, sheet):
+    fake_client.Sheets.sheets[7] = sheet
+    assert st._stream_sheet_page(fake_client, 7) == st._compact_sheet(Sheet(sheet))
+    assert fake_client.Sheets.calls == [("get_sheet", 7, {})]
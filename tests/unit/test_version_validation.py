@@ -0,0 +1,72 @@
+"""Tests for version-tagged cache entries: validation, renewal and stale serving."""
+
+import pytest
+
+import smartsheet_tools as st
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return st.MultiLevelCache(l2_backend=st.SQLiteL2Backend(db_path=tmp_path / "cache.sqlite3"))
+
+
+def age(cache, seconds: float) -> None:
+    """Make every entry look stored seconds earlier, dropping L1 so L2 is consulted."""
+    cache._l1_cache.clear()
+    cache._l2._conn().execute(
+        "UPDATE entries SET created_at = created_at - ?, expires_at = expires_at - ?",
+        (seconds, seconds),
+    )
+
+
+def test_versioned_entries_need_validation_after_l1_ttl(cache):
+    cache.set("tool", (), {}, "value", versions={1: 5}, l1_ttl=10, l2_ttl=100)
+    assert cache.lookup("tool", (), {})[0] == "fresh"
+    age(cache, 20)
+    status, value, versions, stale_for = cache.lookup("tool", (), {})
+    assert (status, value, versions) == ("validate", "value", {1: 5})
+    assert stale_for == pytest.approx(10, abs=1)
+
+
+def test_unversioned_entries_are_stale_after_l2_ttl_only_with_retention(cache):
+    cache.set("kept", (), {}, "value", l1_ttl=10, l2_ttl=100, stale_retention=60)
+    cache.set("dropped", (), {}, "value", l1_ttl=10, l2_ttl=100)
+    age(cache, 120)
+    assert cache.lookup("kept", (), {})[0] == "stale"
+    assert cache.lookup("dropped", (), {})[0] is None
+
+
+def test_renew_restarts_ttls_without_rewriting_the_value(cache):
+    cache.set("tool", (), {}, "value", versions={1: 5}, l1_ttl=10, l2_ttl=100)
+    age(cache, 20)
+    writes = cache._l2.codec.stats()
+    cache.renew("tool", (), {}, "value", versions={1: 5}, l1_ttl=10, l2_ttl=100)
+    assert cache._l2.codec.stats() == writes
+    cache._l1_cache.clear()
+    assert cache.lookup("tool", (), {})[0] == "fresh"
+
+
+def test_renew_of_a_missing_entry_stores_it(cache):
+    cache.renew("tool", (), {}, "value", versions={1: 5})
+    cache._l1_cache.clear()
+    assert cache.lookup("tool", (), {})[:2] == ("fresh", "value")
+
+
+def test_unchanged_versions_are_revalidated_with_one_request(fake_client, make_sheet):
+    calls = []
+
+    @st.cached_tool
+    def version_probe(sheet_id: str) -> str:
+        calls.append(sheet_id)
+        return st._get_sheet_data(fake_client, int(sheet_id))["name"]
+
+    st.set_cache_policy("version_probe", l1_ttl=0)
+    st.set_cache_policy("_sheet_data", l1_ttl=0)
+    fake_client.Sheets.sheets[1] = make_sheet(1)
+    version_probe("1")
+    fake_client.Sheets.calls.clear()
+    assert version_probe("1") == "Job Log"
+    assert calls == ["1"]
+    assert fake_client.Sheets.calls == [("get_sheet_version", 1)]
+    stats = st.get_cache_stats()["tools"]["version_probe"]
+    assert stats["revalidated"] == 1
@@ -17,17 +17,19 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from smartsheet_tools import (
+    TOOL_WORKERS,
     get_sheet,
     list_sheets,
     navigation,
     report,
+    run_tool_async,
     search,
     sight,
     workspace,
 )
 
-# Thread pool for parallel execution
-_executor = ThreadPoolExecutor(max_workers=6)
+# Thread pool for parallel execution (the client's connection pool is sized to match)
+_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS)
 
 
 def run_parallel_tools(tool_calls: list[dict[str, Any]], timeout: int = 30) -> list[dict[str, Any]]:
@@ -72,25 +74,23 @@ async def run_parallel_tools_async(tool_calls: list[dict[str, Any]]) -> list[dic
     """
     Execute multiple tool calls in parallel (async version).
 
+    Tools with async variants (see run_tool_async) make their requests on the event
+    loop, so they are not limited by the thread pool.
+
     Args:
         tool_calls: List of dicts with 'tool' (function) and 'kwargs' (arguments)
 
     Returns:
         List of results with 'tool_name', 'result', and 'error' (if any)
     """
-    loop = asyncio.get_event_loop()
-
-    async def run_tool(tool, kwargs):
-        return await loop.run_in_executor(_executor, lambda: tool(**kwargs))
-
     tasks = []
     tool_names = []
 
     for call in tool_calls:
         tool = call["tool"]
         kwargs = call.get("kwargs", {})
-        tasks.append(run_tool(tool, kwargs))
-        tool_names.append(tool.__name__)
+        tasks.append(run_tool_async(tool, **kwargs))
+        tool_names.append(getattr(tool, "name", None) or tool.__name__)
 
     results = []
     completed = await asyncio.gather(*tasks, return_exceptions=True)